@@ -1,9 +1,19 @@
 import logging
 
 from actions.base import ActionConfig, ActionConnector
-from actions.face.interface import FaceInput
+from actions.face.interface import FaceAction, FaceInput
 from providers.avatar_provider import AvatarProvider
 
+# Avatar command for each face action
+AVATAR_FACE_COMMANDS = {
+    FaceAction.HAPPY: "Happy",
+    FaceAction.SAD: "Sad",
+    FaceAction.CURIOUS: "Curious",
+    FaceAction.CONFUSED: "Confused",
+    FaceAction.THINK: "Think",
+    FaceAction.EXCITED: "Excited",
+}
+
 
 class FaceAvatarConnector(ActionConnector[ActionConfig, FaceInput]):
     """
@@ -32,18 +42,9 @@ class FaceAvatarConnector(ActionConnector[ActionConfig, FaceInput]):
         ----------
         output_interface : FaceInput
         """
-        if output_interface.action == "happy":
-            self.avatar_provider.send_avatar_command("Happy")
-        elif output_interface.action == "sad":
-            self.avatar_provider.send_avatar_command("Sad")
-        elif output_interface.action == "curious":
-            self.avatar_provider.send_avatar_command("Curious")
-        elif output_interface.action == "confused":
-            self.avatar_provider.send_avatar_command("Confused")
-        elif output_interface.action == "think":
-            self.avatar_provider.send_avatar_command("Think")
-        elif output_interface.action == "excited":
-            self.avatar_provider.send_avatar_command("Excited")
+        command = AVATAR_FACE_COMMANDS.get(output_interface.action)
+        if command is not None:
+            self.avatar_provider.send_avatar_command(command)
         else:
             logging.warning("Failed to send avatar face command")
 
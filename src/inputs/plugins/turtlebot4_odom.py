@@ -1,8 +1,8 @@
-import asyncio
 import logging
 import time
-from queue import Empty, Queue
-from typing import List, Optional
+from collections import deque
+from queue import Queue
+from typing import Deque, Optional
 
 from pydantic import Field
 
@@ -33,6 +33,9 @@ class Turtlebot4Odom(FuserInput[Turtlebot4OdomConfig, Optional[dict]]):
     Odom input handler for reading Turtlebot4 odometry data.
     """
 
+    MSG_MOVING = "You are moving - do not generate new movement commands. "
+    MSG_STILL = "You are standing still - you can move if you want to. "
+
     def __init__(self, config: Turtlebot4OdomConfig):
         """
         Initialize the Odom input processor.
@@ -47,8 +50,8 @@ class Turtlebot4Odom(FuserInput[Turtlebot4OdomConfig, Optional[dict]]):
         # Track IO
         self.io_provider = IOProvider()
 
-        # Buffer for storing the final output
-        self.messages: List[Message] = []
+        # Only the latest message is ever read, so keep just that one
+        self.messages: Deque[Message] = deque(maxlen=1)
 
         # Buffer for storing messages
         self.message_buffer: Queue[str] = Queue()
@@ -64,20 +67,16 @@ class Turtlebot4Odom(FuserInput[Turtlebot4OdomConfig, Optional[dict]]):
         """
         Poll for new messages from the Odom Provider.
 
-        Checks the message buffer for new messages with a brief delay
-        to prevent excessive CPU usage.
+        Waits until the provider has processed a new odometry sample, so the
+        latency follows the publisher rate instead of a fixed polling delay.
+        Falls back to the last known position if no sample arrives in time.
 
         Returns
         -------
         Optional[dict]
-            The next message from the buffer if available, None otherwise
+            The latest position from the provider if available, None otherwise
         """
-        await asyncio.sleep(0.1)
-
-        try:
-            return self.odom.position
-        except Empty:
-            return None
+        return await self.odom.position_async(timeout=1.0)
 
     async def _raw_to_text(self, raw_input: Optional[dict]) -> Optional[Message]:
         """
@@ -101,15 +100,10 @@ class Turtlebot4Odom(FuserInput[Turtlebot4OdomConfig, Optional[dict]]):
         if raw_input is None:
             return None
 
-        res = ""
-        moving = raw_input["moving"]
-
-        if moving:
-            res = "You are moving - do not generate new movement commands. "
-        else:
-            res = "You are standing still - you can move if you want to. "
-
-        return Message(timestamp=time.time(), message=res)
+        return Message(
+            timestamp=time.time(),
+            message=self.MSG_MOVING if raw_input["moving"] else self.MSG_STILL,
+        )
 
     async def raw_to_text(self, raw_input: Optional[dict]):
         """
@@ -146,7 +140,7 @@ class Turtlebot4Odom(FuserInput[Turtlebot4OdomConfig, Optional[dict]]):
             or None if the buffer is empty
 
         """
-        if len(self.messages) == 0:
+        if not self.messages:
             return None
 
         latest_message = self.messages[-1]
@@ -159,6 +153,6 @@ class Turtlebot4Odom(FuserInput[Turtlebot4OdomConfig, Optional[dict]]):
         self.io_provider.add_input(
             self.descriptor_for_LLM, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
 
         return result
@@ -1,8 +1,10 @@
+import importlib.util
 import logging
 import time
 import typing as T
 from enum import Enum
 
+import httpx
 import openai
 from pydantic import BaseModel, Field
 
@@ -14,6 +16,9 @@ from providers.llm_history_manager import LLMHistoryManager
 
 R = T.TypeVar("R", bound=BaseModel)
 
+# HTTP/2 needs the optional h2 package, fall back to HTTP/1.1 keep-alive without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class NearAIModel(str, Enum):
     """Available NearAI models."""
@@ -70,14 +75,29 @@ class NearAILLM(LLM[R]):
         if not config.model:
             self._config.model = "Qwen/Qwen3-30B-A3B-Instruct-2507"
 
+        # Keep connections warm between cortex ticks so that every ask()
+        # does not pay for a fresh TCP/TLS handshake
+        self._http_client = openai.DefaultAsyncHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60,
+            ),
+        )
         self._client = openai.AsyncClient(
             base_url=config.base_url or "https://api.openmind.org/api/core/nearai",
             api_key=config.api_key,
+            http_client=self._http_client,
         )
 
         # Initialize history manager
         self.history_manager = LLMHistoryManager(self._config, self._client)
 
+        # Resolved once to a plain string, ask() runs on every cortex tick
+        model = self._config.model or "Qwen/Qwen3-30B-A3B-Instruct-2507"
+        self._model_name: str = model.value if isinstance(model, NearAIModel) else model
+
     @AvatarLLMState.trigger_thinking()
     @LLMHistoryManager.update_history()
     async def ask(
@@ -113,7 +133,7 @@ class NearAILLM(LLM[R]):
             formatted_messages.append({"role": "user", "content": prompt})
 
             response = await self._client.beta.chat.completions.parse(
-                model=self._config.model or "Qwen/Qwen3-30B-A3B-Instruct-2507",
+                model=self._model_name,
                 messages=T.cast(T.Any, formatted_messages),
                 tools=T.cast(T.Any, self.function_schemas),
                 tool_choice="auto",
@@ -127,27 +147,32 @@ class NearAILLM(LLM[R]):
             message = response.choices[0].message
             self.io_provider.llm_end_time = time.time()
 
-            if message.tool_calls:
-                logging.info(f"Received {len(message.tool_calls)} function calls")
-                logging.info(f"Function calls: {message.tool_calls}")
+            tool_calls = message.tool_calls
+            if not tool_calls:
+                return None
 
-                function_call_data = [
-                    {
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
-                        }
-                    }
-                    for tc in message.tool_calls
-                ]
+            logging.info(f"Received {len(tool_calls)} function calls")
+            logging.info(f"Function calls: {tool_calls}")
 
-                actions = convert_function_calls_to_actions(function_call_data)
+            function_call_data = [
+                {
+                    "function": {
+                        "name": tc.function.name,
+                        "arguments": tc.function.arguments,
+                    }
+                }
+                for tc in tool_calls
+            ]
 
-                result = CortexOutputModel(actions=actions)
-                logging.info(f"NearAI LLM function call output: {result}")
-                return T.cast(R, result)
+            actions = convert_function_calls_to_actions(function_call_data)
 
-            return None
+            result = CortexOutputModel(actions=actions)
+            logging.info(f"NearAI LLM function call output: {result}")
+            return T.cast(R, result)
         except Exception as e:
             logging.error(f"NearAI API error: {e}")
             return None
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self._http_client.aclose()
@@ -1,9 +1,11 @@
 import logging
 import math
 
+import numpy as np
 import zenoh
+from numpy.typing import NDArray
 
-from zenoh_msgs import open_zenoh_session, sensor_msgs
+from zenoh_msgs import sensor_msgs, shared_zenoh_session
 
 from .singleton import singleton
 
@@ -20,13 +22,15 @@ class D435Provider:
 
         Sets up the Zenoh subscriber for obstacle point cloud data and starts the provider.
         """
-        self.obstacle: list[dict[str, float]] = []
+        # one row of x, y, angle and distance per obstacle point
+        self.obstacle: NDArray = np.empty((0, 4))
         self.running: bool = False
         self.session = None
+        self.subscriber = None
 
         try:
-            self.session = open_zenoh_session()
-            self.session.declare_subscriber(
+            self.session = shared_zenoh_session()
+            self.subscriber = self.session.declare_subscriber(
                 "camera/realsense2_camera_node/depth/obstacle_point",
                 self.obstacle_callback,
             )
@@ -71,16 +75,16 @@ class D435Provider:
         try:
             points = sensor_msgs.PointCloud.deserialize(sample.payload.to_bytes())
 
-            obstacles = []
-            for pt in points.points:  # type: ignore
-                x = pt.x
-                y = pt.y
-                z = pt.z
-                angle, distance = self.calculate_angle_and_distance(x, y)
-                obstacles.append(
-                    {"x": x, "y": y, "z": z, "angle": angle, "distance": distance}
-                )
-            self.obstacle = obstacles
+            xy = np.array(
+                [(pt.x, pt.y) for pt in points.points],  # type: ignore
+                dtype=np.float64,
+            ).reshape(-1, 2)
+            x, y = xy[:, 0], xy[:, 1]
+
+            # same angle and distance as calculate_angle_and_distance
+            self.obstacle = np.column_stack(
+                (x, y, np.degrees(np.arctan2(y, x)), np.hypot(x, y))
+            )
         except Exception as e:
             logging.error(f"Error processing obstacle info: {e}")
 
@@ -104,7 +108,9 @@ class D435Provider:
 
         self.running = False
 
-        if self.session:
-            self.session.close()
+        # the session is shared with the other providers, only drop our subscriber
+        if self.subscriber:
+            self.subscriber.undeclare()
+            self.subscriber = None
 
-        logging.info("D435Provider stopped and Zenoh session closed")
+        logging.info("D435Provider stopped and Zenoh subscriber undeclared")
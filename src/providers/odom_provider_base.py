@@ -1,14 +1,188 @@
+import asyncio
 import logging
 import math
 import multiprocessing as mp
+import signal
+import struct
 import threading
 import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import zenoh
+
+from zenoh_msgs import nav_msgs, payload_buffer
+
+from .spsc_ring import SPSCRingBuffer
 
 rad_to_deg = 57.2958
 
+# stamp.sec, stamp.nanosec, orientation x/y/z/w, position x/y/z
+ODOM_SAMPLE_FORMAT = "<iI7d"
+
+# Maximum number of queued samples folded into one state update
+ODOM_BATCH_SIZE = 64
+
+# Distance (m) above which the robot is considered to be moving
+MOVING_THRESHOLD_M = 0.01
+
+# CDR readers for the nav_msgs/Odometry prefix, keyed by the encapsulation
+# byte: stamp.sec, stamp.nanosec and the header.frame_id length, a string
+# length, and pose.pose position x/y/z followed by orientation x/y/z/w
+_CDR_ODOM_STRUCTS = {
+    endian_flag: (
+        struct.Struct(endian + "iII"),
+        struct.Struct(endian + "I"),
+        struct.Struct(endian + "7d"),
+    )
+    for endian_flag, endian in ((0, ">"), (1, "<"))
+}
+
+
+def odom_sample_from_zenoh(payload: zenoh.ZBytes) -> tuple:
+    """
+    Extract an odometry sample from a Zenoh nav_msgs/Odometry payload.
+
+    The payload is read in place when the Zenoh binding supports it, and
+    copied once otherwise.
+
+    Parameters
+    ----------
+    payload : zenoh.ZBytes
+        The payload of the Zenoh sample.
+
+    Returns
+    -------
+    tuple
+        The sample in ``ODOM_SAMPLE_FORMAT`` layout.
+    """
+    return odom_sample_from_cdr(payload_buffer(payload))
+
+
+def odom_sample_from_cdr(payload: Union[bytes, memoryview]) -> tuple:
+    """
+    Extract an odometry sample from a CDR encoded nav_msgs/Odometry message.
+
+    Only the header stamp and the pose are decoded. The frame id strings are
+    skipped and the covariance matrices and twist are never read. Payloads in
+    an encoding other than plain CDR fall back to a full deserialization.
+
+    Parameters
+    ----------
+    payload : Union[bytes, memoryview]
+        The serialized nav_msgs/Odometry message, including the 4 byte
+        encapsulation header.
+
+    Returns
+    -------
+    tuple
+        The sample in ``ODOM_SAMPLE_FORMAT`` layout.
+    """
+    structs = _CDR_ODOM_STRUCTS.get(payload[1]) if payload[0] == 0 else None
+    if structs is None:
+        odom = nav_msgs.Odometry.deserialize(bytes(payload))
+        stamp = odom.header.stamp
+        pose = odom.pose.pose
+        return (
+            stamp.sec,
+            stamp.nanosec,
+            pose.orientation.x,
+            pose.orientation.y,
+            pose.orientation.z,
+            pose.orientation.w,
+            pose.position.x,
+            pose.position.y,
+            pose.position.z,
+        )
+
+    header, string_length, pose = structs
+
+    # Offsets are relative to the end of the encapsulation header
+    sec, nanosec, frame_id_length = header.unpack_from(payload, 4)
+    offset = (12 + frame_id_length + 3) & ~3
+    (child_frame_id_length,) = string_length.unpack_from(payload, 4 + offset)
+    offset = (offset + 4 + child_frame_id_length + 7) & ~7
+
+    px, py, pz, qx, qy, qz, qw = pose.unpack_from(payload, 4 + offset)
+    return sec, nanosec, qx, qy, qz, qw, px, py, pz
+
+
+def wait_for_sigterm() -> None:
+    """
+    Block a reader process until it is terminated.
+
+    The DDS subscribers of a reader process deliver samples from their own
+    threads, the main thread only has to keep them alive. It sleeps until
+    stop() terminates the process, then returns so that the process exits
+    normally.
+    """
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    stop.wait()
+
+
+def _movement_batch(
+    previous: Tuple[float, float, float],
+    positions: np.ndarray,
+    move_history: float,
+) -> Tuple[float, float]:
+    """
+    Run the movement decay kernel over a batch of positions at once.
+
+    Equivalent to applying ``move_history = 0.7 * delta + 0.3 * move_history``
+    once per position, in order.
+
+    Parameters
+    ----------
+    previous : Tuple[float, float, float]
+        The position before the first sample of the batch.
+    positions : np.ndarray
+        An (N, 3) array of x, y, z positions.
+    move_history : float
+        The decay kernel state before the first sample of the batch.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The distance moved by the last sample and the updated decay kernel state.
+    """
+    steps = np.diff(positions, axis=0, prepend=np.asarray([previous]))
+    deltas = np.sqrt(np.einsum("ij,ij->i", steps, steps))
+
+    n = deltas.shape[0]
+    weights = 0.3 ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    move_history = 0.7 * float(np.dot(weights, deltas)) + 0.3**n * move_history
+
+    return float(deltas[-1]), move_history
+
+
+def _yaw_from_quaternion(x: float, y: float, z: float, w: float) -> float:
+    """
+    Compute only the yaw of a quaternion.
+
+    Same result as the third angle of OdomProviderBase.euler_from_quaternion,
+    without computing the roll and pitch that the odometry update discards.
+
+    Parameters
+    ----------
+    x : float
+        The x component of the quaternion.
+    y : float
+        The y component of the quaternion.
+    z : float
+        The z component of the quaternion.
+    w : float
+        The w component of the quaternion.
+
+    Returns
+    -------
+    float
+        The yaw angle in radians (counterclockwise around z).
+    """
+    return math.atan2(+2.0 * (w * z + x * y), +1.0 - 2.0 * (y * y + z * z))
+
 
 class RobotState(Enum):
     """
@@ -27,17 +201,53 @@ class OdomProviderBase(ABC):
     and pose data across different robot platforms.
     """
 
+    # The state is written on every odometry sample, keep it out of __dict__
+    __slots__ = (
+        "data_ring",
+        "_odom_reader_thread",
+        "_odom_processor_thread",
+        "_stop_event",
+        "_position_waiters",
+        "_position_waiters_lock",
+        "body_height_cm",
+        "body_attitude",
+        "moving",
+        "previous_x",
+        "previous_y",
+        "previous_z",
+        "move_history",
+        "x",
+        "y",
+        "z",
+        "odom_yaw_0_360",
+        "odom_yaw_m180_p180",
+        "odom_rockchip_ts",
+        "odom_subscriber_ts",
+        "_snapshot",
+    )
+
+    # Whether the ring producer runs in a separate process
+    _ring_cross_process = False
+
     def __init__(self):
         """
         Initialize the base Odometry Provider.
         """
         logging.info(f"Booting {self.__class__.__name__}")
 
-        self.data_queue: mp.Queue = mp.Queue()
-        self._odom_reader_thread: Optional[mp.Process] = None
+        self.data_ring = SPSCRingBuffer(
+            ODOM_SAMPLE_FORMAT, cross_process=self._ring_cross_process
+        )
+        self._odom_reader_thread: Optional[Union[mp.Process, threading.Thread]] = None
         self._odom_processor_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
+        # Coroutines waiting in position_async for the next odometry update
+        self._position_waiters: List[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = []
+        self._position_waiters_lock = threading.Lock()
+
         self.body_height_cm = 0
         self.body_attitude: Optional[RobotState] = None
 
@@ -55,6 +265,9 @@ class OdomProviderBase(ABC):
         self.odom_rockchip_ts = 0.0
         self.odom_subscriber_ts = 0.0
 
+        self._snapshot: dict = {}
+        self._publish_position()
+
     @abstractmethod
     def start(self) -> None:
         """
@@ -107,93 +320,175 @@ class OdomProviderBase(ABC):
         """
         Process the odom data and update the internal state.
         This method runs in a separate thread and continuously processes
-        odometry data from the queue.
-        """
-        while not self._stop_event.is_set():
-            try:
-                pose_data = self.data_queue.get(timeout=1)
-            except Exception:
-                # Queue timeout or other errors
-                continue
-
-            # Handle different message types
-            # PoseWithCovarianceStamped has pose.pose, PoseStamped has just pose
-            if hasattr(pose_data.pose, "pose"):
-                # PoseWithCovarianceStamped
-                pose = pose_data.pose.pose
-            else:
-                # PoseStamped or similar
-                pose = pose_data.pose
-
-            header = pose_data.header
+        odometry samples from the shared memory ring buffer.
 
-            # This is the time according to the RockChip. It may be off by several seconds from UTC
-            self.odom_rockchip_ts = header.stamp.sec + header.stamp.nanosec * 1e-9
+        All samples queued in the ring are drained and folded into one state
+        update, so a slow consumer does not fall behind a high-rate publisher.
+        The loop sleeps on the ring until stop() closes it, also when the ring
+        is fed by a separate process, see SPSCRingBuffer.get.
+        """
+        data_ring = self.data_ring
 
-            # The local timestamp
-            self.odom_subscriber_ts = time.time()
+        while not self._stop_event.is_set():
+            sample = data_ring.get()
+            if sample is None:
+                break
 
-            # Update body height and attitude if applicable
-            self._update_body_state(pose)
+            samples = [sample]
+            while len(samples) < ODOM_BATCH_SIZE:
+                sample = data_ring.get_nowait()
+                if sample is None:
+                    break
+                samples.append(sample)
 
-            x = pose.orientation.x
-            y = pose.orientation.y
-            z = pose.orientation.z
-            w = pose.orientation.w
+            self._process_samples(samples)
 
-            dx = (pose.position.x - self.previous_x) ** 2
-            dy = (pose.position.y - self.previous_y) ** 2
-            dz = (pose.position.z - self.previous_z) ** 2
+    def _process_samples(self, samples: List[tuple]):
+        """
+        Update the internal state from a batch of odometry samples.
 
-            self.previous_x = pose.position.x
-            self.previous_y = pose.position.y
-            self.previous_z = pose.position.z
+        Only the movement decay kernel depends on every sample; everything
+        else is taken from the most recent one.
 
-            delta = math.sqrt(dx + dy + dz)
+        Parameters
+        ----------
+        samples : List[tuple]
+            Odometry samples in ``ODOM_SAMPLE_FORMAT`` layout, oldest first.
+        """
+        (
+            stamp_sec,
+            stamp_nanosec,
+            x,
+            y,
+            z,
+            w,
+            position_x,
+            position_y,
+            position_z,
+        ) = samples[-1]
+
+        # This is the time according to the RockChip. It may be off by several seconds from UTC
+        self.odom_rockchip_ts = stamp_sec + stamp_nanosec * 1e-9
+
+        # The local timestamp. This is wall-clock time on purpose, consumers such
+        # as the fabric map compare it with unix timestamps from other robots.
+        # Movement detection is sample based and never reads it.
+        self.odom_subscriber_ts = time.time()
+
+        # Update body height and attitude if applicable
+        self._update_body_state(position_z)
+
+        if len(samples) == 1:
+            if (
+                position_x == self.previous_x
+                and position_y == self.previous_y
+                and position_z == self.previous_z
+            ):
+                # A robot at rest republishes the same pose, only the history decays
+                delta = 0.0
+                self.move_history *= 0.3
+            else:
+                delta = math.dist(
+                    (position_x, position_y, position_z),
+                    (self.previous_x, self.previous_y, self.previous_z),
+                )
 
-            # moving? Use a decay kernel
-            self.move_history = 0.7 * delta + 0.3 * self.move_history
+                # moving? Use a decay kernel
+                self.move_history = 0.7 * delta + 0.3 * self.move_history
+        else:
+            positions = np.array([s[6:9] for s in samples], dtype=np.float64)
+            delta, self.move_history = _movement_batch(
+                (self.previous_x, self.previous_y, self.previous_z),
+                positions,
+                self.move_history,
+            )
 
-            if delta > 0.01 or self.move_history > 0.01:
-                self.moving = True
-                logging.info(
-                    f"delta moving (m): {round(delta, 3)} {round(self.move_history, 3)}"
-                )
-            else:
-                self.moving = False
+        self.previous_x = position_x
+        self.previous_y = position_y
+        self.previous_z = position_z
 
-            angles = self.euler_from_quaternion(x, y, z, w)
+        # Only log when the robot starts or stops moving, not on every sample
+        moving = (delta > MOVING_THRESHOLD_M) | (self.move_history > MOVING_THRESHOLD_M)
+        if moving != self.moving:
+            logging.info(
+                "moving: %s, delta (m): %.3f %.3f", moving, delta, self.move_history
+            )
+        self.moving = moving
+
+        # This is in the standard robot convention
+        # yaw increases when you turn LEFT
+        # (counter-clockwise rotation about the vertical axis)
+        self.odom_yaw_m180_p180 = round(
+            _yaw_from_quaternion(x, y, z, w) * rad_to_deg, 4
+        )
+
+        # We also provide a second data product, where
+        # * yaw increases when you turn RIGHT (CW), and
+        # * the range runs from 0 to 360 Deg
+        self.odom_yaw_0_360 = round(-self.odom_yaw_m180_p180 % 360.0, 4)
+
+        # Current position in world frame
+        self.x = round(position_x, 4)
+        self.y = round(position_y, 4)
+        logging.debug(
+            "odom: X:%s Y:%s W:%s H:%s T:%s",
+            self.x,
+            self.y,
+            self.odom_yaw_m180_p180,
+            self.odom_yaw_0_360,
+            self.odom_rockchip_ts,
+        )
+
+        self._publish_position()
+        self._notify_position_waiters()
+
+    def _publish_position(self):
+        """
+        Publish a consistent snapshot of the state for the position property.
 
-            # This is in the standard robot convention
-            # yaw increases when you turn LEFT
-            # (counter-clockwise rotation about the vertical axis)
-            self.odom_yaw_m180_p180 = round(angles[2] * rad_to_deg, 4)
+        Must be called once all fields of an update have been written, so that
+        readers never see a half-updated position. The snapshot is replaced,
+        never mutated, which makes the swap atomic for readers.
+        """
+        self._snapshot = {
+            "odom_x": self.x,
+            "odom_y": self.y,
+            "moving": self.moving,
+            "odom_yaw_0_360": self.odom_yaw_0_360,
+            "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
+            "body_height_cm": self.body_height_cm,
+            "body_attitude": self.body_attitude,
+            "odom_rockchip_ts": self.odom_rockchip_ts,
+            "odom_subscriber_ts": self.odom_subscriber_ts,
+        }
 
-            # We also provide a second data product, where
-            # * yaw increases when you turn RIGHT (CW), and
-            # * the range runs from 0 to 360 Deg
-            flip = -1.0 * self.odom_yaw_m180_p180
-            if flip < 0.0:
-                flip = flip + 360.0
+    def _notify_position_waiters(self):
+        """
+        Wake up every coroutine waiting in position_async.
 
-            self.odom_yaw_0_360 = round(flip, 4)
+        Called from the processor thread, so the futures are resolved on their
+        own event loops.
+        """
+        with self._position_waiters_lock:
+            waiters = self._position_waiters
+            self._position_waiters = []
 
-            # Current position in world frame
-            self.x = round(pose.position.x, 4)
-            self.y = round(pose.position.y, 4)
-            logging.debug(
-                f"odom: X:{self.x} Y:{self.y} W:{self.odom_yaw_m180_p180} H:{self.odom_yaw_0_360} T:{self.odom_rockchip_ts}"
-            )
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_waiter, future)
+            except RuntimeError:
+                # The event loop has already been closed
+                pass
 
-    def _update_body_state(self, pose):
+    def _update_body_state(self, position_z: float):
         """
         Update body height and attitude based on pose data.
         Can be overridden by subclasses for robot-specific logic.
 
         Parameters
         ----------
-        pose : Pose
-            The pose data containing position and orientation.
+        position_z : float
+            The z coordinate of the robot body in the world frame.
         """
         # Default implementation does nothing
         # Subclasses can override this for robot-specific behavior
@@ -203,7 +498,8 @@ class OdomProviderBase(ABC):
     def position(self) -> dict:
         """
         Get the current robot position in world frame.
-        Returns a dictionary with x, y, and odom_yaw_0_360.
+        Returns the snapshot published after the last odometry update.
+        Callers must not modify the returned dictionary.
 
         Returns
         -------
@@ -220,29 +516,68 @@ class OdomProviderBase(ABC):
             - odom_rockchip_ts: The unix timestamp of the last odometry update. Provided by the publisher.
             - odom_subscriber_ts: The unix timestamp of the last odometry update according to the subscriber.
         """
-        return {
-            "odom_x": self.x,
-            "odom_y": self.y,
-            "moving": self.moving,
-            "odom_yaw_0_360": self.odom_yaw_0_360,
-            "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
-            "body_height_cm": self.body_height_cm,
-            "body_attitude": self.body_attitude,
-            "odom_rockchip_ts": self.odom_rockchip_ts,
-            "odom_subscriber_ts": self.odom_subscriber_ts,
-        }
+        return self._snapshot
+
+    async def position_async(self, timeout: Optional[float] = None) -> dict:
+        """
+        Wait for the next odometry update and return the robot position.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait in seconds. If it expires, the last known
+            position is returned. Waits forever if None.
+
+        Returns
+        -------
+        dict
+            The same dictionary as the position property.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self._position_waiters_lock:
+            self._position_waiters.append((loop, future))
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            with self._position_waiters_lock:
+                if (loop, future) in self._position_waiters:
+                    self._position_waiters.remove((loop, future))
+
+        return self.position
 
     def stop(self):
         """
         Stop the OdomProvider and clean up resources.
         """
         self._stop_event.set()
+        self.data_ring.close()
 
         if self._odom_reader_thread:
-            self._odom_reader_thread.terminate()
+            # Thread readers exit on the stop event, processes must be terminated
+            terminate = getattr(self._odom_reader_thread, "terminate", None)
+            if terminate is not None:
+                terminate()
             self._odom_reader_thread.join()
             logging.info(f"{self.__class__.__name__} reader thread stopped.")
 
         if self._odom_processor_thread:
             self._odom_processor_thread.join()
             logging.info(f"{self.__class__.__name__} processor thread stopped.")
+
+        self.data_ring.release()
+
+
+def _resolve_waiter(future: asyncio.Future) -> None:
+    """
+    Resolve a position_async future unless it was already cancelled.
+
+    Parameters
+    ----------
+    future : asyncio.Future
+        The future to resolve.
+    """
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,81 @@
+from typing import List
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def path_segments(paths: List[np.ndarray]) -> NDArray:
+    """
+    Get the endpoints of straight candidate paths.
+
+    Parameters
+    ----------
+    paths : List[np.ndarray]
+        The paths, each a (2, N) array of x and y coordinates.
+
+    Returns
+    -------
+    NDArray
+        A (paths, 4) array of start x, start y, end x and end y.
+    """
+    return np.array(
+        [[path[0][0], path[1][0], path[0][-1], path[1][-1]] for path in paths],
+        dtype=np.float64,
+    )
+
+
+def blocked_paths(
+    X: NDArray,
+    Y: NDArray,
+    segments: NDArray,
+    half_width: float,
+    behind_only: NDArray,
+) -> NDArray:
+    """
+    Find the obstacle points that are too close to each candidate path.
+
+    The distance from every point to every path segment is computed at once
+    by broadcasting the points against the segments.
+
+    Parameters
+    ----------
+    X : NDArray
+        The x coordinates of the obstacle points.
+    Y : NDArray
+        The y coordinates of the obstacle points, positive in front of the
+        robot.
+    segments : NDArray
+        A (paths, 4) array of segment endpoints, see path_segments.
+    half_width : float
+        Half the width of the robot in meters.
+    behind_only : NDArray
+        A boolean mask of the paths that only obstacles behind the robot
+        (negative y) can block.
+
+    Returns
+    -------
+    NDArray
+        A boolean (points, paths) array, True where the point is closer than
+        half_width to the path.
+    """
+    x1, y1, x2, y2 = segments.T
+    dx = x2 - x1
+    dy = y2 - y1
+    length_sq = dx * dx + dy * dy
+
+    px = X[:, np.newaxis]
+    py = Y[:, np.newaxis]
+
+    # Parameter t of the projection onto each segment, clamped to the
+    # segment. Zero length segments project onto their start point.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = ((px - x1) * dx + (py - y1) * dy) / length_sq
+    t = np.where(length_sq == 0, 0.0, np.clip(t, 0, 1))
+
+    dist_sq = (px - (x1 + t * dx)) ** 2 + (py - (y1 + t * dy)) ** 2
+
+    # compare squared distances to skip the square root
+    blocked = dist_sq < half_width**2
+    blocked[:, behind_only] &= py < 0
+
+    return blocked
@@ -1,5 +1,29 @@
+import inspect
+import logging
 import threading
-from typing import Any
+from typing import Any, Optional
+
+
+def _bind_arguments(cls, args: tuple, kwargs: dict) -> Any:
+    """
+    Normalize constructor arguments so positional and keyword calls compare equal.
+
+    Args:
+        cls: The class whose constructor signature is used.
+        args: Positional arguments passed to the constructor.
+        kwargs: Keyword arguments passed to the constructor.
+
+    Returns
+    -------
+        Any: The bound arguments with defaults applied, or the raw arguments
+        if they do not match the signature.
+    """
+    try:
+        bound = inspect.signature(cls).bind(*args, **kwargs)
+    except (TypeError, ValueError):
+        return args, kwargs
+    bound.apply_defaults()
+    return bound.arguments
 
 
 def singleton(cls):
@@ -10,6 +34,12 @@ def singleton(cls):
     Multiple threads attempting to create an instance will be synchronized to prevent
     race conditions.
 
+    The instance is created with the arguments of the first call. Later calls
+    without arguments return it as is. Later calls with different arguments
+    also return it, since several plugins share one provider per robot, but a
+    warning is logged because the caller does not get the configuration it
+    asked for.
+
     Args:
         cls: The class to be converted into a singleton.
 
@@ -20,6 +50,7 @@ def singleton(cls):
     if not hasattr(cls, "_singleton_instance"):
         cls._singleton_instance = None
     lock = threading.Lock()
+    created_with: Optional[Any] = None
 
     def get_instance(*args, **kwargs) -> Any:
         """
@@ -36,9 +67,20 @@ def singleton(cls):
         -------
             Any: The singleton instance of the decorated class.
         """
+        nonlocal created_with
         with lock:
             if cls._singleton_instance is None:
                 cls._singleton_instance = cls(*args, **kwargs)
+                created_with = _bind_arguments(cls, args, kwargs)
+            elif args or kwargs:
+                requested = _bind_arguments(cls, args, kwargs)
+                if requested != created_with:
+                    logging.warning(
+                        "%s already exists with arguments %s, ignoring %s",
+                        cls.__name__,
+                        created_with,
+                        requested,
+                    )
             return cls._singleton_instance
 
     def reset_instance():
@@ -48,8 +90,10 @@ def singleton(cls):
         This method sets the singleton instance to None, allowing a new instance
         to be created on the next call to get_instance.
         """
+        nonlocal created_with
         with lock:
             cls._singleton_instance = None
+            created_with = None
 
     get_instance._singleton_class = cls  # type: ignore
     get_instance.reset = reset_instance  # type: ignore
@@ -0,0 +1,356 @@
+import multiprocessing as mp
+import struct
+import threading
+import time
+import weakref
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+
+class SPSCRingBuffer:
+    """
+    Lock-free single-producer/single-consumer ring buffer in shared memory.
+
+    Every slot holds one fixed-size record packed with ``struct``. The producer
+    owns the tail counter and the consumer owns the head counter, so neither
+    side takes a lock to move records. When the ring is full the producer overwrites the
+    oldest slot and the consumer skips ahead to the oldest record that is still
+    valid (drop-oldest semantics).
+
+    Python gives no ordering guarantee between stores to shared memory as seen
+    from another process, and aarch64 may make them visible out of order. Each
+    slot therefore starts with the sequence number of the record it holds,
+    cleared before the record is written and set after it. The consumer only
+    returns a record whose sequence number is the one it expects, both before
+    and after unpacking it, so a slot whose bytes are not visible yet or are
+    being rewritten is never returned. The counters and sequence numbers are
+    aligned 8-byte values, which are read and written as a whole on x86_64 and
+    aarch64.
+
+    The ring can be handed to a ``multiprocessing.Process`` as an argument, in
+    which case the child process attaches to the same shared memory block.
+    Such a ring must be created with ``cross_process=True``, which makes
+    ``put`` and ``close`` also set a shared event that a consumer waiting in
+    ``get`` sleeps on. With a producer thread in the same process the consumer
+    sleeps on a condition instead.
+
+    Parameters
+    ----------
+    fmt : str
+        The ``struct`` format of a single record.
+    capacity : int
+        The number of slots in the ring. Defaults to 64.
+    cross_process : bool
+        Whether the producer runs in another process. Defaults to False.
+    """
+
+    def __init__(self, fmt: str, capacity: int = 64, cross_process: bool = False):
+        """
+        Allocate the shared memory block and the head/tail counters.
+
+        Parameters
+        ----------
+        fmt : str
+            The ``struct`` format of a single record.
+        capacity : int
+            The number of slots in the ring. Defaults to 64.
+        cross_process : bool
+            Whether the producer runs in another process. Defaults to False.
+        """
+        if capacity < 2:
+            raise ValueError("SPSCRingBuffer capacity must be at least 2")
+
+        self.fmt = fmt
+        self.capacity = capacity
+        self._record = struct.Struct(fmt)
+        self._slot_size = _slot_size(self._record)
+        self._shm = SharedMemory(create=True, size=capacity * self._slot_size)
+
+        self._head = mp.Value("Q", 0, lock=False)
+        self._tail = mp.Value("Q", 0, lock=False)
+        self._closed = mp.Value("b", 0, lock=False)
+
+        # A condition cannot be shared with another process, nor touched by a
+        # forked child that may have copied it while locked
+        self._cross_process = cross_process
+        self._not_empty = threading.Condition()
+        self._wakeup = mp.Event() if cross_process else None
+
+        self._finalizer = weakref.finalize(self, _release_shm, self._shm, True)
+
+    def __getstate__(self) -> dict:
+        """
+        Pickle the ring by shared memory name so that it can cross a process boundary.
+
+        Returns
+        -------
+        dict
+            The state needed to attach to the ring in another process.
+
+        Raises
+        ------
+        ValueError
+            If the ring was not created with ``cross_process=True``.
+        """
+        if not self._cross_process:
+            raise ValueError("SPSCRingBuffer must be created with cross_process=True")
+
+        return {
+            "fmt": self.fmt,
+            "capacity": self.capacity,
+            "shm_name": self._shm.name,
+            "head": self._head,
+            "tail": self._tail,
+            "closed": self._closed,
+            "wakeup": self._wakeup,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Attach to an existing ring created by another process.
+
+        Parameters
+        ----------
+        state : dict
+            The state produced by ``__getstate__``.
+        """
+        self.fmt = state["fmt"]
+        self.capacity = state["capacity"]
+        self._record = struct.Struct(self.fmt)
+        self._slot_size = _slot_size(self._record)
+        self._shm = SharedMemory(name=state["shm_name"])
+        # Only the creating process may unlink the block
+        resource_tracker.unregister(self._shm._name, "shared_memory")  # type: ignore
+        self._head = state["head"]
+        self._tail = state["tail"]
+        self._closed = state["closed"]
+        self._cross_process = True
+        self._not_empty = threading.Condition()
+        self._wakeup = state["wakeup"]
+        self._finalizer = weakref.finalize(self, _release_shm, self._shm, False)
+
+    def __len__(self) -> int:
+        """
+        Get the number of records waiting to be consumed.
+
+        Returns
+        -------
+        int
+            The number of unread records, capped at the ring capacity.
+        """
+        return min(self._tail.value - self._head.value, self.capacity)
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the ring has been closed.
+
+        Returns
+        -------
+        bool
+            True once ``close`` has been called.
+        """
+        return bool(self._closed.value)
+
+    def put(self, *fields) -> None:
+        """
+        Write one record into the ring. Never waits for the consumer.
+
+        Parameters
+        ----------
+        *fields
+            The values of the record, in the order given by ``fmt``.
+        """
+        buf = self._shm.buf
+        tail = self._tail.value
+        offset = (tail % self.capacity) * self._slot_size
+
+        # Mark the slot as being rewritten, and publish it once it is complete
+        _SEQ.pack_into(buf, offset, 0)
+        self._record.pack_into(buf, offset + _SEQ.size, *fields)
+        _SEQ.pack_into(buf, offset, tail + 1)
+        self._tail.value = tail + 1
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        else:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def get_nowait(self) -> Optional[tuple]:
+        """
+        Read the oldest unread record without waiting.
+
+        Returns
+        -------
+        Optional[tuple]
+            The unpacked record, or None if the ring is empty.
+        """
+        buf = self._shm.buf
+        capacity = self.capacity
+        head = self._head.value
+
+        while True:
+            tail = self._tail.value
+            if head == tail:
+                self._head.value = head
+                return None
+
+            # The producer may be rewriting the slot at tail - capacity
+            if tail - head >= capacity:
+                head = tail - capacity + 1
+
+            offset = (head % capacity) * self._slot_size
+            (seq,) = _SEQ.unpack_from(buf, offset)
+
+            if seq > head + 1:
+                # The slot already holds a newer record, ours was overwritten
+                head = seq - capacity
+                continue
+
+            if seq < head + 1:
+                # The slot is being rewritten for a newer record, skip ahead
+                if self._tail.value - head >= capacity:
+                    continue
+                # The record is not visible yet, try again later
+                self._head.value = head
+                return None
+
+            record = self._record.unpack_from(buf, offset + _SEQ.size)
+
+            # The slot was rewritten while we were reading it, skip ahead
+            if _SEQ.unpack_from(buf, offset)[0] != seq:
+                continue
+
+            self._head.value = head + 1
+            return record
+
+    def get(self, timeout: Optional[float] = None) -> Optional[tuple]:
+        """
+        Read the oldest unread record, waiting for the producer if needed.
+
+        With a producer in the same process the consumer sleeps on a condition
+        until ``put`` or ``close`` wakes it. With a cross-process producer it
+        yields the CPU a few times, since the next record usually follows
+        shortly, and then sleeps on the shared event that ``put`` and ``close``
+        set.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait in seconds. Waits forever if None.
+
+        Returns
+        -------
+        Optional[tuple]
+            The unpacked record, or None if the timeout expired or the ring
+            was closed.
+        """
+        if self._wakeup is None:
+            record = None
+
+            def ready() -> bool:
+                nonlocal record
+                record = self.get_nowait()
+                return record is not None or bool(self._closed.value)
+
+            with self._not_empty:
+                self._not_empty.wait_for(ready, timeout)
+            return record
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        spins = 0
+
+        while True:
+            record = self.get_nowait()
+            if record is not None or self._closed.value:
+                return record
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+
+            if spins < 10:
+                spins += 1
+                time.sleep(0)
+                continue
+
+            # Clear the event before looking at the ring again, so that a
+            # record published in between still sets it
+            self._wakeup.clear()
+            record = self.get_nowait()
+            if record is not None or self._closed.value:
+                return record
+
+            # A published record whose bytes are not visible yet
+            if len(self):
+                time.sleep(0)
+                continue
+
+            self._wakeup.wait(
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+
+    def close(self) -> None:
+        """
+        Close the ring. A consumer blocked in ``get`` returns None once the
+        ring is closed and the remaining records have been read.
+        """
+        self._closed.value = 1
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        else:
+            with self._not_empty:
+                self._not_empty.notify_all()
+
+    def release(self) -> None:
+        """
+        Close the ring and release the shared memory block.
+
+        Must only be called once neither side reads or writes the ring anymore.
+        """
+        self.close()
+        self._finalizer()
+
+
+# Per-slot sequence number, 1 + the index of the record in the slot, 0 if
+# the slot is being written
+_SEQ = struct.Struct("Q")
+
+
+def _slot_size(record: struct.Struct) -> int:
+    """
+    Get the size of a ring slot, keeping every sequence number 8-byte aligned.
+
+    Parameters
+    ----------
+    record : struct.Struct
+        The struct of a single record.
+
+    Returns
+    -------
+    int
+        The size in bytes of a sequence number plus one record, rounded up to
+        a multiple of 8.
+    """
+    return (_SEQ.size + record.size + 7) & ~7
+
+
+def _release_shm(shm: SharedMemory, unlink: bool) -> None:
+    """
+    Close and optionally unlink a shared memory block.
+
+    Parameters
+    ----------
+    shm : SharedMemory
+        The shared memory block to release.
+    unlink : bool
+        Whether to unlink the block. Only the creating process should unlink.
+    """
+    try:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    except (BufferError, FileNotFoundError):
+        pass
@@ -1,43 +1,34 @@
 import logging
-import multiprocessing as mp
 import threading
-import time
-from typing import Optional
 
 import zenoh
 
-from runtime.logging import LoggingConfig, get_logging_config, setup_logging
-from zenoh_msgs import (
-    Odometry,
-    PoseWithCovarianceStamped,
-    nav_msgs,
-    open_zenoh_session,
-)
+from zenoh_msgs import open_zenoh_session
 
-from .odom_provider_base import OdomProviderBase, RobotState
+from .odom_provider_base import OdomProviderBase, RobotState, odom_sample_from_zenoh
 from .singleton import singleton
+from .spsc_ring import SPSCRingBuffer
 
 
 def tron_odom_processor(
     topic: str,
-    data_queue: mp.Queue,
-    logging_config: Optional[LoggingConfig] = None,
+    data_ring: SPSCRingBuffer,
+    stop_event: threading.Event,
 ) -> None:
     """
-    Process function for the Tron Odom Provider.
-    This function runs in a separate process to periodically retrieve the odometry
-    data from the robot via Zenoh and put it into a multiprocessing queue.
+    Reader function for the Tron Odom Provider.
+    This function runs in a background thread. Zenoh delivers the odometry data
+    on its own callback threads, and the handler writes it into the ring buffer.
 
     Parameters
     ----------
     topic : str
         The Zenoh topic to subscribe to for odometry data.
-    data_queue : mp.Queue
-        Queue for sending the retrieved odometry and pose data.
-    logging_config : LoggingConfig, optional
-        Optional logging configuration. If provided, it will override the default logging settings.
+    data_ring : SPSCRingBuffer
+        Ring buffer for sending the retrieved odometry and pose data.
+    stop_event : threading.Event
+        Event that keeps the subscriber alive until it is set.
     """
-    setup_logging("tron_odom_processor", logging_config=logging_config)
 
     def zenoh_odom_handler(data: zenoh.Sample):
         """
@@ -48,24 +39,24 @@ def tron_odom_processor(
         data : zenoh.Sample
             The Zenoh sample containing the odometry data.
         """
-        odom: Odometry = nav_msgs.Odometry.deserialize(data.payload.to_bytes())
-        logging.debug(f"Tron Zenoh odom handler: {odom}")
+        sample = odom_sample_from_zenoh(data.payload)
+        logging.debug("Tron Zenoh odom handler: %s", sample)
 
-        data_queue.put(
-            PoseWithCovarianceStamped(header=odom.header, pose=odom.pose)  # type: ignore
-        )
+        data_ring.put(*sample)
 
     try:
         session = open_zenoh_session()
         logging.info(f"Tron Zenoh odom provider opened session: {session}")
         logging.info(f"Tron odom listener subscribing to topic: {topic}")
-        session.declare_subscriber(topic, zenoh_odom_handler)
+        subscriber = session.declare_subscriber(topic, zenoh_odom_handler)
     except Exception as e:
         logging.error(f"Error opening Zenoh client for Tron odom: {e}")
         return None
 
-    while True:
-        time.sleep(0.1)
+    stop_event.wait()
+
+    subscriber.undeclare()
+    session.close()
 
 
 @singleton
@@ -83,6 +74,8 @@ class TronOdomProvider(OdomProviderBase):
         Defaults to "odom".
     """
 
+    __slots__ = ("topic",)
+
     def __init__(self, topic: str = "odom"):
         """
         Initialize the Tron Odom Provider with Zenoh configuration.
@@ -111,12 +104,12 @@ class TronOdomProvider(OdomProviderBase):
 
         logging.info(f"Starting Tron Odom Provider on Zenoh topic: {self.topic}")
 
-        self._odom_reader_thread = mp.Process(
+        self._odom_reader_thread = threading.Thread(
             target=tron_odom_processor,
             args=(
                 self.topic,
-                self.data_queue,
-                get_logging_config(),
+                self.data_ring,
+                self._stop_event,
             ),
             daemon=True,
         )
@@ -132,20 +125,20 @@ class TronOdomProvider(OdomProviderBase):
             )
             self._odom_processor_thread.start()
 
-    def _update_body_state(self, pose):
+    def _update_body_state(self, position_z: float):
         """
         Update body height and attitude based on pose data for Tron robot.
 
         Parameters
         ----------
-        pose : Pose
-            The pose data containing position and orientation.
+        position_z : float
+            The z coordinate of the robot body in the world frame.
         """
         # Body height detection for Tron robot
         # Based on observed data:
         # - Sitting: z ≈ 0.55m (55cm)
         # - Standing: z ≈ 0.71m (71cm)
-        self.body_height_cm = round(pose.position.z * 100.0)
+        self.body_height_cm = round(position_z * 100.0)
         if self.body_height_cm > 60:
             self.body_attitude = RobotState.STANDING
         elif self.body_height_cm > 3:
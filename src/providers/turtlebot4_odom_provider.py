@@ -1,43 +1,36 @@
 import logging
-import multiprocessing as mp
 import threading
-import time
 from typing import Optional
 
 import zenoh
 
-from runtime.logging import LoggingConfig, get_logging_config, setup_logging
-from zenoh_msgs import (
-    Odometry,
-    PoseWithCovarianceStamped,
-    nav_msgs,
-    open_zenoh_session,
-)
+from zenoh_msgs import shared_zenoh_session
 
-from .odom_provider_base import OdomProviderBase
+from .odom_provider_base import OdomProviderBase, odom_sample_from_zenoh
 from .singleton import singleton
+from .spsc_ring import SPSCRingBuffer
 
 
 def turtlebot4_odom_processor(
-    data_queue: mp.Queue,
+    data_ring: SPSCRingBuffer,
     URID: str,
-    logging_config: Optional[LoggingConfig] = None,
+    stop_event: threading.Event,
 ) -> None:
     """
-    Process function for the TurtleBot4 Odom Provider.
-    This function runs in a separate process to periodically retrieve the odometry
-    and pose data from the robot via Zenoh and put it into a multiprocessing queue.
+    Reader function for the TurtleBot4 Odom Provider.
+    This function runs in a background thread. Zenoh delivers the odometry and
+    pose data on its own callback threads, and the handler writes it into the
+    ring buffer.
 
     Parameters
     ----------
-    data_queue : mp.Queue
-        Queue for sending the retrieved odometry and pose data.
+    data_ring : SPSCRingBuffer
+        Ring buffer for sending the retrieved odometry and pose data.
     URID : str
         The URID needed to connect to the Zenoh publisher in the local network.
-    logging_config : LoggingConfig, optional
-        Optional logging configuration. If provided, it will override the default logging settings.
+    stop_event : threading.Event
+        Event that keeps the subscriber alive until it is set.
     """
-    setup_logging("turtlebot4_odom_processor", logging_config=logging_config)
 
     def zenoh_odom_handler(data: zenoh.Sample):
         """
@@ -48,12 +41,10 @@ def turtlebot4_odom_processor(
         data : zenoh.Sample
             The Zenoh sample containing the odometry data.
         """
-        odom: Odometry = nav_msgs.Odometry.deserialize(data.payload.to_bytes())
-        logging.debug(f"Zenoh odom handler: {odom}")
+        sample = odom_sample_from_zenoh(data.payload)
+        logging.debug("Zenoh odom handler: %s", sample)
 
-        data_queue.put(
-            PoseWithCovarianceStamped(header=odom.header, pose=odom.pose.pose)  # type: ignore
-        )
+        data_ring.put(*sample)
 
     if URID is None:
         logging.warning("Aborting TurtleBot4 Navigation system, no URID provided")
@@ -62,16 +53,18 @@ def turtlebot4_odom_processor(
         logging.info(f"TurtleBot4 Navigation system is using URID: {URID}")
 
     try:
-        session = open_zenoh_session()
+        session = shared_zenoh_session()
         logging.info(f"Zenoh navigation provider opened {session}")
         logging.info(f"TurtleBot4 navigation listeners starting with URID: {URID}")
-        session.declare_subscriber(f"{URID}/c3/odom", zenoh_odom_handler)
+        subscriber = session.declare_subscriber(f"{URID}/c3/odom", zenoh_odom_handler)
     except Exception as e:
         logging.error(f"Error opening Zenoh client: {e}")
         return None
 
-    while True:
-        time.sleep(0.1)
+    stop_event.wait()
+
+    # the session is shared with the other providers, only drop our subscriber
+    subscriber.undeclare()
 
 
 @singleton
@@ -83,6 +76,8 @@ class TurtleBot4OdomProvider(OdomProviderBase):
     for communication.
     """
 
+    __slots__ = ("URID",)
+
     def __init__(self, URID: Optional[str] = None):
         """
         Initialize the TurtleBot4 Odom Provider.
@@ -106,12 +101,12 @@ class TurtleBot4OdomProvider(OdomProviderBase):
 
         logging.info(f"Starting TurtleBot4 Odom Provider with URID: {self.URID}")
 
-        self._odom_reader_thread = mp.Process(
+        self._odom_reader_thread = threading.Thread(
             target=turtlebot4_odom_processor,
             args=(
-                self.data_queue,
+                self.data_ring,
                 self.URID,
-                get_logging_config(),
+                self._stop_event,
             ),
             daemon=True,
         )
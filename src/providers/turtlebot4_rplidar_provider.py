@@ -2,19 +2,92 @@ import json
 import logging
 import math
 import os
+import struct
+import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from typing import BinaryIO, Dict, List, Optional, Union
 
 import numpy as np
 import zenoh
 from numpy.typing import NDArray
 
-from zenoh_msgs import LaserScan, open_zenoh_session, sensor_msgs
+from zenoh_msgs import (
+    Header,
+    LaserScan,
+    Time,
+    payload_buffer,
+    sensor_msgs,
+    shared_zenoh_session,
+)
 
 from .d435_provider import D435Provider
+from .path_geometry import blocked_paths, path_segments
 from .singleton import singleton
 
+# CDR readers for sensor_msgs/LaserScan keyed by the encapsulation byte:
+# stamp.sec, stamp.nanosec and the header.frame_id length, the seven float32
+# scan parameters, and a sequence length
+_CDR_SCAN_STRUCTS = {
+    endian_flag: (
+        struct.Struct(endian + "iII"),
+        struct.Struct(endian + "7f"),
+        struct.Struct(endian + "I"),
+        np.dtype(endian + "f4"),
+    )
+    for endian_flag, endian in ((0, ">"), (1, "<"))
+}
+
+
+def laser_scan_from_cdr(payload: Union[bytes, memoryview]) -> LaserScan:
+    """
+    Deserialize a CDR encoded sensor_msgs/LaserScan message.
+
+    The ranges and intensities are returned as float32 NumPy views of the
+    payload instead of lists of Python floats. Payloads in an encoding other
+    than plain CDR fall back to the generic deserializer.
+
+    Parameters
+    ----------
+    payload : Union[bytes, memoryview]
+        The serialized LaserScan message, including the 4 byte encapsulation
+        header.
+
+    Returns
+    -------
+    LaserScan
+        The deserialized scan.
+    """
+    structs = _CDR_SCAN_STRUCTS.get(payload[1]) if payload[0] == 0 else None
+    if structs is None:
+        return sensor_msgs.LaserScan.deserialize(bytes(payload))
+
+    header, params, length, dtype = structs
+
+    # Offsets are relative to the end of the encapsulation header
+    sec, nanosec, frame_id_length = header.unpack_from(payload, 4)
+    frame_id = bytes(payload[16 : 16 + frame_id_length - 1]).decode()
+    offset = (12 + frame_id_length + 3) & ~3
+
+    scan_params = params.unpack_from(payload, 4 + offset)
+    offset += params.size
+
+    sequences = []
+    for _ in range(2):
+        (count,) = length.unpack_from(payload, 4 + offset)
+        offset += length.size
+        sequences.append(
+            np.frombuffer(payload, dtype=dtype, count=count, offset=4 + offset)
+        )
+        offset += count * dtype.itemsize
+
+    return LaserScan(
+        Header(stamp=Time(sec=sec, nanosec=nanosec), frame_id=frame_id),
+        *scan_params,
+        ranges=sequences[0],  # type: ignore
+        intensities=sequences[1],  # type: ignore
+    )
+
 
 @dataclass
 class RPLidarConfig:
@@ -99,6 +172,7 @@ class TurtleBot4RPLidarProvider:
 
         self.running: bool = False
         self.zen = None
+        self._scan_subscriber = None
         self.scans = None
 
         self._raw_scan: Optional[NDArray] = None
@@ -115,6 +189,14 @@ class TurtleBot4RPLidarProvider:
         self.filename_current = None
         self.max_file_size_bytes = 1024 * 1024
 
+        # Kept open between scans, with its size tracked here instead of
+        # stat-ing the file before every write
+        self._log_file: Optional[BinaryIO] = None
+        self._log_file_bytes = 0
+        # Held by the scan callback while it writes and by stop() while it
+        # closes the file
+        self._log_lock = threading.Lock()
+
         # Create timestamped log filename
         if self.write_to_local_file:
             self.filename_current = self.update_filename()
@@ -126,10 +208,7 @@ class TurtleBot4RPLidarProvider:
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
         self.paths = self._initialize_paths()
 
-        self.pp = []
-        for path in self.paths:
-            pairs = list(zip(path[0], path[1]))
-            self.pp.append(pairs)
+        self._path_segments = path_segments(self.paths)
 
         self.turn_left: List[int] = []
         self.turn_right: List[int] = []
@@ -139,11 +218,13 @@ class TurtleBot4RPLidarProvider:
         # Initialize Zenoh
         logging.info("Connecting to the RPLIDAR via Zenoh")
         try:
-            self.zen = open_zenoh_session()
+            self.zen = shared_zenoh_session()
             logging.info(f"Zenoh move client opened {self.zen}")
 
             logging.info(f"TurtleBot4 RPLIDAR listener starting with URID: {self.URID}")
-            self.zen.declare_subscriber(f"{self.URID}/pi/scan", self.listen_scan)
+            self._scan_subscriber = self.zen.declare_subscriber(
+                f"{self.URID}/pi/scan", self.listen_scan
+            )
 
         except Exception as e:
             logging.error(f"Error opening Zenoh client: {e}")
@@ -174,18 +255,47 @@ class TurtleBot4RPLidarProvider:
         if not isinstance(json_line, str):
             raise ValueError("Provided json_line must be a json string.")
 
-        if (
-            self.filename_current is not None
-            and os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"New rpscan file name: {self.filename_current}")
+        with self._log_lock:
+            log_file = self._open_log_file()
+            if log_file is not None and self._log_file_bytes > self.max_file_size_bytes:
+                self.filename_current = self.update_filename()
+                logging.info(f"New rpscan file name: {self.filename_current}")
+                log_file = self._open_log_file()
+
+            if log_file is not None:
+                # A scan line is larger than the write buffer, so flushing it
+                # costs no extra write call and keeps the file line complete
+                data = json_line.encode("utf-8") + b"\n"
+                log_file.write(data)
+                log_file.flush()
+                self._log_file_bytes += len(data)
+
+    def _open_log_file(self) -> Optional[BinaryIO]:
+        """
+        Get the handle of the current log file, opening it if the filename changed.
+
+        Returns
+        -------
+        Optional[BinaryIO]
+            The log file opened for appending, or None if logging is disabled.
+        """
+        if self.filename_current is None:
+            return None
+
+        if self._log_file is None or self._log_file.name != self.filename_current:
+            self._close_log_file()
+            self._log_file = open(self.filename_current, "ab")
+            self._log_file_bytes = os.fstat(self._log_file.fileno()).st_size
 
-        if self.filename_current is not None:
-            with open(self.filename_current, "a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-                f.flush()
+        return self._log_file
+
+    def _close_log_file(self):
+        """
+        Close the current log file, if any.
+        """
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
 
     def listen_scan(self, data: zenoh.Sample):
         """
@@ -196,17 +306,26 @@ class TurtleBot4RPLidarProvider:
         data : zenoh.Sample
             The Zenoh sample containing the scan data.
         """
-        self.scans = sensor_msgs.LaserScan.deserialize(data.payload.to_bytes())
-        logging.debug(f"Zenoh Laserscan data: {self.scans}")
+        self.scans = laser_scan_from_cdr(payload_buffer(data.payload))
+        logging.debug("Zenoh Laserscan data: %s", self.scans)
 
         self._zenoh_processor(self.scans)
 
     def start(self):
         """
         Start the TurtleBot4 RPLidar provider.
-        For Zenoh-based providers, this just sets the running flag.
+        For Zenoh-based providers, this sets the running flag and resubscribes
+        to the scans if the provider was stopped.
         """
         self.running = True
+
+        if self.zen is not None and self._scan_subscriber is None:
+            self._scan_subscriber = self.zen.declare_subscriber(
+                f"{self.URID}/pi/scan", self.listen_scan
+            )
+
+        if self.write_to_local_file and self.filename_current is None:
+            self.filename_current = self.update_filename()
         logging.info("TurtleBot4 RPLidar using Zenoh, provider started")
 
     def _zenoh_processor(self, scan: Optional[LaserScan]):
@@ -228,22 +347,24 @@ class TurtleBot4RPLidarProvider:
             # logging.debug(f"_preprocess_zenoh: {scan}")
             # angle_min=-3.1241390705108643, angle_max=3.1415927410125732
 
-            if not self.angles:
-                self.angles = list(
-                    map(
-                        lambda x: 360.0 * (x + math.pi) / (2 * math.pi),
-                        np.arange(scan.angle_min, scan.angle_max, scan.angle_increment),
+            # The angle table only depends on the scan geometry, build it once
+            if self.angles_final is None:
+                self.angles = (
+                    360.0
+                    * (
+                        np.arange(scan.angle_min, scan.angle_max, scan.angle_increment)
+                        + math.pi
                     )
+                    / (2 * math.pi)
                 )
-                self.angles_final = np.flip(np.array(self.angles))
+                self.angles_final = np.flip(self.angles)
 
             # angles now run from 360.0 to 0 degrees
-            if self.angles_final is not None:
-                data = list(zip(self.angles_final, scan.ranges))
-            else:
-                data = []
-            array_ready = np.array(data)
-            self._path_processor(array_ready)
+            ranges = np.asarray(scan.ranges, dtype=np.float64)
+            count = min(len(self.angles_final), len(ranges))
+            self._path_processor(
+                np.column_stack((self.angles_final[:count], ranges[:count]))
+            )
 
     def _path_processor(self, data: NDArray):
         """
@@ -258,69 +379,50 @@ class TurtleBot4RPLidarProvider:
             The raw data from the RPLidar, expected to be a 2D array
             with angles and distances.
         """
-        complexes = []
-        raw = []
-
-        for angle, distance in data:
+        if data.ndim != 2 or len(data) == 0:
+            data = np.empty((0, 2))
 
-            d_m = distance
+        distances = data[:, 1]
 
-            # first, correctly orient the sensor zero to the robot zero
-            angle = angle + self.sensor_mounting_angle
-            if angle >= 360.0:
-                angle = angle - 360.0
-            elif angle < 0.0:
-                angle = 360.0 + angle
+        # first, correctly orient the sensor zero to the robot zero
+        angles = np.mod(data[:, 0] + self.sensor_mounting_angle, 360.0)
 
-            raw.append([round(angle, 2), d_m])
+        raw_array = np.column_stack((np.round(angles, 2), distances))
 
-            # don't worry about distant objects
-            if d_m > self.relevant_distance_max:
-                continue
-
-            # don't worry about too close objects
-            if d_m < self.relevant_distance_min:
-                continue
+        # don't worry about distant or too close objects
+        keep = (distances <= self.relevant_distance_max) & (
+            distances >= self.relevant_distance_min
+        )
 
-            # convert the angle from [0 to 360] to [-180 to +180] range
-            angle = angle - 180.0
+        # convert the angle from [0 to 360] to [-180 to +180] range
+        centered = angles - 180.0
 
-            for b in self.angles_blanked:
-                if angle >= b[0] and angle <= b[1]:
-                    # this is a permanent robot reflection
-                    # disregard
-                    continue
+        for b in self.angles_blanked:
+            # this is a permanent robot reflection - disregard
+            keep &= ~((centered >= b[0]) & (centered <= b[1]))
 
-            # Convert angle to radians for trigonometric calculations
-            # Note: angle is adjusted back to [0, 360] range
-            a_rad = (angle + 180.0) * self.DEGREES_TO_RADIANS
+        centered = centered[keep]
+        d_m = distances[keep]
 
-            v1 = d_m * math.cos(a_rad)
-            v2 = d_m * math.sin(a_rad)
+        # radians of the [0 to 360] angle, for the trigonometry below
+        a_rad = angles[keep] * self.DEGREES_TO_RADIANS
 
-            # convert to x and y
-            # x runs backwards to forwards, y runs left to right
-            x = -1 * v2
-            y = -1 * v1
+        # convert to x and y
+        # x runs backwards to forwards, y runs left to right
+        x = -1 * (d_m * np.sin(a_rad))
+        y = -1 * (d_m * np.cos(a_rad))
 
-            # the final data ready to use for path planning
-            complexes.append([x, y, angle, d_m])
+        # the final data ready to use for path planning
+        array = np.column_stack((x, y, centered, d_m))
 
         # Append the D435 provider's obstacle data if available
         if self.d435_provider.running and len(self.d435_provider.obstacle) > 50:
             logging.debug("Appending D435 provider obstacle data to RPLidar data")
-            for obstacle in self.d435_provider.obstacle:
-                complexes.append(
-                    [
-                        obstacle["x"],
-                        obstacle["y"],
-                        obstacle["angle"],
-                        obstacle["distance"],
-                    ]
-                )
+            array = np.vstack((array, self.d435_provider.obstacle))
 
-        array = np.array(complexes)
-        raw_array = np.array(raw)
+        if len(array) == 0:
+            # keep the 1-D empty array consumers of raw_scan already handle
+            array = np.array([])
 
         # save_timestamp = time.time()
         if self.write_to_local_file:
@@ -353,40 +455,18 @@ class TurtleBot4RPLidarProvider:
 
             X = array[:, 0]
             Y = array[:, 1]
-            # A = array[:, 2]
-            D = array[:, 3]
-
-            # all the possible conflicting points
-            for x, y, d in list(zip(X, Y, D)):
-                for apath in possible_paths:
-                    path_points = self.paths[apath]
-                    start_x, start_y = (
-                        path_points[0][0],
-                        path_points[1][0],
-                    )
-                    end_x, end_y = path_points[0][-1], path_points[1][-1]
-
-                    if apath == 9:
-                        # For going back, only consider obstacles that are:
-                        # 1. Behind the robot (negative y in robot frame)
-                        # 2. Within a certain distance threshold
 
-                        # Assuming robot faces positive y direction
-                        # Only check obstacles behind the robot
-                        if y >= 0:  # Skip obstacles in front of or beside the robot
-                            continue
-
-                    dist_to_line = self.distance_point_to_line_segment(
-                        x, y, start_x, start_y, end_x, end_y
-                    )
-
-                    if dist_to_line < self.half_width_robot:
-                        # too close - this path will not work
-                        # logging.info(f"removing path: {apath}")
-                        path_to_remove = np.array([apath])
-                        possible_paths = np.setdiff1d(possible_paths, path_to_remove)
-                        logging.debug(f"remaining paths: {possible_paths}")
-                        break  # no need to check other paths
+            # any point too close to a path means this path will not work,
+            # the retreat path is only blocked by obstacles behind the robot
+            blocked = blocked_paths(
+                X,
+                Y,
+                self._path_segments[possible_paths],
+                self.half_width_robot,
+                behind_only=possible_paths == 9,
+            ).any(axis=0)
+            possible_paths = possible_paths[~blocked]
+            logging.debug("remaining paths: %s", possible_paths)
 
         logging.info(f"possible_paths TurtleBot4 RP Lidar: {possible_paths}")
 
@@ -423,6 +503,17 @@ class TurtleBot4RPLidarProvider:
         Stop the TurtleBot4 RPLidar provider.
         """
         self.running = False
+
+        if self._scan_subscriber is not None:
+            self._scan_subscriber.undeclare()
+            self._scan_subscriber = None
+
+        # A scan callback may still be running, keep it from reopening the
+        # file once it is closed
+        with self._log_lock:
+            self.filename_current = None
+            self._close_log_file()
+
         logging.info("TurtleBot4 RPLidar provider stopped")
 
     @property
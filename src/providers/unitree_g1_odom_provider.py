@@ -1,7 +1,7 @@
 import logging
+import math
 import multiprocessing as mp
 import threading
-import time
 from typing import Optional
 
 from runtime.logging import LoggingConfig, get_logging_config, setup_logging
@@ -17,26 +17,27 @@ except ImportError:
         "Unitree SDK or CycloneDDS not found. You do not need this unless you are connecting to a Unitree robot."
     )
 
-from .odom_provider_base import OdomProviderBase, RobotState
+from .odom_provider_base import OdomProviderBase, RobotState, wait_for_sigterm
 from .singleton import singleton
+from .spsc_ring import SPSCRingBuffer
 
 
 def g1_odom_processor(
     channel: str,
-    data_queue: mp.Queue,
+    data_ring: SPSCRingBuffer,
     logging_config: Optional[LoggingConfig] = None,
 ) -> None:
     """
     Process function for the Unitree G1 Odom Provider.
     This function runs in a separate process to periodically retrieve the odometry
-    and pose data from the robot via CycloneDDS and put it into a multiprocessing queue.
+    and pose data from the robot via CycloneDDS and write it into a shared memory ring buffer.
 
     Parameters
     ----------
     channel : str
         The channel to connect to the robot.
-    data_queue : mp.Queue
-        Queue for sending the retrieved odometry and pose data.
+    data_ring : SPSCRingBuffer
+        Shared memory ring buffer for sending the retrieved odometry and pose data.
     logging_config : LoggingConfig, optional
         Optional logging configuration. If provided, it will override the default logging settings.
     """
@@ -51,8 +52,25 @@ def g1_odom_processor(
         data : SportModeState_
             The SportModeState message containing odometry and IMU data.
         """
-        logging.debug(f"SportModeState handler: {data}")  # type: ignore
-        data_queue.put(data)  # type: ignore
+        logging.debug("SportModeState handler: %s", data)
+
+        stamp = data.stamp  # type: ignore
+        x, y, z = data.position  # type: ignore
+        _, _, yaw = data.imu_state.rpy  # type: ignore
+
+        # the yaw in radians is sent as a rotation about z only
+        half_yaw = 0.5 * yaw
+        data_ring.put(
+            stamp.sec,
+            stamp.nanosec,
+            0.0,
+            0.0,
+            math.sin(half_yaw),
+            math.cos(half_yaw),
+            x,
+            y,
+            z,
+        )
 
     try:
         ChannelFactoryInitialize(0, channel)  # type: ignore
@@ -62,14 +80,14 @@ def g1_odom_processor(
 
     try:
         sport_mode_subscriber = ChannelSubscriber("rt/odommodestate", SportModeState_)  # type: ignore
-        sport_mode_subscriber.Init(sport_mode_handler, 10)
+        # only the latest samples matter, keep a short handler queue
+        sport_mode_subscriber.Init(sport_mode_handler, 2)
         logging.info("CycloneDDS SportModeState subscriber initialized successfully")
     except Exception as e:
         logging.error(f"Error opening CycloneDDS client: {e}")
         return None
 
-    while True:
-        time.sleep(0.1)
+    wait_for_sigterm()
 
 
 @singleton
@@ -86,6 +104,12 @@ class UnitreeG1OdomProvider(OdomProviderBase):
         The channel to connect to the robot, used for CycloneDDS.
     """
 
+    __slots__ = ("channel",)
+
+    # g1_odom_processor writes the ring from its own process and wakes
+    # process_odom through the ring's shared event
+    _ring_cross_process = True
+
     def __init__(self, channel: Optional[str] = None):
         """
         Initialize the Unitree G1 Odom Provider.
@@ -117,7 +141,7 @@ class UnitreeG1OdomProvider(OdomProviderBase):
             target=g1_odom_processor,
             args=(
                 self.channel,
-                self.data_queue,
+                self.data_ring,
                 get_logging_config(),
             ),
             daemon=True,
@@ -134,76 +158,16 @@ class UnitreeG1OdomProvider(OdomProviderBase):
             )
             self._odom_processor_thread.start()
 
-    def process_odom(self):
+    def _update_body_state(self, position_z: float):
         """
-        Process the G1 SportModeState data and update the internal state.
-        This overrides the base class method to handle G1-specific message format.
-        """
-        import math
-
-        from .odom_provider_base import rad_to_deg
-
-        while not self._stop_event.is_set():
-            try:
-                sport_data = self.data_queue.get(timeout=1)
-            except Exception:
-                continue
-
-            # Extract timestamp
-            self.odom_rockchip_ts = (
-                sport_data.stamp.sec + sport_data.stamp.nanosec * 1e-9
-            )
-            self.odom_subscriber_ts = time.time()
-
-            # Extract position from the array [x, y, z]
-            x_pos = sport_data.position[0]
-            y_pos = sport_data.position[1]
-            z_pos = sport_data.position[2]
-
-            # Calculate movement delta
-            dx = (x_pos - self.previous_x) ** 2
-            dy = (y_pos - self.previous_y) ** 2
-            dz = (z_pos - self.previous_z) ** 2
-
-            self.previous_x = x_pos
-            self.previous_y = y_pos
-            self.previous_z = z_pos
-
-            delta = math.sqrt(dx + dy + dz)
+        Update the height and attitude of the Unitree G1.
 
-            # Update moving status with decay kernel
-            self.move_history = 0.7 * delta + 0.3 * self.move_history
-
-            if delta > 0.01 or self.move_history > 0.01:
-                self.moving = True
-                logging.info(
-                    f"delta moving (m): {round(delta, 3)} {round(self.move_history, 3)}"
-                )
-            else:
-                self.moving = False
-
-            # Extract yaw directly from IMU RPY (roll, pitch, yaw)
-            # rpy[2] is yaw in radians
-            yaw_rad = sport_data.imu_state.rpy[2]
-
-            # Convert to degrees (standard robot convention: yaw increases CCW)
-            self.odom_yaw_m180_p180 = round(yaw_rad * rad_to_deg, 4)
-
-            # Convert to 0-360 range (yaw increases CW)
-            flip = -1.0 * self.odom_yaw_m180_p180
-            if flip < 0.0:
-                flip = flip + 360.0
-
-            self.odom_yaw_0_360 = round(flip, 4)
-
-            # Update current position
-            self.x = round(x_pos, 4)
-            self.y = round(y_pos, 4)
-            self.z = round(z_pos, 4)
-
-            # We assume that the robot is always standing
-            self.body_attitude = RobotState.STANDING
+        Parameters
+        ----------
+        position_z : float
+            The z coordinate of the robot body in the world frame.
+        """
+        self.z = round(position_z, 4)
 
-            logging.debug(
-                f"G1 odom: X:{self.x} Y:{self.y} Z:{self.z} W:{self.odom_yaw_m180_p180} H:{self.odom_yaw_0_360} T:{self.odom_rockchip_ts}"
-            )
+        # We assume that the robot is always standing
+        self.body_attitude = RobotState.STANDING
@@ -1,7 +1,6 @@
 import logging
 import multiprocessing as mp
 import threading
-import time
 from typing import Optional
 
 from runtime.logging import LoggingConfig, get_logging_config, setup_logging
@@ -17,26 +16,27 @@ except ImportError:
         "Unitree SDK or CycloneDDS not found. You do not need this unless you are connecting to a Unitree robot."
     )
 
-from .odom_provider_base import OdomProviderBase, RobotState
+from .odom_provider_base import OdomProviderBase, RobotState, wait_for_sigterm
 from .singleton import singleton
+from .spsc_ring import SPSCRingBuffer
 
 
 def go2_odom_processor(
     channel: str,
-    data_queue: mp.Queue,
+    data_ring: SPSCRingBuffer,
     logging_config: Optional[LoggingConfig] = None,
 ) -> None:
     """
     Process function for the Unitree Go2 Odom Provider.
     This function runs in a separate process to periodically retrieve the odometry
-    and pose data from the robot via CycloneDDS and put it into a multiprocessing queue.
+    and pose data from the robot via CycloneDDS and write it into a shared memory ring buffer.
 
     Parameters
     ----------
     channel : str
         The channel to connect to the robot.
-    data_queue : mp.Queue
-        Queue for sending the retrieved odometry and pose data.
+    data_ring : SPSCRingBuffer
+        Shared memory ring buffer for sending the retrieved odometry and pose data.
     logging_config : LoggingConfig, optional
         Optional logging configuration. If provided, it will override the default logging settings.
     """
@@ -51,8 +51,21 @@ def go2_odom_processor(
         data : PoseStamped_
             The PoseStamped message containing the pose data.
         """
-        logging.debug(f"Pose message handler: {data}")  # type: ignore
-        data_queue.put(data)  # type: ignore
+        logging.debug("Pose message handler: %s", data)
+
+        stamp = data.header.stamp  # type: ignore
+        pose = data.pose  # type: ignore
+        data_ring.put(
+            stamp.sec,
+            stamp.nanosec,
+            pose.orientation.x,
+            pose.orientation.y,
+            pose.orientation.z,
+            pose.orientation.w,
+            pose.position.x,
+            pose.position.y,
+            pose.position.z,
+        )
 
     try:
         ChannelFactoryInitialize(0, channel)  # type: ignore
@@ -62,14 +75,14 @@ def go2_odom_processor(
 
     try:
         pose_subscriber = ChannelSubscriber("rt/utlidar/robot_pose", PoseStamped_)  # type: ignore
-        pose_subscriber.Init(pose_message_handler, 10)
+        # only the latest samples matter, keep a short handler queue
+        pose_subscriber.Init(pose_message_handler, 2)
         logging.info("CycloneDDS pose subscriber initialized successfully")
     except Exception as e:
         logging.error(f"Error opening CycloneDDS client: {e}")
         return None
 
-    while True:
-        time.sleep(0.1)
+    wait_for_sigterm()
 
 
 @singleton
@@ -86,6 +99,12 @@ class UnitreeGo2OdomProvider(OdomProviderBase):
         The channel to connect to the robot, used for CycloneDDS.
     """
 
+    __slots__ = ("channel",)
+
+    # go2_odom_processor writes the ring from its own process and wakes
+    # process_odom through the ring's shared event
+    _ring_cross_process = True
+
     def __init__(self, channel: Optional[str] = None):
         """
         Initialize the Unitree Go2 Odom Provider.
@@ -117,7 +136,7 @@ class UnitreeGo2OdomProvider(OdomProviderBase):
             target=go2_odom_processor,
             args=(
                 self.channel,
-                self.data_queue,
+                self.data_ring,
                 get_logging_config(),
             ),
             daemon=True,
@@ -134,16 +153,16 @@ class UnitreeGo2OdomProvider(OdomProviderBase):
             )
             self._odom_processor_thread.start()
 
-    def _update_body_state(self, pose):
+    def _update_body_state(self, position_z: float):
         """
         Update body height and attitude based on pose data for Unitree Go2.
 
         Parameters
         ----------
-        pose : Pose
-            The pose data containing position and orientation.
+        position_z : float
+            The z coordinate of the robot body in the world frame.
         """
-        self.body_height_cm = round(pose.position.z * 100.0)
+        self.body_height_cm = round(position_z * 100.0)
         if self.body_height_cm > 24:
             self.body_attitude = RobotState.STANDING
         elif self.body_height_cm > 3:
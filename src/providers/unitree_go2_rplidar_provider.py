@@ -16,6 +16,7 @@ from providers.unitree_go2_odom_provider import UnitreeGo2OdomProvider
 from runtime.logging import LoggingConfig, get_logging_config, setup_logging
 
 from .d435_provider import D435Provider
+from .path_geometry import blocked_paths, path_segments
 from .rplidar_driver import RPDriver
 from .singleton import singleton
 
@@ -221,10 +222,7 @@ class UnitreeGo2RPLidarProvider:
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
         self.paths = self._initialize_paths()
 
-        self.pp = []
-        for path in self.paths:
-            pairs = list(zip(path[0], path[1]))
-            self.pp.append(pairs)
+        self._path_segments = path_segments(self.paths)
 
         self.turn_left: List[int] = []
         self.turn_right: List[int] = []
@@ -323,66 +321,50 @@ class UnitreeGo2RPLidarProvider:
             The raw data from the RPLidar, expected to be a 2D array
             with angles and distances.
         """
-        complexes = []
-        raw = []
+        if data.ndim != 2 or len(data) == 0:
+            data = np.empty((0, 2))
 
-        for angle, distance in data:
-            d_m = distance
+        distances = data[:, 1]
 
-            # first, correctly orient the sensor zero to the robot zero
-            angle = angle + self.sensor_mounting_angle
-            if angle >= 360.0:
-                angle = angle - 360.0
-            elif angle < 0.0:
-                angle = 360.0 + angle
+        # first, correctly orient the sensor zero to the robot zero
+        angles = np.mod(data[:, 0] + self.sensor_mounting_angle, 360.0)
 
-            raw.append([round(angle, 2), d_m])
+        raw_array = np.column_stack((np.round(angles, 2), distances))
 
-            # don't worry about distant objects
-            if d_m > self.relevant_distance_max:
-                continue
-
-            # don't worry about too close objects
-            if d_m < self.relevant_distance_min:
-                continue
+        # don't worry about distant or too close objects
+        keep = (distances <= self.relevant_distance_max) & (
+            distances >= self.relevant_distance_min
+        )
 
-            # convert the angle from [0 to 360] to [-180 to +180] range
-            angle = angle - 180.0
+        # convert the angle from [0 to 360] to [-180 to +180] range
+        centered = angles - 180.0
 
-            if any(b[0] <= angle <= b[1] for b in self.angles_blanked):
-                # this is a permanent robot reflection - disregard
-                continue
+        for b in self.angles_blanked:
+            # this is a permanent robot reflection - disregard
+            keep &= ~((centered >= b[0]) & (centered <= b[1]))
 
-            # Convert angle to radians for trigonometric calculations
-            # Note: angle is adjusted back to [0, 360] range
-            a_rad = (angle + 180.0) * self.DEGREES_TO_RADIANS
+        centered = centered[keep]
+        d_m = distances[keep]
 
-            v1 = d_m * math.cos(a_rad)
-            v2 = d_m * math.sin(a_rad)
+        # radians of the [0 to 360] angle, for the trigonometry below
+        a_rad = angles[keep] * self.DEGREES_TO_RADIANS
 
-            # convert to x and y
-            # x runs backwards to forwards, y runs left to right
-            x = -1 * v2
-            y = -1 * v1
+        # convert to x and y
+        # x runs backwards to forwards, y runs left to right
+        x = -1 * (d_m * np.sin(a_rad))
+        y = -1 * (d_m * np.cos(a_rad))
 
-            # the final data ready to use for path planning
-            complexes.append([x, y, angle, d_m])
+        # the final data ready to use for path planning
+        array = np.column_stack((x, y, centered, d_m))
 
         # Append the D435 provider's obstacle data if available
         if self.d435_provider.running and len(self.d435_provider.obstacle) > 50:
             logging.debug("Appending D435 provider obstacle data to RPLidar data")
-            for obstacle in self.d435_provider.obstacle:
-                complexes.append(
-                    [
-                        obstacle["x"],
-                        obstacle["y"],
-                        obstacle["angle"],
-                        obstacle["distance"],
-                    ]
-                )
+            array = np.vstack((array, self.d435_provider.obstacle))
 
-        array = np.array(complexes)
-        raw_array = np.array(raw)
+        if len(array) == 0:
+            # keep the 1-D empty array consumers of raw_scan already handle
+            array = np.array([])
 
         # save_timestamp = time.time()
         if self.write_to_local_file:
@@ -423,40 +405,31 @@ class UnitreeGo2RPLidarProvider:
 
             X = array[:, 0]
             Y = array[:, 1]
-            # A = array[:, 2]
-            D = array[:, 3]
-
-            # all the possible conflicting points
-            for x, y, d in list(zip(X, Y, D)):
-                for apath in possible_paths:
-                    path_points = self.paths[apath]
-                    start_x, start_y = (
-                        path_points[0][0],
-                        path_points[1][0],
-                    )
-                    end_x, end_y = path_points[0][-1], path_points[1][-1]
-
-                    if apath == 9:
-                        # For going back, only consider obstacles that are:
-                        # 1. Behind the robot (negative y in robot frame)
-                        # 2. Within a certain distance threshold
-
-                        # Assuming robot faces positive y direction
-                        # Only check obstacles behind the robot
-                        if y >= 0:  # Skip obstacles in front of or beside the robot
-                            continue
-
-                    dist_to_line = self.distance_point_to_line_segment(
-                        x, y, start_x, start_y, end_x, end_y
-                    )
-
-                    if dist_to_line < self.half_width_robot:
-                        # too close - this path will not work
-                        # logging.info(f"removing path: {apath}")
-                        path_to_remove = np.array([apath])
-                        possible_paths = np.setdiff1d(possible_paths, path_to_remove)
-                        logging.debug(f"remaining paths: {possible_paths}")
-                        break  # no need to check other paths
+
+            # which points block which candidate path, for all pairs at once,
+            # the retreat path is only blocked by obstacles behind the robot
+            blocked = blocked_paths(
+                X,
+                Y,
+                self._path_segments[possible_paths],
+                self.half_width_robot,
+                behind_only=possible_paths == 9,
+            )
+
+            # all the possible conflicting points, in angle order. A point
+            # removes the first path it blocks that is still alive.
+            alive = np.ones(len(possible_paths), dtype=bool)
+            for row in np.flatnonzero(blocked.any(axis=1)):
+                hits = np.flatnonzero(blocked[row] & alive)
+                if hits.size:
+                    # too close - this path will not work
+                    alive[hits[0]] = False
+                    logging.debug("remaining paths: %s", possible_paths[alive])
+                    if not alive.any():
+                        # every path is blocked, the rest cannot change that
+                        break
+
+            possible_paths = possible_paths[alive]
 
         logging.info(f"possible_paths RP Lidar: {possible_paths}")
 
@@ -64,7 +64,12 @@ from .idl import (
     status_msgs,
     std_msgs,
 )
-from .session import create_zenoh_config, open_zenoh_session
+from .session import (
+    create_zenoh_config,
+    open_zenoh_session,
+    payload_buffer,
+    shared_zenoh_session,
+)
 
 __all__ = [
     # std_msgs
@@ -133,6 +138,8 @@ __all__ = [
     # session
     "create_zenoh_config",
     "open_zenoh_session",
+    "payload_buffer",
+    "shared_zenoh_session",
     # modules
     "session",
     # idl submodules
@@ -1,10 +1,55 @@
 import logging
+import threading
+import time
+from typing import Optional, Union
 
 import zenoh
 
 logging.basicConfig(level=logging.INFO)
 
 
+def _zbytes_exports_buffer() -> bool:
+    """
+    Check whether zenoh.ZBytes exposes its memory through the buffer protocol.
+
+    Returns
+    -------
+    bool
+        True if a memoryview can be taken of a ZBytes payload.
+    """
+    try:
+        memoryview(zenoh.ZBytes(b""))  # type: ignore
+    except TypeError:
+        return False
+    return True
+
+
+# eclipse-zenoh 1.4 only offers the copying to_bytes(), newer bindings may not
+_ZBYTES_EXPORTS_BUFFER = _zbytes_exports_buffer()
+
+
+def payload_buffer(payload: zenoh.ZBytes) -> Union[bytes, memoryview]:
+    """
+    Get the contents of a Zenoh payload for deserialization.
+
+    The payload is read in place when the Zenoh binding supports it, and
+    copied once otherwise.
+
+    Parameters
+    ----------
+    payload : zenoh.ZBytes
+        The payload of a Zenoh sample.
+
+    Returns
+    -------
+    Union[bytes, memoryview]
+        A view of the payload memory, or a copy of it.
+    """
+    if _ZBYTES_EXPORTS_BUFFER:
+        return memoryview(payload)  # type: ignore
+    return payload.to_bytes()
+
+
 def create_zenoh_config(network_discovery: bool = True) -> zenoh.Config:
     """
     Create a Zenoh configuration for a client connecting to a local server.
@@ -27,10 +72,20 @@ def create_zenoh_config(network_discovery: bool = True) -> zenoh.Config:
     return config
 
 
+# When the local router last could not be reached. Sessions opened within
+# the retry interval go straight to network discovery, later ones try the
+# local router again in case it has come up since
+_local_router_failed_at: Optional[float] = None
+_LOCAL_ROUTER_RETRY_INTERVAL = 60.0
+
+
 def open_zenoh_session() -> zenoh.Session:
     """
     Open a Zenoh session with a local connection first, then fall back to network discovery.
 
+    Once the local connection fails, sessions opened during the next minute
+    use network discovery right away before the local router is tried again.
+
     Returns
     -------
     zenoh.Session
@@ -41,13 +96,20 @@ def open_zenoh_session() -> zenoh.Session:
     Exception
         If unable to open a Zenoh session.
     """
-    local_config = create_zenoh_config(network_discovery=False)
-    try:
-        session = zenoh.open(local_config)
-        logging.info("Zenoh client opened without network discovery")
-        return session
-    except Exception:
-        logging.info("Falling back to network discovery...")
+    global _local_router_failed_at
+    if (
+        _local_router_failed_at is None
+        or time.monotonic() - _local_router_failed_at >= _LOCAL_ROUTER_RETRY_INTERVAL
+    ):
+        local_config = create_zenoh_config(network_discovery=False)
+        try:
+            session = zenoh.open(local_config)
+            logging.info("Zenoh client opened without network discovery")
+            _local_router_failed_at = None
+            return session
+        except Exception:
+            logging.info("Falling back to network discovery...")
+            _local_router_failed_at = time.monotonic()
 
     config = create_zenoh_config()
     try:
@@ -59,6 +121,35 @@ def open_zenoh_session() -> zenoh.Session:
         raise Exception("Failed to open Zenoh session") from e
 
 
+_shared_session: Optional[zenoh.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_zenoh_session() -> zenoh.Session:
+    """
+    Get the Zenoh session shared by the providers of this process.
+
+    The session is opened on first use and reopened if it has been closed.
+    Providers declare their subscribers on it and undeclare them when they
+    stop, the session itself stays open for the other providers.
+
+    Returns
+    -------
+    zenoh.Session
+        The shared Zenoh session.
+
+    Raises
+    ------
+    Exception
+        If unable to open a Zenoh session.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None or _shared_session.is_closed():
+            _shared_session = open_zenoh_session()
+        return _shared_session
+
+
 if __name__ == "__main__":
     session = open_zenoh_session()
     if session:
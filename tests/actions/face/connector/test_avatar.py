@@ -49,7 +49,7 @@ def face_input_excited():
     return FaceInput(action=FaceAction.EXCITED)
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def mock_zenoh_modules():
     """Mock zenoh modules before imports."""
     with patch.dict(
@@ -169,6 +169,22 @@ class TestFaceAvatarConnector:
                 "Excited"
             )
 
+    @pytest.mark.asyncio
+    async def test_connect_unknown_action(self, default_config, caplog):
+        """Test connect with an action that has no avatar command."""
+        with patch(
+            "actions.face.connector.avatar.AvatarProvider"
+        ) as mock_avatar_provider_class:
+            mock_provider_instance = Mock()
+            mock_avatar_provider_class.return_value = mock_provider_instance
+
+            connector = FaceAvatarConnector(default_config)
+            with caplog.at_level("WARNING"):
+                await connector.connect(FaceInput(action="wink"))  # type: ignore
+
+            mock_provider_instance.send_avatar_command.assert_not_called()
+            assert "Failed to send avatar face command" in caplog.text
+
     def test_stop(self, default_config):
         """Test stop method."""
         with patch(
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 import requests as req
@@ -9,14 +9,16 @@ from actions.gps.connector.fabric import (  # noqa: E402
 )
 from actions.gps.interface import GPSAction, GPSInput  # noqa: E402
 
+GPS_VARIABLES = {"latitude": 37.7749, "longitude": -122.4194, "yaw_deg": 90.0}
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def default_config():
     """Create a default config for testing."""
     return GPSFabricConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def custom_config():
     """Create a custom config for testing."""
     return GPSFabricConfig(fabric_endpoint="http://custom:8080")
@@ -34,17 +36,18 @@ def gps_input_idle():
     return GPSInput(action=GPSAction.IDLE)
 
 
-@pytest.fixture(scope="session", autouse=True)
-def mock_zenoh_modules():
-    """Mock zenoh modules before imports."""
-    with patch.dict(
-        "sys.modules",
-        {
-            "zenoh": MagicMock(),
-            "zenoh_msgs": MagicMock(),
-        },
-    ):
-        yield
+@pytest.fixture(scope="module", autouse=True)
+def _patch_io_provider():
+    """Patch IOProvider once for the whole module."""
+    with patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class:
+        yield mock_io_provider_class
+
+
+@pytest.fixture
+def mock_io_provider_class(_patch_io_provider):
+    """Reset the IOProvider patch so each test gets a fresh instance."""
+    _patch_io_provider.reset_mock(return_value=True, side_effect=True)
+    return _patch_io_provider
 
 
 class TestGPSFabricConfig:
@@ -64,67 +67,45 @@ class TestGPSFabricConfig:
 class TestGPSFabricConnector:
     """Test the GPS Fabric connector."""
 
-    def test_init(self, default_config):
+    def test_init(self, default_config, mock_io_provider_class):
         """Test initialization of GPSFabricConnector."""
-        with patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class:
-            mock_io_instance = Mock()
-            mock_io_provider_class.return_value = mock_io_instance
-
-            connector = GPSFabricConnector(default_config)
+        connector = GPSFabricConnector(default_config)
 
-            mock_io_provider_class.assert_called_once()
-            assert connector.io_provider is not None
-            assert connector.fabric_endpoint == "http://localhost:8545"
+        mock_io_provider_class.assert_called_once()
+        assert connector.io_provider is not None
+        assert connector.fabric_endpoint == "http://localhost:8545"
 
-    def test_init_with_custom_config(self, custom_config):
+    def test_init_with_custom_config(self, custom_config, mock_io_provider_class):
         """Test initialization with custom configuration."""
-        with patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class:
-            mock_io_instance = Mock()
-            mock_io_provider_class.return_value = mock_io_instance
+        connector = GPSFabricConnector(custom_config)
 
-            connector = GPSFabricConnector(custom_config)
+        assert connector.fabric_endpoint == "http://custom:8080"
 
-            assert connector.fabric_endpoint == "http://custom:8080"
-
-    @pytest.mark.asyncio
-    async def test_connect_share_location(self, default_config, gps_input_share):
+    async def test_connect_share_location(
+        self, default_config, gps_input_share, mock_io_provider_class
+    ):
         """Test connect with share location action."""
-        with patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class:
-            mock_io_instance = Mock()
-            mock_io_provider_class.return_value = mock_io_instance
+        connector = GPSFabricConnector(default_config)
 
-            connector = GPSFabricConnector(default_config)
+        with patch.object(connector, "send_coordinates") as mock_send:
+            await connector.connect(gps_input_share)
+            mock_send.assert_called_once()
 
-            with patch.object(connector, "send_coordinates") as mock_send:
-                await connector.connect(gps_input_share)
-                mock_send.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_connect_idle(self, default_config, gps_input_idle):
+    async def test_connect_idle(
+        self, default_config, gps_input_idle, mock_io_provider_class
+    ):
         """Test connect with idle action does not send coordinates."""
-        with patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class:
-            mock_io_instance = Mock()
-            mock_io_provider_class.return_value = mock_io_instance
+        connector = GPSFabricConnector(default_config)
 
-            connector = GPSFabricConnector(default_config)
-
-            with patch.object(connector, "send_coordinates") as mock_send:
-                await connector.connect(gps_input_idle)
-                mock_send.assert_not_called()
+        with patch.object(connector, "send_coordinates") as mock_send:
+            await connector.connect(gps_input_idle)
+            mock_send.assert_not_called()
 
-    def test_send_coordinates_success(self, default_config):
+    def test_send_coordinates_success(self, default_config, mock_io_provider_class):
         """Test send_coordinates with successful response."""
-        with (
-            patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class,
-            patch("actions.gps.connector.fabric.requests") as mock_requests,
-        ):
-            mock_io_instance = Mock()
-            mock_io_instance.get_dynamic_variable.side_effect = lambda x: {
-                "latitude": 37.7749,
-                "longitude": -122.4194,
-                "yaw_deg": 90.0,
-            }.get(x)
-            mock_io_provider_class.return_value = mock_io_instance
+        with patch("actions.gps.connector.fabric.requests") as mock_requests:
+            mock_io_instance = mock_io_provider_class.return_value
+            mock_io_instance.get_dynamic_variable.side_effect = GPS_VARIABLES.get
 
             mock_response = Mock()
             mock_response.json.return_value = {"result": True}
@@ -138,15 +119,13 @@ class TestGPSFabricConnector:
             assert call_args[0][0] == "http://localhost:8545"
             assert call_args[1]["json"]["method"] == "omp2p_shareStatus"
 
-    def test_send_coordinates_no_coordinates(self, default_config):
+    def test_send_coordinates_no_coordinates(
+        self, default_config, mock_io_provider_class
+    ):
         """Test send_coordinates when no coordinates available."""
-        with (
-            patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class,
-            patch("actions.gps.connector.fabric.requests") as mock_requests,
-        ):
-            mock_io_instance = Mock()
+        with patch("actions.gps.connector.fabric.requests") as mock_requests:
+            mock_io_instance = mock_io_provider_class.return_value
             mock_io_instance.get_dynamic_variable.return_value = None
-            mock_io_provider_class.return_value = mock_io_instance
 
             connector = GPSFabricConnector(default_config)
             result = connector.send_coordinates()
@@ -154,19 +133,13 @@ class TestGPSFabricConnector:
             assert result is None
             mock_requests.post.assert_not_called()
 
-    def test_send_coordinates_request_failure(self, default_config):
+    def test_send_coordinates_request_failure(
+        self, default_config, mock_io_provider_class
+    ):
         """Test send_coordinates handles request exception."""
-        with (
-            patch("actions.gps.connector.fabric.IOProvider") as mock_io_provider_class,
-            patch("actions.gps.connector.fabric.requests") as mock_requests,
-        ):
-            mock_io_instance = Mock()
-            mock_io_instance.get_dynamic_variable.side_effect = lambda x: {
-                "latitude": 37.7749,
-                "longitude": -122.4194,
-                "yaw_deg": 90.0,
-            }.get(x)
-            mock_io_provider_class.return_value = mock_io_instance
+        with patch("actions.gps.connector.fabric.requests") as mock_requests:
+            mock_io_instance = mock_io_provider_class.return_value
+            mock_io_instance.get_dynamic_variable.side_effect = GPS_VARIABLES.get
 
             mock_requests.post.side_effect = req.RequestException("Connection error")
             mock_requests.RequestException = req.RequestException
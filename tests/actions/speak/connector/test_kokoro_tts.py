@@ -1,6 +1,5 @@
-import sys
-import time
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
 
@@ -12,35 +11,13 @@ from actions.speak.interface import SpeakInput  # noqa: E402
 from zenoh_msgs import AudioStatus, String  # noqa: E402
 
 
-@pytest.fixture(autouse=True, scope="session")
-def mock_zenoh_module():
-    """Mock the zenoh module before any imports."""
-    mock_zenoh = MagicMock()
-    mock_zenoh.Sample = MagicMock
-    sys.modules["zenoh"] = mock_zenoh
-    yield mock_zenoh
-    if "zenoh" in sys.modules:
-        del sys.modules["zenoh"]
-
-
-@pytest.fixture(autouse=True, scope="session")
-def mock_om1_speech_module():
-    """Mock the om1_speech module before any imports."""
-    mock_om1_speech = MagicMock()
-    mock_om1_speech.AudioOutputLiveStream = MagicMock()
-    sys.modules["om1_speech"] = mock_om1_speech
-    yield mock_om1_speech
-    if "om1_speech" in sys.modules:
-        del sys.modules["om1_speech"]
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_config():
     """Create a default config for testing."""
     return SpeakKokoroTTSConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def custom_config():
     """Create a custom config for testing."""
     return SpeakKokoroTTSConfig(
@@ -73,67 +50,69 @@ def mock_zenoh_session():
 @pytest.fixture
 def mock_zenoh_sample():
     """Create a mock Zenoh sample."""
-    sample = Mock()
-    sample.payload.to_bytes.return_value = b"test_data"
-    return sample
+    return SimpleNamespace(payload=SimpleNamespace(to_bytes=lambda: b"test_data"))
 
 
-@pytest.fixture
-def mock_tts_status_header():
-    """Create a mock TTS status header."""
-    header = Mock()
-    header.frame_id = "test_frame"
-    return header
+@pytest.fixture(scope="module")
+def _kokoro_patches():
+    """Patch the connector dependencies once for the whole module."""
+    with patch.multiple(
+        "actions.speak.connector.kokoro_tts",
+        spec=True,
+        open_zenoh_session=DEFAULT,
+        KokoroTTSProvider=DEFAULT,
+        IOProvider=DEFAULT,
+        TeleopsConversationProvider=DEFAULT,
+    ) as mocks:
+        yield mocks
 
 
-@pytest.fixture(autouse=True)
-def reset_mocks(mock_om1_speech_module, mock_zenoh_module):
-    """Reset all mock objects between tests."""
-    mock_om1_speech_module.AudioOutputLiveStream.reset_mock()
-    mock_om1_speech_module.AudioOutputLiveStream.return_value = MagicMock()
-    mock_zenoh_module.reset_mock()
-    yield
+@pytest.fixture
+def common_mocks(_kokoro_patches, mock_zenoh_session):
+    """Provide commonly used mocks for connector tests, reset for each test."""
+    for mock in _kokoro_patches.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    _kokoro_patches["open_zenoh_session"].return_value = mock_zenoh_session
+    mock_tts_instance = Mock()
+    _kokoro_patches["KokoroTTSProvider"].return_value = mock_tts_instance
+
+    return {
+        "open_zenoh_session": _kokoro_patches["open_zenoh_session"],
+        "tts_provider": _kokoro_patches["KokoroTTSProvider"],
+        "tts_instance": mock_tts_instance,
+        "io_provider": _kokoro_patches["IOProvider"],
+        "conversation_provider": _kokoro_patches["TeleopsConversationProvider"],
+        "zenoh_session": mock_zenoh_session,
+    }
+
+
+@pytest.fixture(scope="class")
+def _tts_status_patches():
+    """Patch the TTS status message types once for the connector tests."""
+    with patch.multiple(
+        "actions.speak.connector.kokoro_tts",
+        TTSStatusRequest=DEFAULT,
+        TTSStatusResponse=DEFAULT,
+    ) as mocks:
+        yield mocks
 
 
 @pytest.fixture
-def common_mocks(mock_zenoh_session):
-    """Provide commonly used mocks for connector tests."""
-    with (
-        patch(
-            "actions.speak.connector.kokoro_tts.open_zenoh_session"
-        ) as mock_open_zenoh,
-        patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider") as mock_tts,
-        patch("actions.speak.connector.kokoro_tts.IOProvider") as mock_io,
-        patch(
-            "actions.speak.connector.kokoro_tts.TeleopsConversationProvider"
-        ) as mock_conv,
-    ):
-
-        mock_open_zenoh.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts.return_value = mock_tts_instance
-
-        yield {
-            "open_zenoh_session": mock_open_zenoh,
-            "tts_provider": mock_tts,
-            "tts_instance": mock_tts_instance,
-            "io_provider": mock_io,
-            "conversation_provider": mock_conv,
-            "zenoh_session": mock_zenoh_session,
-        }
+def tts_status_types(_tts_status_patches):
+    """Provide the patched TTS status message types, reset for each test."""
+    for mock in _tts_status_patches.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _tts_status_patches
 
 
 def create_tts_status_mock(code, request_id="test_request_id", frame_id="test_frame"):
-    """Helper to create TTS status mock objects."""
-    header = Mock()
-    header.frame_id = frame_id
-
-    tts_status = Mock()
-    tts_status.code = code
-    tts_status.request_id = String(request_id)
-    tts_status.header = header
-
-    return tts_status
+    """Helper to create TTS status request objects."""
+    return SimpleNamespace(
+        code=code,
+        request_id=String(request_id),
+        header=SimpleNamespace(frame_id=frame_id),
+    )
 
 
 class TestSpeakKokoroTTSConfig:
@@ -225,7 +204,6 @@ class TestSpeakKokoroTTSConnector:
         assert connector.session is None
         assert connector.audio_pub is None
 
-    @pytest.mark.asyncio
     async def test_connect_tts_enabled(self, default_config, common_mocks, speak_input):
         """Test connect method when TTS is enabled."""
         common_mocks["tts_instance"].create_pending_message.return_value = {
@@ -256,7 +234,6 @@ class TestSpeakKokoroTTSConnector:
         )
         mock_audio_pub.put.assert_called()
 
-    @pytest.mark.asyncio
     async def test_connect_tts_disabled(
         self, default_config, common_mocks, speak_input
     ):
@@ -268,7 +245,6 @@ class TestSpeakKokoroTTSConnector:
 
         common_mocks["tts_instance"].create_pending_message.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_connect_silence_rate_skip(self, common_mocks, speak_input):
         """Test connect method with silence rate causing skip."""
         config = SpeakKokoroTTSConfig(silence_rate=2)
@@ -296,7 +272,6 @@ class TestSpeakKokoroTTSConnector:
         assert connector.silence_counter == 0
         common_mocks["tts_instance"].create_pending_message.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_connect_without_audio_publisher(
         self, default_config, common_mocks, speak_input
     ):
@@ -357,7 +332,13 @@ class TestSpeakKokoroTTSConnector:
         ],
     )
     def test_zenoh_tts_status_request_enable_disable(
-        self, default_config, common_mocks, mock_zenoh_sample, code, expected_enabled
+        self,
+        default_config,
+        common_mocks,
+        mock_zenoh_sample,
+        tts_status_types,
+        code,
+        expected_enabled,
     ):
         """Test TTS status request to enable/disable TTS."""
         mock_response_pub = Mock()
@@ -367,21 +348,16 @@ class TestSpeakKokoroTTSConnector:
 
         tts_status = create_tts_status_mock(code)
 
-        with (
-            patch(
-                "actions.speak.connector.kokoro_tts.TTSStatusRequest"
-            ) as mock_request_class,
-            patch("actions.speak.connector.kokoro_tts.TTSStatusResponse"),
-        ):
-            mock_request_class.deserialize.return_value = tts_status
+        mock_request_class = tts_status_types["TTSStatusRequest"]
+        mock_request_class.deserialize.return_value = tts_status
 
-            connector._zenoh_tts_status_request(mock_zenoh_sample)
+        connector._zenoh_tts_status_request(mock_zenoh_sample)
 
-            assert connector.tts_enabled is expected_enabled
-            mock_response_pub.put.assert_called_once()
+        assert connector.tts_enabled is expected_enabled
+        mock_response_pub.put.assert_called_once()
 
     def test_zenoh_tts_status_request_read(
-        self, default_config, common_mocks, mock_zenoh_sample
+        self, default_config, common_mocks, mock_zenoh_sample, tts_status_types
     ):
         """Test TTS status request to read current status."""
         mock_response_pub = Mock()
@@ -391,21 +367,16 @@ class TestSpeakKokoroTTSConnector:
 
         tts_status = create_tts_status_mock(2)  # Read status
 
-        with (
-            patch(
-                "actions.speak.connector.kokoro_tts.TTSStatusRequest"
-            ) as mock_request_class,
-            patch("actions.speak.connector.kokoro_tts.TTSStatusResponse"),
-        ):
-            mock_request_class.deserialize.return_value = tts_status
+        mock_request_class = tts_status_types["TTSStatusRequest"]
+        mock_request_class.deserialize.return_value = tts_status
 
-            connector._zenoh_tts_status_request(mock_zenoh_sample)
+        connector._zenoh_tts_status_request(mock_zenoh_sample)
 
-            assert connector.tts_enabled is True
-            mock_response_pub.put.assert_called_once()
+        assert connector.tts_enabled is True
+        mock_response_pub.put.assert_called_once()
 
     def test_zenoh_tts_status_request_null_publisher(
-        self, default_config, common_mocks, mock_zenoh_sample
+        self, default_config, common_mocks, mock_zenoh_sample, tts_status_types
     ):
         """Test TTS status request when response publisher is None."""
         connector = SpeakKokoroTTSConnector(default_config)
@@ -413,35 +384,26 @@ class TestSpeakKokoroTTSConnector:
 
         tts_status = create_tts_status_mock(1)  # Enable TTS
 
-        with (
-            patch(
-                "actions.speak.connector.kokoro_tts.TTSStatusRequest"
-            ) as mock_request_class,
-            patch("actions.speak.connector.kokoro_tts.TTSStatusResponse"),
-        ):
-            mock_request_class.deserialize.return_value = tts_status
+        mock_request_class = tts_status_types["TTSStatusRequest"]
+        mock_request_class.deserialize.return_value = tts_status
 
-            connector._zenoh_tts_status_request(mock_zenoh_sample)
+        connector._zenoh_tts_status_request(mock_zenoh_sample)
 
-            assert connector.tts_enabled is True
+        assert connector.tts_enabled is True
 
     def test_zenoh_tts_status_request_error_handling(
-        self, default_config, common_mocks, mock_zenoh_sample
+        self, default_config, common_mocks, mock_zenoh_sample, tts_status_types
     ):
         """Test error handling in _zenoh_tts_status_request."""
         connector = SpeakKokoroTTSConnector(default_config)
         original_tts_enabled = connector.tts_enabled
 
-        with patch(
-            "actions.speak.connector.kokoro_tts.TTSStatusRequest"
-        ) as mock_request_class:
-            mock_request_class.deserialize.side_effect = Exception(
-                "Deserialization error"
-            )
+        mock_request_class = tts_status_types["TTSStatusRequest"]
+        mock_request_class.deserialize.side_effect = Exception("Deserialization error")
 
-            connector._zenoh_tts_status_request(mock_zenoh_sample)
+        connector._zenoh_tts_status_request(mock_zenoh_sample)
 
-            assert connector.tts_enabled == original_tts_enabled
+        assert connector.tts_enabled == original_tts_enabled
 
     def test_stop(self, default_config, common_mocks):
         """Test stopping the connector."""
@@ -474,11 +436,11 @@ class TestSpeakKokoroTTSConnector:
 
     def test_last_voice_command_time_initialization(self, default_config, common_mocks):
         """Test that last_voice_command_time is initialized."""
-        start_time = time.time()
-        connector = SpeakKokoroTTSConnector(default_config)
-        end_time = time.time()
+        with patch("actions.speak.connector.kokoro_tts.time") as mock_time:
+            mock_time.time.return_value = 1234567890.0
+            connector = SpeakKokoroTTSConnector(default_config)
 
-        assert start_time <= connector.last_voice_command_time <= end_time
+        assert connector.last_voice_command_time == 1234567890.0
 
     @patch("actions.speak.connector.kokoro_tts.uuid4")
     def test_audio_status_initialization(
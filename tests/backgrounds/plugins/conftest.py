@@ -0,0 +1,32 @@
+from contextlib import ExitStack
+from functools import cache
+from unittest.mock import MagicMock, create_autospec, patch
+
+import pytest
+
+
+@cache
+def _autospec_instance(provider_class) -> MagicMock:
+    """Build one specced instance per provider class for the whole session."""
+    return create_autospec(provider_class._singleton_class, instance=True)
+
+
+@pytest.fixture
+def patch_provider():
+    """
+    Patch a provider class in a background module for the duration of one test.
+
+    Call the returned function with the patch target and the provider class.
+    The mock class returns a specced provider instance, which is shared by
+    the tests and reset for each of them.
+    """
+    with ExitStack() as stack:
+
+        def _patch(target: str, provider_class) -> MagicMock:
+            mock_provider_class = stack.enter_context(patch(target))
+            instance = _autospec_instance(provider_class)
+            instance.reset_mock()
+            mock_provider_class.return_value = instance
+            return mock_provider_class
+
+        yield _patch
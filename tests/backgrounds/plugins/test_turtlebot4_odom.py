@@ -1,9 +1,21 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from backgrounds.plugins.turtlebot4_odom import (
     TurtleBot4Odom,
     TurtleBot4OdomConfig,
 )
+from providers.turtlebot4_odom_provider import TurtleBot4OdomProvider
+
+
+@pytest.fixture
+def mock_provider_class(patch_provider):
+    """Patch the provider class for each test."""
+    return patch_provider(
+        "backgrounds.plugins.turtlebot4_odom.TurtleBot4OdomProvider",
+        TurtleBot4OdomProvider,
+    )
 
 
 class TestTurtleBot4OdomConfig:
@@ -29,103 +41,47 @@ class TestTurtleBot4OdomConfig:
 class TestTurtleBot4Odom:
     """Test cases for TurtleBot4Odom."""
 
-    def test_initialization(self):
-        """Test background initialization."""
-        with patch(
-            "backgrounds.plugins.turtlebot4_odom.TurtleBot4OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = TurtleBot4OdomConfig(URID="test_robot")
-            background = TurtleBot4Odom(config)
-
-            assert background.config == config
-            assert background.URID == "test_robot"
-            assert background.odom_provider == mock_provider
-            mock_provider_class.assert_called_once_with("test_robot")
-
-    def test_initialization_with_empty_urid(self):
-        """Test background initialization with empty URID."""
-        with patch(
-            "backgrounds.plugins.turtlebot4_odom.TurtleBot4OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = TurtleBot4OdomConfig()
-            background = TurtleBot4Odom(config)
-
-            assert background.URID == ""
-            assert background.odom_provider == mock_provider
-            mock_provider_class.assert_called_once_with("")
-
-    def test_initialization_logging(self, caplog):
+    @pytest.mark.parametrize(
+        "urid", ["test_robot", "", "unique_robot_id_789", "robot_xyz"]
+    )
+    def test_initialization(self, mock_provider_class, urid):
+        """Test background initialization stores the config and starts the provider."""
+        config = TurtleBot4OdomConfig(URID=urid)
+        background = TurtleBot4Odom(config)
+
+        assert background.config is config
+        assert background.URID == urid
+        assert background.odom_provider == mock_provider_class.return_value
+        mock_provider_class.assert_called_once_with(urid)
+
+    def test_initialization_logging(self, mock_provider_class, caplog):
         """Test that initialization logs the correct message."""
-        with patch(
-            "backgrounds.plugins.turtlebot4_odom.TurtleBot4OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = TurtleBot4OdomConfig(URID="test_robot_123")
-            with caplog.at_level("INFO"):
-                TurtleBot4Odom(config)
-
-            assert (
-                "Initialized TurtleBot4 Odom Provider with URID: test_robot_123"
-                in caplog.text
-            )
-
-    def test_provider_initialization_with_correct_urid(self):
-        """Test that provider is initialized with the correct URID."""
-        with patch(
-            "backgrounds.plugins.turtlebot4_odom.TurtleBot4OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = TurtleBot4OdomConfig(URID="unique_robot_id_789")
-            background = TurtleBot4Odom(config)
-
-            # Verify provider was called with the exact URID from config
-            mock_provider_class.assert_called_once_with("unique_robot_id_789")
-            assert background.URID == "unique_robot_id_789"
-
-    def test_config_stored_correctly(self):
-        """Test that config is stored correctly in the background instance."""
-        with patch(
-            "backgrounds.plugins.turtlebot4_odom.TurtleBot4OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = TurtleBot4OdomConfig(URID="robot_xyz")
-            background = TurtleBot4Odom(config)
-
-            assert background.config is config
-            assert background.config.URID == "robot_xyz"
-
-    def test_multiple_instances_with_different_urids(self):
+        config = TurtleBot4OdomConfig(URID="test_robot_123")
+        with caplog.at_level("INFO"):
+            TurtleBot4Odom(config)
+
+        assert (
+            "Initialized TurtleBot4 Odom Provider with URID: test_robot_123"
+            in caplog.text
+        )
+
+    def test_multiple_instances_with_different_urids(self, mock_provider_class):
         """Test that multiple instances can be created with different URIDs."""
-        with patch(
-            "backgrounds.plugins.turtlebot4_odom.TurtleBot4OdomProvider"
-        ) as mock_provider_class:
-            mock_provider1 = MagicMock()
-            mock_provider2 = MagicMock()
-            mock_provider_class.side_effect = [mock_provider1, mock_provider2]
-
-            config1 = TurtleBot4OdomConfig(URID="robot_1")
-            config2 = TurtleBot4OdomConfig(URID="robot_2")
-
-            background1 = TurtleBot4Odom(config1)
-            background2 = TurtleBot4Odom(config2)
-
-            assert background1.URID == "robot_1"
-            assert background2.URID == "robot_2"
-            assert background1.odom_provider == mock_provider1
-            assert background2.odom_provider == mock_provider2
-
-            assert mock_provider_class.call_count == 2
-            mock_provider_class.assert_any_call("robot_1")
-            mock_provider_class.assert_any_call("robot_2")
+        mock_provider1 = MagicMock()
+        mock_provider2 = MagicMock()
+        mock_provider_class.side_effect = [mock_provider1, mock_provider2]
+
+        config1 = TurtleBot4OdomConfig(URID="robot_1")
+        config2 = TurtleBot4OdomConfig(URID="robot_2")
+
+        background1 = TurtleBot4Odom(config1)
+        background2 = TurtleBot4Odom(config2)
+
+        assert background1.URID == "robot_1"
+        assert background2.URID == "robot_2"
+        assert background1.odom_provider == mock_provider1
+        assert background2.odom_provider == mock_provider2
+
+        assert mock_provider_class.call_count == 2
+        mock_provider_class.assert_any_call("robot_1")
+        mock_provider_class.assert_any_call("robot_2")
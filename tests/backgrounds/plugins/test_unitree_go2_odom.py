@@ -1,9 +1,21 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from backgrounds.plugins.unitree_go2_odom import (
     UnitreeGo2Odom,
     UnitreeGo2OdomConfig,
 )
+from providers.unitree_go2_odom_provider import UnitreeGo2OdomProvider
+
+
+@pytest.fixture
+def mock_provider_class(patch_provider):
+    """Patch the provider class for each test."""
+    return patch_provider(
+        "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider",
+        UnitreeGo2OdomProvider,
+    )
 
 
 class TestUnitreeGo2OdomConfig:
@@ -29,110 +41,49 @@ class TestUnitreeGo2OdomConfig:
 class TestUnitreeGo2Odom:
     """Test cases for UnitreeGo2Odom."""
 
-    def test_initialization(self):
-        """Test background initialization."""
-        with patch(
-            "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = UnitreeGo2OdomConfig(unitree_ethernet="eth0")
-            background = UnitreeGo2Odom(config)
-
-            assert background.config == config
-            assert background.odom_provider == mock_provider
-            mock_provider_class.assert_called_once_with("eth0")
-
-    def test_initialization_with_none_ethernet(self):
-        """Test background initialization with None unitree_ethernet."""
-        with patch(
-            "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = UnitreeGo2OdomConfig()
-            background = UnitreeGo2Odom(config)
-
-            assert background.config.unitree_ethernet is None
-            assert background.odom_provider == mock_provider
-            mock_provider_class.assert_called_once_with(None)
-
-    def test_initialization_logging(self, caplog):
-        """Test that initialization logs the correct message."""
-        with patch(
-            "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
+    @pytest.mark.parametrize("ethernet", ["eth0", None, "enp2s0", "wlan0"])
+    def test_initialization(self, mock_provider_class, ethernet):
+        """Test background initialization stores the config and starts the provider."""
+        config = UnitreeGo2OdomConfig(unitree_ethernet=ethernet)
+        background = UnitreeGo2Odom(config)
+
+        assert background.config is config
+        assert background.odom_provider == mock_provider_class.return_value
+        mock_provider_class.assert_called_once_with(ethernet)
 
-            config = UnitreeGo2OdomConfig(unitree_ethernet="eth2")
-            with caplog.at_level("INFO"):
-                UnitreeGo2Odom(config)
+    def test_initialization_logging(self, mock_provider_class, caplog):
+        """Test that initialization logs the correct message."""
+        config = UnitreeGo2OdomConfig(unitree_ethernet="eth2")
+        with caplog.at_level("INFO"):
+            UnitreeGo2Odom(config)
 
-            assert "Initialized Unitree Go2 Odom Provider: eth2" in caplog.text
+        assert "Initialized Unitree Go2 Odom Provider: eth2" in caplog.text
 
-    def test_initialization_logging_with_none(self, caplog):
+    def test_initialization_logging_with_none(self, mock_provider_class, caplog):
         """Test that initialization logs correctly with None ethernet."""
-        with patch(
-            "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = UnitreeGo2OdomConfig()
-            with caplog.at_level("INFO"):
-                UnitreeGo2Odom(config)
-
-            assert "Initialized Unitree Go2 Odom Provider: None" in caplog.text
-
-    def test_provider_initialization_with_correct_ethernet(self):
-        """Test that provider is initialized with the correct ethernet channel."""
-        with patch(
-            "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
-
-            config = UnitreeGo2OdomConfig(unitree_ethernet="enp2s0")
+        config = UnitreeGo2OdomConfig()
+        with caplog.at_level("INFO"):
             UnitreeGo2Odom(config)
-            mock_provider_class.assert_called_once_with("enp2s0")
 
-    def test_config_stored_correctly(self):
-        """Test that config is stored correctly in the background instance."""
-        with patch(
-            "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider"
-        ) as mock_provider_class:
-            mock_provider = MagicMock()
-            mock_provider_class.return_value = mock_provider
+        assert "Initialized Unitree Go2 Odom Provider: None" in caplog.text
+
+    def test_multiple_instances_with_different_ethernet(self, mock_provider_class):
+        """Test that multiple instances can be created with different ethernet channels."""
+        mock_provider1 = MagicMock()
+        mock_provider2 = MagicMock()
+        mock_provider_class.side_effect = [mock_provider1, mock_provider2]
 
-            config = UnitreeGo2OdomConfig(unitree_ethernet="wlan0")
-            background = UnitreeGo2Odom(config)
+        config1 = UnitreeGo2OdomConfig(unitree_ethernet="eth0")
+        config2 = UnitreeGo2OdomConfig(unitree_ethernet="eth1")
 
-            assert background.config is config
-            assert background.config.unitree_ethernet == "wlan0"
+        background1 = UnitreeGo2Odom(config1)
+        background2 = UnitreeGo2Odom(config2)
 
-    def test_multiple_instances_with_different_ethernet(self):
-        """Test that multiple instances can be created with different ethernet channels."""
-        with patch(
-            "backgrounds.plugins.unitree_go2_odom.UnitreeGo2OdomProvider"
-        ) as mock_provider_class:
-            mock_provider1 = MagicMock()
-            mock_provider2 = MagicMock()
-            mock_provider_class.side_effect = [mock_provider1, mock_provider2]
-
-            config1 = UnitreeGo2OdomConfig(unitree_ethernet="eth0")
-            config2 = UnitreeGo2OdomConfig(unitree_ethernet="eth1")
-
-            background1 = UnitreeGo2Odom(config1)
-            background2 = UnitreeGo2Odom(config2)
-
-            assert background1.config.unitree_ethernet == "eth0"
-            assert background2.config.unitree_ethernet == "eth1"
-            assert background1.odom_provider == mock_provider1
-            assert background2.odom_provider == mock_provider2
-
-            assert mock_provider_class.call_count == 2
-            mock_provider_class.assert_any_call("eth0")
-            mock_provider_class.assert_any_call("eth1")
+        assert background1.config.unitree_ethernet == "eth0"
+        assert background2.config.unitree_ethernet == "eth1"
+        assert background1.odom_provider == mock_provider1
+        assert background2.odom_provider == mock_provider2
+
+        assert mock_provider_class.call_count == 2
+        mock_provider_class.assert_any_call("eth0")
+        mock_provider_class.assert_any_call("eth1")
@@ -0,0 +1,18 @@
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+# om1_speech is only installed on robots with audio hardware; stub it once
+# before any test module imports the TTS providers.
+try:
+    import om1_speech  # noqa: F401
+except ImportError:
+    mock_om1_speech = ModuleType("om1_speech")
+    for name in (
+        "AudioInputStream",
+        "AudioOutputLiveStream",
+        "AudioOutputStream",
+        "AudioRTSPInputStream",
+    ):
+        setattr(mock_om1_speech, name, MagicMock())
+    sys.modules["om1_speech"] = mock_om1_speech
@@ -0,0 +1,34 @@
+import asyncio
+from contextlib import ExitStack
+from unittest.mock import DEFAULT, patch
+
+import pytest
+
+
+@pytest.fixture
+def patch_providers():
+    """
+    Patch provider classes in an input module for the duration of one test.
+
+    Call the returned function with the module path and the names to patch.
+    It returns the mocks keyed by name, and every patch is undone when the
+    test ends.
+    """
+    with ExitStack() as stack:
+
+        def _patch(module: str, *names: str) -> dict:
+            return stack.enter_context(
+                patch.multiple(module, **{name: DEFAULT for name in names})
+            )
+
+        yield _patch
+
+
+async def _no_sleep(*args, **kwargs):
+    """Return immediately instead of sleeping."""
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make the inputs' poll delay return immediately."""
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
@@ -1,10 +1,17 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import openai
 import pytest
 from pydantic import BaseModel
 
 from llm.output_model import Action, CortexOutputModel
-from llm.plugins.near_ai_llm import NearAIConfig, NearAILLM
+from llm.plugins.near_ai_llm import (
+    _HTTP2_AVAILABLE,
+    NearAIConfig,
+    NearAILLM,
+    NearAIModel,
+)
 
 
 class DummyOutputModel(BaseModel):
@@ -134,6 +141,14 @@ class TestNearAILLMInit:
         assert llm._config.model is not None
         assert "gpt-oss-120b" in llm._config.model.lower()
 
+    def test_init_resolves_model_enum_to_string(self):
+        """Test an enum model is resolved to its plain string value once."""
+        config = NearAIConfig(api_key="test_key", model=NearAIModel.DEEPSEEK_V3_1)
+        llm = NearAILLM(config, available_actions=None)
+
+        assert llm._model_name == "deepseek-ai/DeepSeek-V3.1"
+        assert type(llm._model_name) is str
+
     def test_init_requires_api_key(self):
         """Test that initialization fails without API key."""
         config = NearAIConfig(base_url="test_url")
@@ -161,6 +176,30 @@ class TestNearAILLMInit:
             llm = NearAILLM(config, available_actions=[mock_action])
             assert len(llm.function_schemas) > 0
 
+    def test_init_uses_keepalive_http_client(self, config):
+        """Test the OpenAI client shares a keep-alive connection pool."""
+        with patch(
+            "llm.plugins.near_ai_llm.openai.DefaultAsyncHttpxClient",
+            wraps=openai.DefaultAsyncHttpxClient,
+        ) as mock_http_client:
+            llm = NearAILLM(config, available_actions=None)
+
+        kwargs = mock_http_client.call_args.kwargs
+        assert kwargs["http2"] is _HTTP2_AVAILABLE
+        assert kwargs["limits"] == httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=60,
+        )
+        assert llm._client._client is llm._http_client
+
+    @pytest.mark.asyncio
+    async def test_close(self, llm):
+        """Test close() closes the HTTP client."""
+        with patch.object(llm._http_client, "aclose", AsyncMock()) as mock_close:
+            await llm.close()
+            mock_close.assert_called_once()
+
 
 class TestNearAILLMAsk:
     """Tests for NearAILLM.ask() method."""
@@ -265,6 +304,29 @@ class TestNearAILLMAsk:
             assert formatted_messages[-1]["role"] == "user"
             assert formatted_messages[-1]["content"] == "test prompt"
 
+    @pytest.mark.asyncio
+    async def test_ask_formats_history_messages(self, llm, mock_response):
+        """Test ask() keeps history order and fills in missing roles."""
+        llm._skip_state_management = True
+        with pytest.MonkeyPatch.context() as m:
+            mock_parse = AsyncMock(return_value=mock_response)
+            m.setattr(llm._client.beta.chat.completions, "parse", mock_parse)
+
+            await llm.ask(
+                "test prompt",
+                messages=[
+                    {"role": "system", "content": "first"},
+                    {"content": "second"},
+                ],
+            )
+
+            formatted_messages = mock_parse.call_args.kwargs["messages"]
+            assert formatted_messages == [
+                {"role": "system", "content": "first"},
+                {"role": "user", "content": "second"},
+                {"role": "user", "content": "test prompt"},
+            ]
+
     @pytest.mark.asyncio
     async def test_ask_uses_correct_model(self, llm, mock_response):
         """Test ask() uses the configured model."""
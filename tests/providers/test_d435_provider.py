@@ -1,5 +1,8 @@
 import math
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from providers.d435_provider import D435Provider
@@ -123,3 +126,57 @@ def test_calculate_angle_and_distance_arbitrary_point(d435_provider):
 
     assert math.isclose(angle, expected_angle, abs_tol=1e-10)
     assert math.isclose(distance, expected_distance, abs_tol=1e-10)
+
+
+def test_obstacle_callback_stores_obstacle_rows(d435_provider):
+    """
+    Test the point cloud becomes rows of x, y, angle and distance.
+    """
+    cloud = SimpleNamespace(
+        points=[
+            SimpleNamespace(x=3.0, y=4.0, z=0.1),
+            SimpleNamespace(x=0.0, y=-6.0, z=0.2),
+        ]
+    )
+    sample = MagicMock()
+
+    with patch(
+        "providers.d435_provider.sensor_msgs.PointCloud.deserialize",
+        return_value=cloud,
+    ):
+        d435_provider.obstacle_callback(sample)
+
+    expected = [
+        [x, y, *d435_provider.calculate_angle_and_distance(x, y)]
+        for x, y in [(3.0, 4.0), (0.0, -6.0)]
+    ]
+    np.testing.assert_allclose(d435_provider.obstacle, expected)
+
+
+def test_obstacle_callback_empty_cloud(d435_provider):
+    """
+    Test an empty point cloud leaves no obstacles.
+    """
+    with patch(
+        "providers.d435_provider.sensor_msgs.PointCloud.deserialize",
+        return_value=SimpleNamespace(points=[]),
+    ):
+        d435_provider.obstacle_callback(MagicMock())
+
+    assert d435_provider.obstacle.shape == (0, 4)
+
+
+def test_stop_keeps_shared_session_open(d435_provider):
+    """
+    Test stopping undeclares the subscriber without closing the shared session.
+    """
+    subscriber = MagicMock()
+    d435_provider.running = True
+    d435_provider.session = MagicMock()
+    d435_provider.subscriber = subscriber
+
+    d435_provider.stop()
+
+    subscriber.undeclare.assert_called_once()
+    d435_provider.session.close.assert_not_called()
+    assert d435_provider.subscriber is None
@@ -1,9 +1,33 @@
+import asyncio
 import math
+import multiprocessing
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-from providers.odom_provider_base import OdomProviderBase, RobotState
+from pycdr2 import Endianness
+
+from providers.odom_provider_base import (
+    OdomProviderBase,
+    RobotState,
+    _yaw_from_quaternion,
+    odom_sample_from_cdr,
+    wait_for_sigterm,
+)
+from zenoh_msgs import (
+    Header,
+    Odometry,
+    Point,
+    Pose,
+    PoseWithCovariance,
+    Quaternion,
+    String,
+    Time,
+    Twist,
+    TwistWithCovariance,
+    Vector3,
+)
 
 
 class ConcreteOdomProvider(OdomProviderBase):
@@ -17,19 +41,97 @@ class ConcreteOdomProvider(OdomProviderBase):
 @pytest.fixture
 def mock_multiprocessing():
     """Mock multiprocessing and threading components."""
-    with (
-        patch("providers.odom_provider_base.mp.Queue") as mock_queue,
-        patch("providers.odom_provider_base.threading.Event") as mock_event,
-    ):
-        mock_queue_instance = MagicMock()
+    with patch("providers.odom_provider_base.threading.Event") as mock_event:
         mock_event_instance = MagicMock()
-
-        mock_queue.return_value = mock_queue_instance
         mock_event.return_value = mock_event_instance
-
         mock_event_instance.is_set.return_value = False
 
-        yield mock_queue, mock_queue_instance, mock_event, mock_event_instance
+        yield mock_event, mock_event_instance
+
+
+def run_until_drained(provider, mock_event_instance, *samples):
+    """Put samples into the ring and run process_odom until it is empty."""
+    for sample in samples:
+        provider.data_ring.put(*sample)
+
+    mock_event_instance.is_set.side_effect = lambda: len(provider.data_ring) == 0
+    provider.process_odom()
+
+
+def make_odometry(frame_id="odom", child_frame_id="base_link"):
+    """Build an Odometry message with a known stamp and pose."""
+    return Odometry(
+        header=Header(stamp=Time(sec=5, nanosec=7), frame_id=frame_id),
+        child_frame_id=String(data=child_frame_id),
+        pose=PoseWithCovariance(
+            pose=Pose(
+                position=Point(x=1.0, y=2.0, z=3.0),
+                orientation=Quaternion(x=0.1, y=0.2, z=0.3, w=0.4),
+            ),
+            covariance=[0.5] * 36,
+        ),
+        twist=TwistWithCovariance(
+            twist=Twist(
+                linear=Vector3(x=9.0, y=9.0, z=9.0),
+                angular=Vector3(x=9.0, y=9.0, z=9.0),
+            ),
+            covariance=[0.5] * 36,
+        ),
+    )
+
+
+class TestOdomSampleFromCdr:
+    """Test cases for the partial nav_msgs/Odometry decoder."""
+
+    EXPECTED = (5, 7, 0.1, 0.2, 0.3, 0.4, 1.0, 2.0, 3.0)
+
+    @pytest.mark.parametrize("frame_id", ["", "o", "odom", "map_frame"])
+    @pytest.mark.parametrize("child_frame_id", ["", "base", "base_link"])
+    def test_string_padding(self, frame_id, child_frame_id):
+        """Test the pose is found for every frame id alignment."""
+        payload = make_odometry(frame_id, child_frame_id).serialize()
+
+        assert odom_sample_from_cdr(payload) == self.EXPECTED
+
+    def test_big_endian(self):
+        """Test big endian payloads are decoded."""
+        payload = make_odometry().serialize(endianness=Endianness.Big)
+
+        assert odom_sample_from_cdr(payload) == self.EXPECTED
+
+    def test_memoryview_payload(self):
+        """Test the payload can be read in place through a memoryview."""
+        payload = memoryview(make_odometry().serialize())
+
+        assert odom_sample_from_cdr(payload) == self.EXPECTED
+
+    def test_xcdr2_memoryview_falls_back_to_full_deserialize(self):
+        """Test the full deserialization fallback also accepts a memoryview."""
+        payload = memoryview(make_odometry().serialize(use_version_2=True))
+
+        assert odom_sample_from_cdr(payload) == self.EXPECTED
+
+    def test_xcdr2_falls_back_to_full_deserialize(self):
+        """Test payloads in another encoding fall back to full deserialization."""
+        payload = make_odometry().serialize(use_version_2=True)
+
+        assert odom_sample_from_cdr(payload) == self.EXPECTED
+
+
+class TestWaitForSigterm:
+    """Test cases for wait_for_sigterm."""
+
+    def test_reader_process_exits_cleanly_on_terminate(self):
+        """Test a terminated reader process returns instead of being killed."""
+        process = multiprocessing.Process(target=wait_for_sigterm, daemon=True)
+        process.start()
+
+        # give the child time to install its handler
+        time.sleep(0.5)
+        process.terminate()
+        process.join(timeout=5)
+
+        assert process.exitcode == 0
 
 
 class TestRobotState:
@@ -66,6 +168,19 @@ class TestOdomProviderBase:
         assert provider.odom_rockchip_ts == 0.0
         assert provider.odom_subscriber_ts == 0.0
 
+    def test_yaw_from_quaternion_matches_euler(self, mock_multiprocessing):
+        """Test the yaw-only helper agrees with euler_from_quaternion."""
+        provider = ConcreteOdomProvider()
+
+        for x, y, z, w in [
+            (0.0, 0.0, 0.0, 1.0),
+            (0.0, 0.0, 0.7071, 0.7071),
+            (0.1, -0.2, 0.9, 0.3),
+            (0.5, 0.5, -0.5, 0.5),
+        ]:
+            _, _, yaw = provider.euler_from_quaternion(x, y, z, w)
+            assert _yaw_from_quaternion(x, y, z, w) == yaw
+
     def test_euler_from_quaternion_identity(self, mock_multiprocessing):
         """Test euler conversion with identity quaternion."""
         provider = ConcreteOdomProvider()
@@ -102,6 +217,27 @@ class TestOdomProviderBase:
         assert abs(pitch) < 1e-6
         assert abs(abs(yaw) - math.pi) < 1e-6  # 180 degrees in radians
 
+    @pytest.mark.parametrize(
+        "yaw_rad, expected_m180_p180, expected_0_360",
+        [
+            (0.0, 0.0, 0.0),
+            (0.5, 28.6479, 331.3521),
+            (-0.5, -28.6479, 28.6479),
+            (math.pi, 180.0, 180.0),
+        ],
+    )
+    def test_yaw_is_wrapped_to_0_360_clockwise(
+        self, mock_multiprocessing, yaw_rad, expected_m180_p180, expected_0_360
+    ):
+        """Test the clockwise 0-360 yaw is derived from the standard yaw."""
+        provider = ConcreteOdomProvider()
+        z, w = math.sin(yaw_rad / 2), math.cos(yaw_rad / 2)
+
+        provider._process_samples([(100, 0, 0.0, 0.0, z, w, 0.0, 0.0, 0.0)])
+
+        assert provider.odom_yaw_m180_p180 == pytest.approx(expected_m180_p180)
+        assert provider.odom_yaw_0_360 == pytest.approx(expected_0_360)
+
     def test_position_property(self, mock_multiprocessing):
         """Test position property returns correct dictionary."""
         provider = ConcreteOdomProvider()
@@ -138,6 +274,10 @@ class TestOdomProviderBase:
         provider.body_height_cm = 30
         provider.body_attitude = RobotState.STANDING
 
+        # Readers keep seeing the last snapshot until it is published
+        assert provider.position["odom_x"] == 0.0
+
+        provider._publish_position()
         position = provider.position
 
         assert position["odom_x"] == 1.5
@@ -150,162 +290,208 @@ class TestOdomProviderBase:
 
     def test_process_odom_stops_on_event(self, mock_multiprocessing):
         """Test process_odom stops when stop event is set."""
-        _, mock_queue_instance, _, mock_event_instance = mock_multiprocessing
+        _, mock_event_instance = mock_multiprocessing
 
         provider = ConcreteOdomProvider()
+        provider.data_ring.put(100, 0, 0.0, 0.0, 0.0, 1.0, 1.0, 2.0, 0.0)
 
         mock_event_instance.is_set.return_value = True
 
         provider.process_odom()
 
-        mock_queue_instance.get.assert_not_called()
-
-    def test_process_odom_with_pose_data(self, mock_multiprocessing):
-        """Test process_odom processes pose data correctly."""
-        _, mock_queue_instance, _, mock_event_instance = mock_multiprocessing
+        assert len(provider.data_ring) == 1
+        assert provider.x == 0.0
 
+    def test_process_odom_exits_when_ring_closed(self):
+        """Test a processor blocked on an empty ring returns once it is closed."""
         provider = ConcreteOdomProvider()
 
-        mock_pose_data = MagicMock()
-        mock_pose_data.pose.position.x = 1.0
-        mock_pose_data.pose.position.y = 2.0
-        mock_pose_data.pose.position.z = 0.0
-        mock_pose_data.pose.orientation.x = 0.0
-        mock_pose_data.pose.orientation.y = 0.0
-        mock_pose_data.pose.orientation.z = 0.0
-        mock_pose_data.pose.orientation.w = 1.0
-        mock_pose_data.header.stamp.sec = 100
-        mock_pose_data.header.stamp.nanosec = 500000000
-        del mock_pose_data.pose.pose
-
-        call_count = [0]
+        processor = threading.Thread(target=provider.process_odom, daemon=True)
+        processor.start()
+        provider.data_ring.close()
+        processor.join(timeout=1)
 
-        def side_effect_get(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_pose_data
-            raise Exception("Queue timeout")
+        assert not processor.is_alive()
 
-        def side_effect_is_set():
-            return call_count[0] > 0
+    def test_process_odom_with_pose_data(self, mock_multiprocessing):
+        """Test process_odom processes pose data correctly."""
+        _, mock_event_instance = mock_multiprocessing
 
-        mock_queue_instance.get.side_effect = side_effect_get
-        mock_event_instance.is_set.side_effect = side_effect_is_set
+        provider = ConcreteOdomProvider()
 
         with patch("providers.odom_provider_base.time.time", return_value=1000.0):
-            provider.process_odom()
+            run_until_drained(
+                provider,
+                mock_event_instance,
+                (100, 500000000, 0.0, 0.0, 0.0, 1.0, 1.0, 2.0, 0.0),
+            )
 
         assert provider.x == 1.0
         assert provider.y == 2.0
         assert provider.odom_rockchip_ts == 100.5
 
-    def test_process_odom_with_pose_with_covariance(self, mock_multiprocessing):
-        """Test process_odom handles PoseWithCovarianceStamped format."""
-        _, mock_queue_instance, _, mock_event_instance = mock_multiprocessing
+    def test_process_odom_sets_timestamps(self, mock_multiprocessing):
+        """Test process_odom records publisher and subscriber timestamps."""
+        _, mock_event_instance = mock_multiprocessing
 
         provider = ConcreteOdomProvider()
 
-        mock_pose_data = MagicMock()
-        mock_pose_data.pose.pose.position.x = 1.5
-        mock_pose_data.pose.pose.position.y = 2.5
-        mock_pose_data.pose.pose.position.z = 0.0
-        mock_pose_data.pose.pose.orientation.x = 0.0
-        mock_pose_data.pose.pose.orientation.y = 0.0
-        mock_pose_data.pose.pose.orientation.z = 0.0
-        mock_pose_data.pose.pose.orientation.w = 1.0
-        mock_pose_data.header.stamp.sec = 200
-        mock_pose_data.header.stamp.nanosec = 0
-
-        call_count = [0]
-
-        def side_effect_get(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_pose_data
-            raise Exception("Queue timeout")
-
-        def side_effect_is_set():
-            return call_count[0] > 0
-
-        mock_queue_instance.get.side_effect = side_effect_get
-        mock_event_instance.is_set.side_effect = side_effect_is_set
-
         with patch("providers.odom_provider_base.time.time", return_value=2000.0):
-            provider.process_odom()
+            run_until_drained(
+                provider,
+                mock_event_instance,
+                (200, 0, 0.0, 0.0, 0.0, 1.0, 1.5, 2.5, 0.0),
+            )
 
         assert provider.x == 1.5
         assert provider.y == 2.5
         assert provider.odom_rockchip_ts == 200.0
         assert provider.odom_subscriber_ts == 2000.0
 
+    def test_timestamps_are_unix_time(self, mock_multiprocessing):
+        """Test both timestamps are unix time, not a monotonic clock."""
+        provider = ConcreteOdomProvider()
+
+        before = time.time()
+        provider._process_samples(
+            [(1700000000, 123456789, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)]
+        )
+
+        assert provider.odom_rockchip_ts == pytest.approx(1700000000.123456789)
+        assert before <= provider.odom_subscriber_ts <= time.time()
+
     def test_process_odom_detects_movement(self, mock_multiprocessing):
         """Test process_odom detects robot movement."""
-        _, mock_queue_instance, _, mock_event_instance = mock_multiprocessing
+        _, mock_event_instance = mock_multiprocessing
 
         provider = ConcreteOdomProvider()
 
-        mock_pose_data1 = MagicMock()
-        mock_pose_data1.pose.position.x = 0.0
-        mock_pose_data1.pose.position.y = 0.0
-        mock_pose_data1.pose.position.z = 0.0
-        mock_pose_data1.pose.orientation.x = 0.0
-        mock_pose_data1.pose.orientation.y = 0.0
-        mock_pose_data1.pose.orientation.z = 0.0
-        mock_pose_data1.pose.orientation.w = 1.0
-        mock_pose_data1.header.stamp.sec = 100
-        mock_pose_data1.header.stamp.nanosec = 0
-        del mock_pose_data1.pose.pose
-
-        mock_pose_data2 = MagicMock()
-        mock_pose_data2.pose.position.x = 0.5  # Significant movement
-        mock_pose_data2.pose.position.y = 0.5
-        mock_pose_data2.pose.position.z = 0.0
-        mock_pose_data2.pose.orientation.x = 0.0
-        mock_pose_data2.pose.orientation.y = 0.0
-        mock_pose_data2.pose.orientation.z = 0.0
-        mock_pose_data2.pose.orientation.w = 1.0
-        mock_pose_data2.header.stamp.sec = 101
-        mock_pose_data2.header.stamp.nanosec = 0
-        del mock_pose_data2.pose.pose
-
-        call_count = [0]
-
-        def side_effect_get(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_pose_data1
-            elif call_count[0] == 2:
-                return mock_pose_data2
-            raise Exception("Queue timeout")
-
-        def side_effect_is_set():
-            return call_count[0] > 1
-
-        mock_queue_instance.get.side_effect = side_effect_get
-        mock_event_instance.is_set.side_effect = side_effect_is_set
-
         with patch("providers.odom_provider_base.time.time", return_value=1000.0):
-            provider.process_odom()
+            run_until_drained(
+                provider,
+                mock_event_instance,
+                (100, 0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0),
+                (101, 0, 0.0, 0.0, 0.0, 1.0, 0.5, 0.5, 0.0),
+            )
 
         # After significant movement, should be detected as moving
         assert provider.moving is True
 
+    def test_moving_logged_only_on_transition(self, mock_multiprocessing, caplog):
+        """Test the moving state is logged when it changes, not on every sample."""
+        provider = ConcreteOdomProvider()
+
+        with caplog.at_level("INFO"):
+            for px in (0.5, 1.0, 1.5):
+                provider._process_samples([(100, 0, 0.0, 0.0, 0.0, 1.0, px, 0.0, 0.0)])
+            for _ in range(10):
+                provider._process_samples([(100, 0, 0.0, 0.0, 0.0, 1.0, 1.5, 0.0, 0.0)])
+
+        messages = [r.getMessage() for r in caplog.records if "moving:" in r.message]
+        assert len(messages) == 2
+        assert messages[0].startswith("moving: True")
+        assert messages[1].startswith("moving: False")
+
+    def test_unchanged_pose_only_decays_history(self, mock_multiprocessing):
+        """Test a repeated pose decays the history exactly like a zero delta."""
+        provider = ConcreteOdomProvider()
+        provider._process_samples([(100, 0, 0.0, 0.0, 0.0, 1.0, 0.5, 0.0, 0.0)])
+        history = provider.move_history
+
+        provider._process_samples([(100, 1, 0.0, 0.0, 0.0, 1.0, 0.5, 0.0, 0.0)])
+
+        assert provider.move_history == pytest.approx(0.3 * history)
+        assert provider.moving is True
+
+    def test_process_odom_batch_matches_sequential(self, mock_multiprocessing):
+        """Test a drained batch gives the same decay kernel as one-by-one updates."""
+        _, mock_event_instance = mock_multiprocessing
+
+        positions = [(0.0, 0.0), (0.02, 0.0), (0.05, 0.01), (0.05, 0.01)]
+
+        expected = 0.0
+        previous = (0.0, 0.0)
+        for px, py in positions:
+            delta = math.hypot(px - previous[0], py - previous[1])
+            expected = 0.7 * delta + 0.3 * expected
+            previous = (px, py)
+
+        provider = ConcreteOdomProvider()
+        run_until_drained(
+            provider,
+            mock_event_instance,
+            *[
+                (100, i, 0.0, 0.0, 0.0, 1.0, px, py, 0.0)
+                for i, (px, py) in enumerate(positions)
+            ],
+        )
+
+        assert provider.move_history == pytest.approx(expected)
+        assert provider.previous_x == 0.05
+        assert provider.odom_rockchip_ts == pytest.approx(100 + 3e-9)
+
+    def test_process_odom_passes_height_to_body_state(self, mock_multiprocessing):
+        """Test process_odom hands the z position to _update_body_state."""
+        _, mock_event_instance = mock_multiprocessing
+
+        provider = ConcreteOdomProvider()
+
+        with patch.object(provider, "_update_body_state") as mock_update:
+            run_until_drained(
+                provider,
+                mock_event_instance,
+                (100, 0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.3),
+            )
+
+        mock_update.assert_called_once_with(0.3)
+
+    @pytest.mark.asyncio
+    async def test_position_async_wakes_on_update(self):
+        """Test position_async returns once the processor thread updates the state."""
+        provider = ConcreteOdomProvider()
+
+        waiter = asyncio.create_task(provider.position_async())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        provider.data_ring.put(100, 0, 0.0, 0.0, 0.0, 1.0, 1.0, 2.0, 0.0)
+        thread = threading.Thread(
+            target=provider._process_samples, args=([provider.data_ring.get_nowait()],)
+        )
+        thread.start()
+        thread.join()
+
+        position = await asyncio.wait_for(waiter, timeout=1.0)
+        assert position["odom_x"] == 1.0
+        assert position["odom_y"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_position_async_timeout_returns_last_position(
+        self, mock_multiprocessing
+    ):
+        """Test position_async falls back to the last position on timeout."""
+        provider = ConcreteOdomProvider()
+
+        position = await provider.position_async(timeout=0.01)
+
+        assert position["odom_x"] == 0.0
+        assert provider._position_waiters == []
+
     def test_update_body_state_default(self, mock_multiprocessing):
         """Test _update_body_state default implementation does nothing."""
         provider = ConcreteOdomProvider()
 
-        mock_pose = MagicMock()
         initial_height = provider.body_height_cm
         initial_attitude = provider.body_attitude
 
-        provider._update_body_state(mock_pose)
+        provider._update_body_state(0.3)
 
         assert provider.body_height_cm == initial_height
         assert provider.body_attitude == initial_attitude
 
     def test_stop(self, mock_multiprocessing):
         """Test stop method cleans up resources."""
-        _, _, _, mock_event_instance = mock_multiprocessing
+        _, mock_event_instance = mock_multiprocessing
 
         provider = ConcreteOdomProvider()
 
@@ -324,7 +510,7 @@ class TestOdomProviderBase:
 
     def test_stop_without_threads(self, mock_multiprocessing):
         """Test stop method when threads are None."""
-        _, _, _, mock_event_instance = mock_multiprocessing
+        _, mock_event_instance = mock_multiprocessing
 
         provider = ConcreteOdomProvider()
 
@@ -336,78 +522,53 @@ class TestOdomProviderBase:
 
     def test_yaw_conversion_positive(self, mock_multiprocessing):
         """Test yaw angle conversion for positive angles."""
-        _, mock_queue_instance, _, mock_event_instance = mock_multiprocessing
+        _, mock_event_instance = mock_multiprocessing
 
         provider = ConcreteOdomProvider()
 
-        # Create pose with yaw rotation (positive)
-        mock_pose_data = MagicMock()
-        mock_pose_data.pose.position.x = 0.0
-        mock_pose_data.pose.position.y = 0.0
-        mock_pose_data.pose.position.z = 0.0
         # 45 degree yaw rotation
-        mock_pose_data.pose.orientation.x = 0.0
-        mock_pose_data.pose.orientation.y = 0.0
-        mock_pose_data.pose.orientation.z = math.sin(math.pi / 8)  # 22.5 deg
-        mock_pose_data.pose.orientation.w = math.cos(math.pi / 8)
-        mock_pose_data.header.stamp.sec = 100
-        mock_pose_data.header.stamp.nanosec = 0
-        del mock_pose_data.pose.pose
-
-        call_count = [0]
-
-        def side_effect_get(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_pose_data
-            raise Exception("Queue timeout")
-
-        def side_effect_is_set():
-            return call_count[0] > 0
-
-        mock_queue_instance.get.side_effect = side_effect_get
-        mock_event_instance.is_set.side_effect = side_effect_is_set
-
         with patch("providers.odom_provider_base.time.time", return_value=1000.0):
-            provider.process_odom()
+            run_until_drained(
+                provider,
+                mock_event_instance,
+                (
+                    100,
+                    0,
+                    0.0,
+                    0.0,
+                    math.sin(math.pi / 8),
+                    math.cos(math.pi / 8),
+                    0.0,
+                    0.0,
+                    0.0,
+                ),
+            )
 
         assert provider.odom_yaw_m180_p180 > 0
         assert 0 <= provider.odom_yaw_0_360 <= 360
 
     def test_yaw_conversion_negative(self, mock_multiprocessing):
         """Test yaw angle conversion for negative angles."""
-        _, mock_queue_instance, _, mock_event_instance = mock_multiprocessing
+        _, mock_event_instance = mock_multiprocessing
 
         provider = ConcreteOdomProvider()
 
-        mock_pose_data = MagicMock()
-        mock_pose_data.pose.position.x = 0.0
-        mock_pose_data.pose.position.y = 0.0
-        mock_pose_data.pose.position.z = 0.0
-        mock_pose_data.pose.orientation.x = 0.0
-        mock_pose_data.pose.orientation.y = 0.0
-        mock_pose_data.pose.orientation.z = -math.sin(math.pi / 8)
-        mock_pose_data.pose.orientation.w = math.cos(math.pi / 8)
-        mock_pose_data.header.stamp.sec = 100
-        mock_pose_data.header.stamp.nanosec = 0
-        del mock_pose_data.pose.pose
-
-        call_count = [0]
-
-        def side_effect_get(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_pose_data
-            raise Exception("Queue timeout")
-
-        def side_effect_is_set():
-            return call_count[0] > 0
-
-        mock_queue_instance.get.side_effect = side_effect_get
-        mock_event_instance.is_set.side_effect = side_effect_is_set
-
         with patch("providers.odom_provider_base.time.time", return_value=1000.0):
-            provider.process_odom()
+            run_until_drained(
+                provider,
+                mock_event_instance,
+                (
+                    100,
+                    0,
+                    0.0,
+                    0.0,
+                    -math.sin(math.pi / 8),
+                    math.cos(math.pi / 8),
+                    0.0,
+                    0.0,
+                    0.0,
+                ),
+            )
 
         assert provider.odom_yaw_m180_p180 < 0
         assert provider.odom_yaw_0_360 > 0
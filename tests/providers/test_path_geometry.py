@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+
+from providers.path_geometry import blocked_paths, path_segments
+
+
+def segment_distance(px, py, x1, y1, x2, y2):
+    """Reference distance from a point to a line segment."""
+    dx = x2 - x1
+    dy = y2 - y1
+    if dx == 0 and dy == 0:
+        return math.hypot(px - x1, py - y1)
+    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
+    t = max(0.0, min(1.0, t))
+    return math.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+
+def test_path_segments_takes_endpoints():
+    """Test the first and last point of every path are used as its segment."""
+    paths = [
+        np.array([[0.0, 0.5, 1.0], [0.0, 1.0, 2.0]]),
+        np.array([[0.0, -1.0], [0.0, -1.0]]),
+    ]
+
+    np.testing.assert_array_equal(
+        path_segments(paths), [[0.0, 0.0, 1.0, 2.0], [0.0, 0.0, -1.0, -1.0]]
+    )
+
+
+def test_blocked_paths_matches_scalar_distance():
+    """Test the broadcast check agrees with the per-point distance."""
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1.5, 1.5, 200)
+    Y = rng.uniform(-1.5, 1.5, 200)
+    segments = np.array(
+        [
+            [0.0, 0.0, 0.0, 1.0],
+            [0.0, 0.0, 0.7, 0.7],
+            [0.0, 0.0, 0.0, -1.0],
+            [0.3, 0.3, 0.3, 0.3],  # zero length
+        ]
+    )
+    behind_only = np.array([False, False, True, False])
+
+    blocked = blocked_paths(X, Y, segments, 0.25, behind_only)
+
+    assert blocked.shape == (200, 4)
+    for row, (x, y) in enumerate(zip(X, Y)):
+        for column, (x1, y1, x2, y2) in enumerate(segments):
+            expected = segment_distance(x, y, x1, y1, x2, y2) < 0.25
+            if behind_only[column] and y >= 0:
+                expected = False
+            assert blocked[row, column] == expected
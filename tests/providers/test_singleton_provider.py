@@ -54,3 +54,36 @@ def test_singleton_thread_safety():
     first_instance = instances[0]
     for inst in instances:
         assert inst is first_instance
+
+
+def test_singleton_same_arguments_do_not_warn(caplog):
+    """Test positional and keyword calls with the same value are treated alike."""
+
+    @singleton
+    class Channel:
+        def __init__(self, channel=None):
+            self.channel = channel
+
+    first = Channel("eth0")
+    with caplog.at_level("WARNING"):
+        assert Channel(channel="eth0") is first
+        assert Channel() is first
+
+    assert caplog.records == []
+
+
+def test_singleton_conflicting_arguments_warn(caplog):
+    """Test a call with different arguments returns the instance and warns."""
+
+    @singleton
+    class Topic:
+        def __init__(self, topic="odom"):
+            self.topic = topic
+
+    first = Topic(topic="a")
+    with caplog.at_level("WARNING"):
+        second = Topic(topic="b")
+
+    assert second is first
+    assert second.topic == "a"
+    assert "Topic already exists" in caplog.text
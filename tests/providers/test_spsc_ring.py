@@ -0,0 +1,180 @@
+import multiprocessing as mp
+import pickle
+import threading
+import time
+
+import pytest
+
+from providers.spsc_ring import _SEQ, SPSCRingBuffer
+
+
+@pytest.fixture
+def ring():
+    """Ring buffer with room for a few records."""
+    ring = SPSCRingBuffer("<id", capacity=4)
+    yield ring
+    ring.release()
+
+
+def test_put_get_roundtrip(ring):
+    """Test records are read back in the order they were written."""
+    ring.put(1, 2.5)
+    ring.put(2, 3.5)
+
+    assert len(ring) == 2
+    assert ring.get_nowait() == (1, 2.5)
+    assert ring.get_nowait() == (2, 3.5)
+    assert ring.get_nowait() is None
+
+
+def test_drops_oldest_when_full(ring):
+    """Test a full ring drops the oldest records."""
+    for i in range(10):
+        ring.put(i, float(i))
+
+    records = []
+    while (record := ring.get_nowait()) is not None:
+        records.append(record[0])
+
+    # One slot is kept free for the producer to write into
+    assert records == [7, 8, 9]
+
+
+def test_record_not_returned_before_its_sequence_number(ring):
+    """Test a slot whose sequence number is not visible yet is not read."""
+    ring.put(1, 2.5)
+    _SEQ.pack_into(ring._shm.buf, 0, 0)
+
+    assert ring.get_nowait() is None
+
+    _SEQ.pack_into(ring._shm.buf, 0, 1)
+
+    assert ring.get_nowait() == (1, 2.5)
+
+
+def test_skips_slot_holding_newer_record(ring):
+    """Test a slot already rewritten with a newer record is skipped."""
+    ring.put(1, 1.0)
+    ring.put(2, 2.0)
+    # Slot 0 now holds record 4 while the tail has not been bumped past it
+    _SEQ.pack_into(ring._shm.buf, 0, 5)
+
+    assert ring.get_nowait() == (2, 2.0)
+
+
+def test_get_times_out_when_empty(ring):
+    """Test get returns None once the timeout expires."""
+    assert ring.get(timeout=0.01) is None
+
+
+def test_get_returns_none_when_closed(ring):
+    """Test get returns None on a closed ring."""
+    ring.close()
+
+    assert ring.closed is True
+    assert ring.get() is None
+
+
+def test_invalid_capacity():
+    """Test a ring needs at least two slots."""
+    with pytest.raises(ValueError):
+        SPSCRingBuffer("<i", capacity=1)
+
+
+def _produce(ring):
+    ring.put(8, 2.0)
+
+
+def test_child_process_writes_to_same_memory():
+    """Test a record written by a child process is read by the parent."""
+    ring = SPSCRingBuffer("<id", capacity=4, cross_process=True)
+    ring.put(7, 1.0)
+
+    process = mp.Process(target=_produce, args=(ring,))
+    process.start()
+    process.join(timeout=30)
+
+    assert process.exitcode == 0
+    assert ring.get_nowait() == (7, 1.0)
+    assert ring.get_nowait() == (8, 2.0)
+    ring.release()
+
+
+def test_only_cross_process_ring_can_be_pickled(ring):
+    """Test a ring without the shared wakeup refuses to cross a process boundary."""
+    with pytest.raises(ValueError):
+        pickle.dumps(ring)
+
+
+def test_get_sleeps_until_put(ring):
+    """Test get waits on the condition instead of polling the ring."""
+    calls = []
+    get_nowait = ring.get_nowait
+
+    def counting_get_nowait():
+        calls.append(1)
+        return get_nowait()
+
+    ring.get_nowait = counting_get_nowait
+    producer = threading.Timer(0.2, ring.put, args=(3, 4.5))
+    producer.start()
+
+    assert ring.get(timeout=5) == (3, 4.5)
+    producer.join()
+    assert len(calls) <= 3
+
+
+def test_get_wakes_on_close(ring):
+    """Test a waiting get returns None as soon as the ring is closed."""
+    closer = threading.Timer(0.05, ring.close)
+    closer.start()
+
+    assert ring.get(timeout=5) is None
+    closer.join()
+
+
+def _produce_later(ring):
+    time.sleep(0.2)
+    ring.put(9)
+
+
+def test_cross_process_get_sleeps_until_put():
+    """Test a cross-process get sleeps on the shared event instead of polling."""
+    ring = SPSCRingBuffer("<i", capacity=2, cross_process=True)
+    calls = []
+    get_nowait = ring.get_nowait
+
+    def counting_get_nowait():
+        calls.append(1)
+        return get_nowait()
+
+    ring.get_nowait = counting_get_nowait
+    process = mp.Process(target=_produce_later, args=(ring,))
+    process.start()
+
+    assert ring.get(timeout=30) == (9,)
+    process.join(timeout=30)
+    assert process.exitcode == 0
+    assert len(calls) <= 20
+    ring.release()
+
+
+def test_cross_process_get_wakes_on_close():
+    """Test a cross-process get returns None as soon as the ring is closed."""
+    ring = SPSCRingBuffer("<i", capacity=2, cross_process=True)
+    closer = threading.Timer(0.05, ring.close)
+    closer.start()
+
+    assert ring.get(timeout=5) is None
+    closer.join()
+    ring.release()
+
+
+def test_cross_process_get_times_out():
+    """Test a cross-process ring still honours the timeout."""
+    ring = SPSCRingBuffer("<i", capacity=2, cross_process=True)
+
+    assert ring.get(timeout=0.01) is None
+    ring.put(1)
+    assert ring.get(timeout=0.01) == (1,)
+    ring.release()
@@ -2,7 +2,24 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from providers.tron_odom_provider import RobotState, TronOdomProvider
+from providers.tron_odom_provider import (
+    RobotState,
+    TronOdomProvider,
+    tron_odom_processor,
+)
+from zenoh_msgs import (
+    Header,
+    Odometry,
+    Point,
+    Pose,
+    PoseWithCovariance,
+    Quaternion,
+    String,
+    Time,
+    Twist,
+    TwistWithCovariance,
+    Vector3,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -14,118 +31,107 @@ def reset_singleton():
 
 
 @pytest.fixture
-def mock_multiprocessing():
+def mock_threading():
+    """Mock the reader and processor threads."""
     with (
-        patch("providers.tron_odom_provider.mp.Queue") as mock_queue,
-        patch("providers.tron_odom_provider.mp.Process") as mock_process,
         patch("providers.tron_odom_provider.threading.Thread") as mock_thread,
         patch("providers.tron_odom_provider.threading.Event") as mock_event,
     ):
-        mock_queue_instance = MagicMock()
-        mock_process_instance = MagicMock()
+        mock_reader_instance = MagicMock(spec=["start", "join", "is_alive"])
         mock_thread_instance = MagicMock()
         mock_event_instance = MagicMock()
 
-        mock_queue.return_value = mock_queue_instance
-        mock_process.return_value = mock_process_instance
-        mock_thread.return_value = mock_thread_instance
+        def create_thread(*args, target=None, **kwargs):
+            if target is tron_odom_processor:
+                return mock_reader_instance
+            return mock_thread_instance
+
+        mock_thread.side_effect = create_thread
         mock_event.return_value = mock_event_instance
 
-        mock_process_instance.is_alive.return_value = False
+        mock_reader_instance.is_alive.return_value = False
         mock_thread_instance.is_alive.return_value = False
         mock_event_instance.is_set.return_value = False
 
-        yield (
-            mock_queue,
-            mock_queue_instance,
-            mock_process,
-            mock_process_instance,
-            mock_thread,
-            mock_thread_instance,
-        )
+        yield mock_thread, mock_reader_instance, mock_thread_instance
 
 
-def test_initialization_default_topic(mock_multiprocessing):
+def test_initialization_default_topic(mock_threading):
     """Test initialization with default topic."""
-    mock_queue, _, _, _, _, _ = mock_multiprocessing
-
     provider = TronOdomProvider()
 
     assert provider.topic == "odom"
-    mock_queue.assert_called_once()
+    assert provider.data_ring is not None
 
 
-def test_initialization_custom_topic(mock_multiprocessing):
+def test_initialization_custom_topic(mock_threading):
     """Test initialization with custom topic."""
-    mock_queue, _, _, _, _, _ = mock_multiprocessing
-
     TronOdomProvider.reset()  # type: ignore
     provider = TronOdomProvider(topic="custom_odom")
 
     assert provider.topic == "custom_odom"
-    mock_queue.assert_called_once()
+    assert provider.data_ring is not None
 
 
-def test_singleton_pattern(mock_multiprocessing):
+def test_singleton_pattern(mock_threading):
     """Test singleton pattern - same instance returned."""
     provider1 = TronOdomProvider(topic="odom")
     provider2 = TronOdomProvider(topic="other_topic")
     assert provider1 is provider2
 
 
-def test_start(mock_multiprocessing):
+def test_start(mock_threading):
     """Test start() launches process and thread."""
-    _, _, _, mock_process_instance, _, mock_thread_instance = mock_multiprocessing
+    _, mock_reader_instance, mock_thread_instance = mock_threading
 
     TronOdomProvider(topic="odom")
 
-    assert mock_process_instance.start.call_count >= 1
+    assert mock_reader_instance.start.call_count >= 1
     assert mock_thread_instance.start.call_count >= 1
 
 
-def test_start_already_running(mock_multiprocessing):
+def test_start_already_running(mock_threading):
     """Test start() does not restart when already running."""
-    _, _, _, mock_process_instance, _, mock_thread_instance = mock_multiprocessing
+    _, mock_reader_instance, mock_thread_instance = mock_threading
 
     provider = TronOdomProvider(topic="odom")
 
-    mock_process_instance.is_alive.return_value = True
+    mock_reader_instance.is_alive.return_value = True
     mock_thread_instance.is_alive.return_value = True
 
-    mock_process_instance.start.reset_mock()
+    mock_reader_instance.start.reset_mock()
     mock_thread_instance.start.reset_mock()
 
     provider.start()
 
-    mock_process_instance.start.assert_not_called()
+    mock_reader_instance.start.assert_not_called()
     mock_thread_instance.start.assert_not_called()
 
 
-def test_start_no_topic(mock_multiprocessing):
+def test_start_no_topic(mock_threading):
     """Test start() returns early when topic is empty."""
-    _, _, _, mock_process_instance, _, _ = mock_multiprocessing
+    _, mock_reader_instance, _ = mock_threading
 
     provider = TronOdomProvider(topic="odom")
-    mock_process_instance.is_alive.return_value = False
+    mock_reader_instance.is_alive.return_value = False
     provider.topic = ""
 
-    mock_process_instance.start.reset_mock()
+    mock_reader_instance.start.reset_mock()
     provider.start()
 
     # Should not start because topic is empty
-    mock_process_instance.start.assert_not_called()
+    mock_reader_instance.start.assert_not_called()
 
 
-def test_stop(mock_multiprocessing):
-    """Test stop() terminates process and joins thread."""
-    _, _, _, mock_process_instance, _, mock_thread_instance = mock_multiprocessing
+def test_stop(mock_threading):
+    """Test stop() joins the reader and processor threads."""
+    _, mock_reader_instance, mock_thread_instance = mock_threading
 
     provider = TronOdomProvider(topic="odom")
     provider.stop()
 
     assert provider._stop_event.set.called  # type: ignore
-    mock_process_instance.terminate.assert_called_once()
-    mock_process_instance.join.assert_called_once()
+    mock_reader_instance.join.assert_called_once()
     mock_thread_instance.join.assert_called_once()
 
 
@@ -135,7 +141,7 @@ def test_robot_state_enum():
     assert RobotState.SITTING.value == "sitting"
 
 
-def test_position_property(mock_multiprocessing):
+def test_position_property(mock_threading):
     """Test position property returns expected dictionary structure."""
     provider = TronOdomProvider(topic="odom")
 
@@ -156,7 +162,7 @@ def test_position_property(mock_multiprocessing):
     assert position["moving"] is False
 
 
-def test_euler_from_quaternion(mock_multiprocessing):
+def test_euler_from_quaternion(mock_threading):
     """Test quaternion to Euler angle conversion."""
     provider = TronOdomProvider(topic="odom")
 
@@ -167,7 +173,7 @@ def test_euler_from_quaternion(mock_multiprocessing):
     assert abs(yaw) < 0.001
 
 
-def test_euler_from_quaternion_90_degree_yaw(mock_multiprocessing):
+def test_euler_from_quaternion_90_degree_yaw(mock_threading):
     """Test quaternion representing 90 degree yaw rotation."""
     import math
 
@@ -181,7 +187,7 @@ def test_euler_from_quaternion_90_degree_yaw(mock_multiprocessing):
     assert abs(yaw - math.pi / 2) < 0.01
 
 
-def test_body_attitude_standing(mock_multiprocessing):
+def test_body_attitude_standing(mock_threading):
     """Test body attitude is set to STANDING when height > 60cm."""
     provider = TronOdomProvider(topic="odom")
 
@@ -195,7 +201,7 @@ def test_body_attitude_standing(mock_multiprocessing):
     assert provider.body_attitude == RobotState.STANDING
 
 
-def test_body_attitude_sitting(mock_multiprocessing):
+def test_body_attitude_sitting(mock_threading):
     """Test body attitude is set to SITTING when height is between 3-60cm."""
     provider = TronOdomProvider(topic="odom")
 
@@ -210,7 +216,7 @@ def test_body_attitude_sitting(mock_multiprocessing):
     assert provider.body_attitude == RobotState.SITTING
 
 
-def test_initial_values(mock_multiprocessing):
+def test_initial_values(mock_threading):
     """Test initial values are set correctly."""
     provider = TronOdomProvider(topic="odom")
 
@@ -224,3 +230,47 @@ def test_initial_values(mock_multiprocessing):
     assert provider.previous_y == 0
     assert provider.previous_z == 0
     assert provider.move_history == 0
+
+
+def test_zenoh_odom_handler_writes_flat_sample():
+    """Test the Zenoh handler writes the pose fields straight into the ring."""
+    data_ring = MagicMock()
+    stop_event = MagicMock()
+
+    odom = Odometry(
+        header=Header(stamp=Time(sec=10, nanosec=20), frame_id="odom"),
+        child_frame_id=String(data="base_link"),
+        pose=PoseWithCovariance(
+            pose=Pose(
+                position=Point(x=1.0, y=2.0, z=0.5),
+                orientation=Quaternion(x=0.0, y=0.0, z=0.1, w=0.9),
+            ),
+            covariance=[0.0] * 36,
+        ),
+        twist=TwistWithCovariance(
+            twist=Twist(
+                linear=Vector3(x=0.0, y=0.0, z=0.0),
+                angular=Vector3(x=0.0, y=0.0, z=0.0),
+            ),
+            covariance=[0.0] * 36,
+        ),
+    )
+    sample = MagicMock()
+    sample.payload.to_bytes.return_value = odom.serialize()
+
+    with patch("providers.tron_odom_provider.open_zenoh_session") as mock_open:
+        tron_odom_processor("odom", data_ring, stop_event)
+        handler = mock_open.return_value.declare_subscriber.call_args.args[1]
+
+        handler(sample)
+
+    data_ring.put.assert_called_once_with(10, 20, 0.0, 0.0, 0.1, 0.9, 1.0, 2.0, 0.5)
+
+
+def test_state_is_slotted(mock_threading):
+    """Test the provider state lives in slots rather than an instance dict."""
+    provider = TronOdomProvider()
+
+    assert not hasattr(provider, "__dict__")
+    with pytest.raises(AttributeError):
+        provider.unknown_attribute = 1
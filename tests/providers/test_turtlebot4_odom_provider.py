@@ -2,7 +2,23 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from providers.turtlebot4_odom_provider import TurtleBot4OdomProvider
+from providers.turtlebot4_odom_provider import (
+    TurtleBot4OdomProvider,
+    turtlebot4_odom_processor,
+)
+from zenoh_msgs import (
+    Header,
+    Odometry,
+    Point,
+    Pose,
+    PoseWithCovariance,
+    Quaternion,
+    String,
+    Time,
+    Twist,
+    TwistWithCovariance,
+    Vector3,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -14,60 +30,53 @@ def reset_singleton():
 
 
 @pytest.fixture
-def mock_multiprocessing():
-    """Mock multiprocessing and threading components."""
+def mock_threading():
+    """Mock the reader and processor threads."""
     with (
-        patch("providers.turtlebot4_odom_provider.mp.Queue") as mock_queue,
-        patch("providers.turtlebot4_odom_provider.mp.Process") as mock_process,
         patch("providers.turtlebot4_odom_provider.threading.Thread") as mock_thread,
         patch("providers.turtlebot4_odom_provider.threading.Event") as mock_event,
     ):
-        mock_queue_instance = MagicMock()
-        mock_process_instance = MagicMock()
+        mock_reader_instance = MagicMock(spec=["start", "join", "is_alive"])
         mock_thread_instance = MagicMock()
         mock_event_instance = MagicMock()
 
-        mock_queue.return_value = mock_queue_instance
-        mock_process.return_value = mock_process_instance
-        mock_thread.return_value = mock_thread_instance
+        def create_thread(*args, target=None, **kwargs):
+            if target is turtlebot4_odom_processor:
+                return mock_reader_instance
+            return mock_thread_instance
+
+        mock_thread.side_effect = create_thread
         mock_event.return_value = mock_event_instance
 
-        mock_process_instance.is_alive.return_value = False
+        mock_reader_instance.is_alive.return_value = False
         mock_thread_instance.is_alive.return_value = False
         mock_event_instance.is_set.return_value = False
 
-        yield (
-            mock_queue,
-            mock_queue_instance,
-            mock_process,
-            mock_process_instance,
-            mock_thread,
-            mock_thread_instance,
-        )
+        yield mock_thread, mock_reader_instance, mock_thread_instance
 
 
 class TestTurtleBot4OdomProvider:
     """Test cases for TurtleBot4OdomProvider."""
 
-    def test_initialization_with_urid(self, mock_multiprocessing):
+    def test_initialization_with_urid(self, mock_threading):
         """Test initialization with URID."""
         provider = TurtleBot4OdomProvider(URID="test_robot_123")
 
         assert provider.URID == "test_robot_123"
 
-    def test_initialization_without_urid(self, mock_multiprocessing):
+    def test_initialization_without_urid(self, mock_threading):
         """Test initialization without URID (None)."""
         provider = TurtleBot4OdomProvider(URID=None)
 
         assert provider.URID is None
 
-    def test_initialization_default_urid(self, mock_multiprocessing):
+    def test_initialization_default_urid(self, mock_threading):
         """Test initialization with default URID parameter."""
         provider = TurtleBot4OdomProvider()
 
         assert provider.URID is None
 
-    def test_singleton_pattern(self, mock_multiprocessing):
+    def test_singleton_pattern(self, mock_threading):
         """Test that TurtleBot4OdomProvider follows singleton pattern."""
         provider1 = TurtleBot4OdomProvider(URID="robot_1")
         provider2 = TurtleBot4OdomProvider(URID="robot_2")
@@ -76,67 +85,67 @@ class TestTurtleBot4OdomProvider:
         # First instance URID should be preserved
         assert provider1.URID == "robot_1"
 
-    def test_start_creates_reader_thread(self, mock_multiprocessing):
+    def test_start_creates_reader_thread(self, mock_threading):
         """Test that start creates and starts reader thread."""
-        _, _, _, mock_process_instance, _, _ = mock_multiprocessing
+        _, mock_reader_instance, _ = mock_threading
 
         TurtleBot4OdomProvider(URID="test_robot")
 
-        # Should have started the process during initialization
-        assert mock_process_instance.start.call_count >= 1
+        # Should have started the reader thread during initialization
+        assert mock_reader_instance.start.call_count >= 1
 
-    def test_start_creates_processor_thread(self, mock_multiprocessing):
+    def test_start_creates_processor_thread(self, mock_threading):
         """Test that start creates and starts processor thread."""
-        _, _, _, _, _, mock_thread_instance = mock_multiprocessing
+        _, _, mock_thread_instance = mock_threading
 
         TurtleBot4OdomProvider(URID="test_robot")
 
         # Should have started the thread during initialization
         assert mock_thread_instance.start.call_count >= 1
 
-    def test_start_already_running(self, mock_multiprocessing):
+    def test_start_already_running(self, mock_threading):
         """Test that start doesn't restart if already running."""
-        _, _, _, mock_process_instance, _, mock_thread_instance = mock_multiprocessing
+        _, mock_reader_instance, mock_thread_instance = mock_threading
 
         provider = TurtleBot4OdomProvider(URID="test_robot")
 
         # Simulate threads already running
-        mock_process_instance.is_alive.return_value = True
+        mock_reader_instance.is_alive.return_value = True
         mock_thread_instance.is_alive.return_value = True
 
         # Reset call counts
-        mock_process_instance.start.reset_mock()
+        mock_reader_instance.start.reset_mock()
         mock_thread_instance.start.reset_mock()
 
         # Call start again
         provider.start()
 
         # Should not have started new threads
-        mock_process_instance.start.assert_not_called()
+        mock_reader_instance.start.assert_not_called()
         mock_thread_instance.start.assert_not_called()
 
-    def test_start_with_processor_thread_running(self, mock_multiprocessing):
+    def test_start_with_processor_thread_running(self, mock_threading):
         """Test start when processor thread is already running."""
-        _, _, _, mock_process_instance, _, mock_thread_instance = mock_multiprocessing
+        _, mock_reader_instance, mock_thread_instance = mock_threading
 
         provider = TurtleBot4OdomProvider(URID="test_robot")
 
         # Simulate only processor thread running
-        mock_process_instance.is_alive.return_value = False
+        mock_reader_instance.is_alive.return_value = False
         mock_thread_instance.is_alive.return_value = True
 
-        mock_process_instance.start.reset_mock()
+        mock_reader_instance.start.reset_mock()
         mock_thread_instance.start.reset_mock()
 
         provider.start()
 
         # Reader thread should start, processor should not
-        mock_process_instance.start.assert_called_once()
+        mock_reader_instance.start.assert_called_once()
         mock_thread_instance.start.assert_not_called()
 
-    def test_stop(self, mock_multiprocessing):
+    def test_stop(self, mock_threading):
         """Test stop method cleans up resources."""
-        _, _, _, mock_process_instance, _, mock_thread_instance = mock_multiprocessing
+        _, mock_reader_instance, mock_thread_instance = mock_threading
 
         provider = TurtleBot4OdomProvider(URID="test_robot")
         provider.stop()
@@ -144,12 +153,11 @@ class TestTurtleBot4OdomProvider:
         # Stop event should be set
         assert provider._stop_event.set.called  # type: ignore
 
-        # Threads should be terminated/joined
-        mock_process_instance.terminate.assert_called_once()
-        mock_process_instance.join.assert_called_once()
+        # Threads should be joined
+        mock_reader_instance.join.assert_called_once()
         mock_thread_instance.join.assert_called_once()
 
-    def test_position_property(self, mock_multiprocessing):
+    def test_position_property(self, mock_threading):
         """Test position property returns correct data structure."""
         provider = TurtleBot4OdomProvider(URID="test_robot")
 
@@ -171,12 +179,12 @@ class TestTurtleBot4OdomProvider:
         assert position["odom_y"] == 0.0
         assert position["moving"] is False
 
-    def test_initialization_inherits_from_base(self, mock_multiprocessing):
+    def test_initialization_inherits_from_base(self, mock_threading):
         """Test that initialization properly inherits from OdomProviderBase."""
         provider = TurtleBot4OdomProvider(URID="test_robot")
 
         # Check base class attributes are initialized
-        assert hasattr(provider, "data_queue")
+        assert hasattr(provider, "data_ring")
         assert hasattr(provider, "_odom_reader_thread")
         assert hasattr(provider, "_odom_processor_thread")
         assert hasattr(provider, "_stop_event")
@@ -184,51 +192,91 @@ class TestTurtleBot4OdomProvider:
         assert hasattr(provider, "y")
         assert hasattr(provider, "moving")
 
-    def test_start_logging_with_urid(self, mock_multiprocessing, caplog):
+    def test_start_logging_with_urid(self, mock_threading, caplog):
         """Test that start logs the URID."""
         with caplog.at_level("INFO"):
             TurtleBot4OdomProvider(URID="robot_xyz")
 
         assert "Starting TurtleBot4 Odom Provider with URID: robot_xyz" in caplog.text
 
-    def test_start_logging_without_urid(self, mock_multiprocessing, caplog):
+    def test_start_logging_without_urid(self, mock_threading, caplog):
         """Test that start logs when URID is None."""
         with caplog.at_level("INFO"):
             TurtleBot4OdomProvider(URID=None)
 
         assert "Starting TurtleBot4 Odom Provider with URID: None" in caplog.text
 
-    @patch("providers.turtlebot4_odom_provider.get_logging_config")
-    def test_start_passes_logging_config(
-        self, mock_get_logging_config, mock_multiprocessing
-    ):
-        """Test that start passes logging config to the processor."""
-        _, _, mock_process, _, _, _ = mock_multiprocessing
-
-        mock_logging_config = MagicMock()
-        mock_get_logging_config.return_value = mock_logging_config
+    def test_start_passes_stop_event(self, mock_threading):
+        """Test that start hands the stop event to the reader thread."""
+        mock_thread, _, _ = mock_threading
 
-        TurtleBot4OdomProvider(URID="test_robot")
+        provider = TurtleBot4OdomProvider(URID="test_robot")
 
-        # Verify Process was called with logging config
-        call_args = mock_process.call_args
-        assert call_args is not None
-        args = call_args[1]["args"]
-        assert args[2] == mock_logging_config
+        call_args = mock_thread.call_args_list[0]
+        assert call_args[1]["target"] is turtlebot4_odom_processor
+        assert call_args[1]["args"][2] is provider._stop_event
 
-    def test_multiple_start_calls_with_running_threads(
-        self, mock_multiprocessing, caplog
-    ):
+    def test_multiple_start_calls_with_running_threads(self, mock_threading, caplog):
         """Test multiple start calls when threads are already running."""
-        _, _, _, mock_process_instance, _, mock_thread_instance = mock_multiprocessing
+        _, mock_reader_instance, mock_thread_instance = mock_threading
 
         provider = TurtleBot4OdomProvider(URID="test_robot")
 
         # Simulate both threads running
-        mock_process_instance.is_alive.return_value = True
+        mock_reader_instance.is_alive.return_value = True
         mock_thread_instance.is_alive.return_value = True
 
         with caplog.at_level("WARNING"):
             provider.start()
 
         assert "TurtleBot4 Odom Provider is already running" in caplog.text
+
+    def test_zenoh_sample_reaches_position_through_ring(self, mock_threading):
+        """Test a Zenoh odom sample flows through the shared ring into the pose."""
+        provider = TurtleBot4OdomProvider(URID="test_robot")
+
+        odom = Odometry(
+            header=Header(stamp=Time(sec=10, nanosec=0), frame_id="odom"),
+            child_frame_id=String(data="base_link"),
+            pose=PoseWithCovariance(
+                pose=Pose(
+                    position=Point(x=1.0, y=2.0, z=0.0),
+                    orientation=Quaternion(x=0.0, y=0.0, z=0.0, w=1.0),
+                ),
+                covariance=[0.0] * 36,
+            ),
+            twist=TwistWithCovariance(
+                twist=Twist(
+                    linear=Vector3(x=0.0, y=0.0, z=0.0),
+                    angular=Vector3(x=0.0, y=0.0, z=0.0),
+                ),
+                covariance=[0.0] * 36,
+            ),
+        )
+        sample = MagicMock()
+        sample.payload.to_bytes.return_value = odom.serialize()
+
+        with patch(
+            "providers.turtlebot4_odom_provider.shared_zenoh_session"
+        ) as mock_open:
+            turtlebot4_odom_processor(provider.data_ring, "test_robot", MagicMock())
+            handler = mock_open.return_value.declare_subscriber.call_args.args[1]
+            handler(sample)
+
+        provider.data_ring.close()
+        provider.process_odom()
+
+        assert provider.x == 1.0
+        assert provider.y == 2.0
+        assert provider.odom_rockchip_ts == 10.0
+
+    def test_processor_keeps_shared_session_open(self):
+        """Test stopping the reader undeclares its subscriber only."""
+        with patch(
+            "providers.turtlebot4_odom_provider.shared_zenoh_session"
+        ) as mock_shared:
+            turtlebot4_odom_processor(MagicMock(), "test_robot", MagicMock())
+
+        session = mock_shared.return_value
+        session.declare_subscriber.return_value.undeclare.assert_called_once()
+        session.close.assert_not_called()
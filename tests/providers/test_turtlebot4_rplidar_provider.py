@@ -1,11 +1,16 @@
+import math
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
+from pycdr2 import Endianness
 
 from providers.turtlebot4_rplidar_provider import (
     RPLidarConfig,
     TurtleBot4RPLidarProvider,
+    laser_scan_from_cdr,
 )
+from zenoh_msgs import Header, LaserScan, Time
 
 
 @pytest.fixture(autouse=True)
@@ -39,7 +44,9 @@ def mock_rplidar_dependencies():
     """Mock all external dependencies for TurtleBot4RPLidarProvider."""
     with (
         patch("providers.turtlebot4_rplidar_provider.D435Provider") as mock_d435,
-        patch("providers.turtlebot4_rplidar_provider.open_zenoh_session") as mock_zenoh,
+        patch(
+            "providers.turtlebot4_rplidar_provider.shared_zenoh_session"
+        ) as mock_zenoh,
     ):
         mock_d435_instance = MagicMock()
         mock_d435.return_value = mock_d435_instance
@@ -55,6 +62,65 @@ def mock_rplidar_dependencies():
         }
 
 
+def make_laser_scan(frame_id="laser"):
+    """Build a LaserScan message with known parameters and readings."""
+    return LaserScan(
+        header=Header(stamp=Time(sec=3, nanosec=4), frame_id=frame_id),
+        angle_min=-3.0,
+        angle_max=3.0,
+        angle_increment=0.5,
+        time_increment=0.0,
+        scan_time=0.25,
+        range_min=0.125,
+        range_max=12.0,
+        ranges=[1.0, 2.5, 0.25],
+        intensities=[7.0, 8.0],
+    )
+
+
+class TestLaserScanFromCdr:
+    """Test cases for the sensor_msgs/LaserScan decoder."""
+
+    def assert_decoded(self, scan, frame_id="laser"):
+        """Check a decoded scan against make_laser_scan."""
+        assert scan.header.stamp.sec == 3
+        assert scan.header.stamp.nanosec == 4
+        assert scan.header.frame_id == frame_id
+        assert (scan.angle_min, scan.angle_max, scan.angle_increment) == (
+            -3.0,
+            3.0,
+            0.5,
+        )
+        assert (scan.scan_time, scan.range_min, scan.range_max) == (0.25, 0.125, 12.0)
+        assert list(scan.ranges) == [1.0, 2.5, 0.25]
+        assert list(scan.intensities) == [7.0, 8.0]
+
+    @pytest.mark.parametrize("frame_id", ["", "l", "la", "las", "laser"])
+    def test_string_padding(self, frame_id):
+        """Test the scan parameters are found for every frame id alignment."""
+        payload = make_laser_scan(frame_id).serialize()
+
+        self.assert_decoded(laser_scan_from_cdr(payload), frame_id)
+
+    def test_big_endian(self):
+        """Test big endian payloads are decoded."""
+        payload = make_laser_scan().serialize(endianness=Endianness.Big)
+
+        self.assert_decoded(laser_scan_from_cdr(payload))
+
+    def test_memoryview_payload(self):
+        """Test the payload can be read in place through a memoryview."""
+        payload = memoryview(make_laser_scan().serialize())
+
+        self.assert_decoded(laser_scan_from_cdr(payload))
+
+    def test_xcdr2_falls_back_to_full_deserialize(self):
+        """Test payloads in another encoding fall back to full deserialization."""
+        payload = memoryview(make_laser_scan().serialize(use_version_2=True))
+
+        self.assert_decoded(laser_scan_from_cdr(payload))
+
+
 class TestRPLidarConfig:
     """Test cases for RPLidarConfig."""
 
@@ -130,7 +196,7 @@ class TestTurtleBot4RPLidarProvider:
         provider = TurtleBot4RPLidarProvider()
 
         assert len(provider.paths) == len(provider.path_angles)
-        assert len(provider.pp) == len(provider.paths)
+        assert provider._path_segments.shape == (len(provider.paths), 4)
 
     def test_angles_blanked_default(self, mock_rplidar_dependencies):
         """Test that angles_blanked defaults to empty list."""
@@ -214,6 +280,72 @@ class TestTurtleBot4RPLidarProvider:
             assert provider.filename_current == new_filename
             assert provider.filename_current != original_filename
 
+    def test_write_str_to_file_keeps_file_open(
+        self, mock_rplidar_dependencies, tmp_path
+    ):
+        """Test consecutive lines go through one handle that stop() closes."""
+        provider = TurtleBot4RPLidarProvider()
+        provider.filename_current = str(tmp_path / "test.jsonl")
+
+        provider.write_str_to_file('{"test": "data1"}')
+        log_file = provider._log_file
+        provider.write_str_to_file('{"test": "data2"}')
+
+        assert provider._log_file is log_file
+        assert provider._log_file_bytes == 36
+        with open(provider.filename_current, "r") as f:
+            assert f.read() == '{"test": "data1"}\n{"test": "data2"}\n'
+
+        provider.stop()
+        assert log_file.closed
+
+    def test_stop_undeclares_subscriber_before_closing_file(
+        self, mock_rplidar_dependencies, tmp_path
+    ):
+        """Test a scan arriving after stop() does not reopen the log file."""
+        mocks = mock_rplidar_dependencies
+        subscriber = mocks["zenoh_instance"].declare_subscriber.return_value
+        provider = TurtleBot4RPLidarProvider()
+        provider.filename_current = str(tmp_path / "test.jsonl")
+        provider.write_str_to_file('{"test": "data1"}')
+
+        provider.stop()
+        provider.write_str_to_file('{"test": "data2"}')
+
+        subscriber.undeclare.assert_called_once()
+        assert provider._log_file is None
+        with open(tmp_path / "test.jsonl", "r") as f:
+            assert f.read() == '{"test": "data1"}\n'
+
+    def test_start_after_stop_resubscribes(self, mock_rplidar_dependencies):
+        """Test start() declares the scan subscriber again after stop()."""
+        mocks = mock_rplidar_dependencies
+        provider = TurtleBot4RPLidarProvider(URID="test_robot")
+
+        provider.stop()
+        provider.start()
+
+        assert mocks["zenoh_instance"].declare_subscriber.call_count == 2
+        assert provider._scan_subscriber is not None
+
+    def test_write_str_to_file_rotates_existing_large_file(
+        self, mock_rplidar_dependencies, tmp_path
+    ):
+        """Test the size of a file that already exists counts towards the limit."""
+        provider = TurtleBot4RPLidarProvider()
+        existing = tmp_path / "test.jsonl"
+        existing.write_text("x" * 20)
+        provider.filename_current = str(existing)
+        provider.max_file_size_bytes = 10
+
+        new_filename = str(tmp_path / "test_new.jsonl")
+        with patch.object(provider, "update_filename", return_value=new_filename):
+            provider.write_str_to_file('{"test": "data"}')
+
+        assert existing.read_text() == "x" * 20
+        with open(new_filename, "r") as f:
+            assert f.read() == '{"test": "data"}\n'
+
     def test_start(self, mock_rplidar_dependencies):
         """Test start method sets running flag."""
         provider = TurtleBot4RPLidarProvider()
@@ -329,3 +461,133 @@ class TestTurtleBot4RPLidarProvider:
         assert provider.rplidar_config.max_buf_meas == 50
         assert provider.rplidar_config.min_len == 8
         assert provider.rplidar_config.max_distance_mm == 8000
+
+    def test_path_processor_filters_and_projects(self, mock_rplidar_dependencies):
+        """Test beams are range filtered and projected into the robot frame."""
+        provider = TurtleBot4RPLidarProvider()
+
+        data = np.array(
+            [
+                [0.0, 0.5],  # straight ahead after the 180 deg mounting offset
+                [180.0, 0.5],  # straight behind
+                [90.0, 5.0],  # too far away
+                [270.0, 0.01],  # too close
+            ]
+        )
+        provider._path_processor(data)
+
+        scan = provider.raw_scan
+        assert scan is not None
+        assert scan.shape == (2, 4)
+        np.testing.assert_allclose(scan[:, 2], [-180.0, 0.0])
+        np.testing.assert_allclose(scan[:, 3], [0.5, 0.5])
+        np.testing.assert_allclose(scan[:, 0], [0.0, 0.0], atol=1e-9)
+        np.testing.assert_allclose(scan[:, 1], [-0.5, 0.5])
+        assert provider.valid_paths == []
+
+    def test_zenoh_processor_pairs_angles_with_ranges(self, mock_rplidar_dependencies):
+        """Test the angle table is built once and paired with the ranges."""
+        provider = TurtleBot4RPLidarProvider()
+
+        mock_scan = MagicMock()
+        mock_scan.angle_min = -math.pi
+        mock_scan.angle_max = math.pi
+        mock_scan.angle_increment = math.pi / 2
+        mock_scan.ranges = [1.0, 2.0, 3.0]  # one range short of the angle table
+
+        with patch.object(provider, "_path_processor") as mock_path_processor:
+            provider._zenoh_processor(mock_scan)
+            angles_final = provider.angles_final
+            provider._zenoh_processor(mock_scan)
+
+        assert provider.angles_final is angles_final
+        data = mock_path_processor.call_args.args[0]
+        np.testing.assert_allclose(data[:, 0], [270.0, 180.0, 90.0])
+        np.testing.assert_allclose(data[:, 1], [1.0, 2.0, 3.0])
+
+    def test_listen_scan_reads_ranges_as_array(self, mock_rplidar_dependencies):
+        """Test a CDR scan payload is decoded with the ranges as a NumPy array."""
+        provider = TurtleBot4RPLidarProvider()
+
+        scan = make_laser_scan()
+        mock_sample = MagicMock()
+        mock_sample.payload.to_bytes.return_value = scan.serialize()
+
+        with patch.object(provider, "_zenoh_processor") as mock_processor:
+            provider.listen_scan(mock_sample)
+
+        decoded = mock_processor.call_args.args[0]
+        assert isinstance(decoded.ranges, np.ndarray)
+        assert decoded.ranges.tolist() == [1.0, 2.5, 0.25]
+        assert decoded.intensities.tolist() == [7.0, 8.0]
+        assert decoded.header.frame_id == "laser"
+        assert decoded.angle_increment == 0.5
+
+    def test_path_processor_appends_d435_obstacles(self, mock_rplidar_dependencies):
+        """Test D435 obstacle rows are stacked onto the lidar points."""
+        mocks = mock_rplidar_dependencies
+        mocks["d435_instance"].running = True
+        mocks["d435_instance"].obstacle = np.tile([2.0, 2.0, 45.0, 2.83], (60, 1))
+        provider = TurtleBot4RPLidarProvider()
+
+        provider._path_processor(np.array([[180.0, 0.5]]))
+
+        scan = provider.raw_scan
+        assert scan is not None
+        assert scan.shape == (61, 4)
+        np.testing.assert_allclose(scan[-1], [2.0, 2.0, 45.0, 2.83])
+
+    def test_path_processor_drops_blanked_angles(self, mock_rplidar_dependencies):
+        """Test beams inside a blanked angle range are ignored."""
+        provider = TurtleBot4RPLidarProvider(angles_blanked=[[-5.0, 5.0]])
+
+        provider._path_processor(np.array([[0.0, 0.5], [180.0, 0.5]]))
+
+        scan = provider.raw_scan
+        assert scan is not None
+        np.testing.assert_allclose(scan[:, 2], [-180.0])
+        assert provider.valid_paths == [4]
+
+    def test_path_processor_matches_segment_distance(self, mock_rplidar_dependencies):
+        """Test path 4 is blocked exactly when a point is within half a robot width."""
+        provider = TurtleBot4RPLidarProvider()
+        start_x, start_y = provider.paths[4][0][0], provider.paths[4][1][0]
+        end_x, end_y = provider.paths[4][0][-1], provider.paths[4][1][-1]
+
+        rng = np.random.default_rng(0)
+        outcomes = set()
+        for _ in range(50):
+            scan_data = np.column_stack(
+                [rng.uniform(0.0, 360.0, 3), rng.uniform(0.2, 1.0, 3)]
+            )
+            provider._path_processor(scan_data)
+
+            blocked = any(
+                provider.distance_point_to_line_segment(
+                    x, y, start_x, start_y, end_x, end_y
+                )
+                < provider.half_width_robot
+                for x, y in provider.raw_scan[:, :2]
+            )
+            assert provider.valid_paths == ([] if blocked else [4])
+            outcomes.add(blocked)
+
+        assert outcomes == {True, False}
+
+    def test_listen_scan_reads_payload_in_place(self, mock_rplidar_dependencies):
+        """Test the scan is decoded from a view when Zenoh exports the buffer."""
+        provider = TurtleBot4RPLidarProvider()
+
+        scan = make_laser_scan()
+        mock_sample = MagicMock()
+        mock_sample.payload = bytearray(scan.serialize())
+
+        with (
+            patch("zenoh_msgs.session._ZBYTES_EXPORTS_BUFFER", True),
+            patch.object(provider, "_zenoh_processor") as mock_processor,
+        ):
+            provider.listen_scan(mock_sample)
+
+        decoded = mock_processor.call_args.args[0]
+        assert decoded.ranges.tolist() == [1.0, 2.5, 0.25]
+        assert decoded.header.frame_id == "laser"
@@ -1,8 +1,13 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from providers.unitree_g1_odom_provider import UnitreeG1OdomProvider
+from providers.odom_provider_base import RobotState
+from providers.unitree_g1_odom_provider import (
+    UnitreeG1OdomProvider,
+    g1_odom_processor,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -81,6 +86,54 @@ class TestUnitreeG1OdomProvider:
 
         assert provider.channel is None
 
+    def test_ring_wakes_across_processes(self, mock_multiprocessing):
+        """Test the G1 provider reads a ring that another process can wake."""
+        provider = UnitreeG1OdomProvider(channel="test_channel")
+
+        assert provider.data_ring._cross_process is True
+        assert provider.data_ring._wakeup is not None
+
+    def test_sport_mode_state_reaches_position_through_ring(self, mock_multiprocessing):
+        """Test a SportModeState sample flows through the ring into the pose."""
+        provider = UnitreeG1OdomProvider(channel="test_channel")
+
+        sport_data = SimpleNamespace(
+            stamp=SimpleNamespace(sec=10, nanosec=500_000_000),
+            position=[1.0, 2.0, 0.75],
+            imu_state=SimpleNamespace(rpy=[0.1, 0.2, -0.5]),
+        )
+
+        with (
+            patch(
+                "providers.unitree_g1_odom_provider.ChannelFactoryInitialize",
+                create=True,
+            ),
+            patch(
+                "providers.unitree_g1_odom_provider.ChannelSubscriber",
+                create=True,
+            ) as mock_subscriber,
+            patch(
+                "providers.unitree_g1_odom_provider.SportModeState_",
+                create=True,
+            ),
+            patch("providers.unitree_g1_odom_provider.wait_for_sigterm"),
+        ):
+            g1_odom_processor("test_channel", provider.data_ring)
+            handler = mock_subscriber.return_value.Init.call_args.args[0]
+            handler(sport_data)
+
+        provider._stop_event.is_set.return_value = False  # type: ignore
+        provider.data_ring.close()
+        provider.process_odom()
+
+        assert provider.x == 1.0
+        assert provider.y == 2.0
+        assert provider.z == 0.75
+        assert provider.odom_rockchip_ts == 10.5
+        assert provider.odom_yaw_m180_p180 == round(-0.5 * 57.2958, 4)
+        assert provider.odom_yaw_0_360 == round(0.5 * 57.2958, 4)
+        assert provider.body_attitude == RobotState.STANDING
+
     def test_singleton_pattern(self, mock_multiprocessing):
         """Test that UnitreeG1OdomProvider follows singleton pattern."""
         provider1 = UnitreeG1OdomProvider(channel="channel_1")
@@ -184,7 +237,7 @@ class TestUnitreeG1OdomProvider:
         provider = UnitreeG1OdomProvider(channel="test_channel")
 
         # Check base class attributes are initialized
-        assert hasattr(provider, "data_queue")
+        assert hasattr(provider, "data_ring")
         assert hasattr(provider, "_odom_reader_thread")
         assert hasattr(provider, "_odom_processor_thread")
         assert hasattr(provider, "_stop_event")
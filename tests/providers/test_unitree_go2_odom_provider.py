@@ -44,6 +44,12 @@ def test_initialization_with_channel(mock_multiprocessing):
     assert provider.channel == "test"
 
 
+def test_ring_wakes_across_processes(mock_multiprocessing):
+    provider = UnitreeGo2OdomProvider(channel="test")
+    assert provider.data_ring._cross_process is True
+    assert provider.data_ring._wakeup is not None
+
+
 def test_singleton_pattern(mock_multiprocessing):
     provider1 = UnitreeGo2OdomProvider(channel="test")
     provider2 = UnitreeGo2OdomProvider(channel="test2")
@@ -100,27 +106,21 @@ def test_position_property_defaults(mock_multiprocessing):
 
 def test_update_body_state_standing(mock_multiprocessing):
     provider = UnitreeGo2OdomProvider(channel="test")
-    mock_pose = MagicMock()
-    mock_pose.position.z = 0.25  # 25 cm
-    provider._update_body_state(mock_pose)
+    provider._update_body_state(0.25)  # 25 cm
     assert provider.body_height_cm == 25
     assert provider.body_attitude == RobotState.STANDING
 
 
 def test_update_body_state_sitting(mock_multiprocessing):
     provider = UnitreeGo2OdomProvider(channel="test")
-    mock_pose = MagicMock()
-    mock_pose.position.z = 0.15  # 15 cm
-    provider._update_body_state(mock_pose)
+    provider._update_body_state(0.15)  # 15 cm
     assert provider.body_height_cm == 15
     assert provider.body_attitude == RobotState.SITTING
 
 
 def test_update_body_state_lying_down(mock_multiprocessing):
     provider = UnitreeGo2OdomProvider(channel="test")
-    mock_pose = MagicMock()
-    mock_pose.position.z = 0.02  # 2 cm
-    provider._update_body_state(mock_pose)
+    provider._update_body_state(0.02)  # 2 cm
     assert provider.body_height_cm == 2
 
 
@@ -222,3 +222,70 @@ def test_log_file_initialization(mock_rplidar_dependencies):
         assert provider.write_to_local_file is True
         assert provider.filename_current == "dump/lidar_1234567890_123456Z.jsonl"
         mock_time.assert_called()
+
+
+def test_path_processor_removes_first_alive_path_per_point(
+    mock_rplidar_dependencies,
+):
+    """Test the vectorized path check matches the per-point scalar search."""
+    mocks = mock_rplidar_dependencies
+    mocks["d435_instance"].running = False
+    mocks["d435_instance"].obstacle = []
+
+    provider = UnitreeGo2RPLidarProvider(relevant_distance_max=1.1)
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        scan_data = np.column_stack(
+            [rng.uniform(0.0, 360.0, 8), rng.uniform(0.2, 1.0, 8)]
+        )
+        provider._path_processor(scan_data)
+
+        expected = list(range(10))
+        for x, y in provider._raw_scan[:, :2]:
+            for apath in expected:
+                if apath == 9 and y >= 0:
+                    continue
+                sx, sy, ex, ey = provider._path_segments[apath]
+                dist = provider.distance_point_to_line_segment(x, y, sx, sy, ex, ey)
+                if dist < provider.half_width_robot:
+                    expected.remove(apath)
+                    break
+
+        assert provider._valid_paths == expected
+
+
+def test_path_processor_converts_beams_to_robot_frame(mock_rplidar_dependencies):
+    """Test kept beams become x, y, angle and distance rows in angle order."""
+    mocks = mock_rplidar_dependencies
+    mocks["d435_instance"].running = False
+    mocks["d435_instance"].obstacle = []
+
+    provider = UnitreeGo2RPLidarProvider(
+        sensor_mounting_angle=180.0,
+        relevant_distance_max=1.1,
+        relevant_distance_min=0.08,
+    )
+
+    # straight ahead, to the side, and one beam too far away to matter
+    provider._path_processor(np.array([[0.0, 0.5], [270.0, 0.4], [90.0, 2.0]]))
+
+    np.testing.assert_allclose(
+        provider._raw_scan,
+        [[-0.4, 0.0, -90.0, 0.4], [0.0, 0.5, 0.0, 0.5]],
+        atol=1e-12,
+    )
+
+
+def test_path_processor_handles_empty_scan(mock_rplidar_dependencies):
+    """Test an empty scan leaves every path open."""
+    mocks = mock_rplidar_dependencies
+    mocks["d435_instance"].running = False
+    mocks["d435_instance"].obstacle = []
+
+    provider = UnitreeGo2RPLidarProvider()
+
+    provider._path_processor(np.empty((0, 2)))
+
+    assert provider._raw_scan.size == 0
+    assert provider._valid_paths == list(range(10))
@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from zenoh_msgs import session
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_session(monkeypatch):
+    """Start every test without a shared session or a failed local router."""
+    monkeypatch.setattr(session, "_shared_session", None)
+    monkeypatch.setattr(session, "_local_router_failed_at", None)
+
+
+def test_shared_session_is_opened_once():
+    """Test providers get the same session back."""
+    mock_session = MagicMock()
+    mock_session.is_closed.return_value = False
+
+    with patch.object(
+        session, "open_zenoh_session", return_value=mock_session
+    ) as mock_open:
+        first = session.shared_zenoh_session()
+        second = session.shared_zenoh_session()
+
+    assert first is mock_session
+    assert second is mock_session
+    mock_open.assert_called_once()
+
+
+def test_shared_session_is_reopened_after_close():
+    """Test a closed shared session is replaced by a new one."""
+    closed_session = MagicMock()
+    closed_session.is_closed.return_value = True
+    new_session = MagicMock()
+
+    with patch.object(
+        session, "open_zenoh_session", side_effect=[closed_session, new_session]
+    ):
+        session.shared_zenoh_session()
+        reopened = session.shared_zenoh_session()
+
+    assert reopened is new_session
+
+
+def test_shared_session_open_failure_is_retried():
+    """Test a failed open is not cached."""
+    mock_session = MagicMock()
+    mock_session.is_closed.return_value = False
+
+    with patch.object(
+        session,
+        "open_zenoh_session",
+        side_effect=[Exception("Failed to open Zenoh session"), mock_session],
+    ):
+        with pytest.raises(Exception, match="Failed to open Zenoh session"):
+            session.shared_zenoh_session()
+
+        assert session.shared_zenoh_session() is mock_session
+
+
+def test_local_router_is_tried_first():
+    """Test a reachable local router is used without network discovery."""
+    local_session = MagicMock()
+
+    with (
+        patch.object(session, "create_zenoh_config") as mock_config,
+        patch.object(session.zenoh, "open", return_value=local_session) as mock_open,
+    ):
+        assert session.open_zenoh_session() is local_session
+        assert session.open_zenoh_session() is local_session
+
+    assert mock_open.call_count == 2
+    for call in mock_config.call_args_list:
+        assert call.kwargs == {"network_discovery": False}
+
+
+def test_unreachable_local_router_is_skipped_afterwards():
+    """Test network discovery is used directly once the local router failed."""
+    network_session = MagicMock()
+
+    with (
+        patch.object(session, "create_zenoh_config") as mock_config,
+        patch.object(
+            session.zenoh,
+            "open",
+            side_effect=[Exception("no router"), network_session, network_session],
+        ) as mock_open,
+    ):
+        assert session.open_zenoh_session() is network_session
+        assert session.open_zenoh_session() is network_session
+
+    assert mock_open.call_count == 3
+    assert [call.kwargs for call in mock_config.call_args_list] == [
+        {"network_discovery": False},
+        {},
+        {},
+    ]
+
+
+def test_unreachable_local_router_is_retried_later():
+    """Test the local router is tried again once the retry interval passed."""
+    network_session = MagicMock()
+    local_session = MagicMock()
+    interval = session._LOCAL_ROUTER_RETRY_INTERVAL
+
+    with (
+        patch.object(session, "create_zenoh_config") as mock_config,
+        patch.object(
+            session.zenoh,
+            "open",
+            side_effect=[Exception("no router"), network_session, local_session],
+        ),
+        patch.object(session.time, "monotonic", side_effect=[100.0, 100.0 + interval]),
+    ):
+        assert session.open_zenoh_session() is network_session
+        assert session.open_zenoh_session() is local_session
+
+    assert [call.kwargs for call in mock_config.call_args_list] == [
+        {"network_discovery": False},
+        {},
+        {"network_discovery": False},
+    ]
+    assert session._local_router_failed_at is None